@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+
+
+class LinkedListDB:
+    """
+    Doubly linked list of int ids(e.g. transaction id) stored in the state DB.
+    Appending an id, removing an id and checking if an id is included cost constant storage access.
+    Each id can be included in the list only once.
+    """
+
+    def __init__(self, var_key: str, db: IconScoreDatabase):
+        self._head = VarDB(f"{var_key}_head", db, value_type=int)
+        self._tail = VarDB(f"{var_key}_tail", db, value_type=int)
+        self._length = VarDB(f"{var_key}_length", db, value_type=int)
+        # _next's key: id(int type), value: id of the next node. the tail doesn't have a key
+        self._next = DictDB(f"{var_key}_next", db, value_type=int)
+        # _prev's key: id(int type), value: id of the previous node. the head doesn't have a key
+        self._prev = DictDB(f"{var_key}_prev", db, value_type=int)
+
+    def __len__(self) -> int:
+        return self._length.get()
+
+    def __contains__(self, node_id: int) -> bool:
+        if node_id in self._prev:
+            return True
+        return len(self) > 0 and self._head.get() == node_id
+
+    def head(self) -> int:
+        # returns None if the list is empty
+        return self._head.get() if len(self) > 0 else None
+
+    def tail(self) -> int:
+        # returns None if the list is empty
+        return self._tail.get() if len(self) > 0 else None
+
+    def next(self, node_id: int) -> int:
+        # returns None if node_id is the tail
+        return self._next[node_id] if node_id in self._next else None
+
+    def prev(self, node_id: int) -> int:
+        # returns None if node_id is the head
+        return self._prev[node_id] if node_id in self._prev else None
+
+    def append(self, node_id: int):
+        # appending the included id again would break the links
+        if node_id in self:
+            revert(f"{node_id} is already included in the list")
+
+        length = len(self)
+        if length == 0:
+            self._head.set(node_id)
+        else:
+            tail_id = self._tail.get()
+            self._next[tail_id] = node_id
+            self._prev[node_id] = tail_id
+        self._tail.set(node_id)
+        self._length.set(length + 1)
+
+    def remove(self, node_id: int):
+        # removing the id which is not included would break the links and the length
+        prev_id = self.prev(node_id)
+        if prev_id is None and self.head() != node_id:
+            revert(f"{node_id} is not included in the list")
+        next_id = self.next(node_id)
+
+        if prev_id is None:
+            if next_id is not None:
+                self._head.set(next_id)
+        else:
+            self._prev.remove(node_id)
+            if next_id is None:
+                self._next.remove(prev_id)
+            else:
+                self._next[prev_id] = next_id
+
+        if next_id is None:
+            if prev_id is not None:
+                self._tail.set(prev_id)
+        else:
+            self._next.remove(node_id)
+            if prev_id is None:
+                self._prev.remove(next_id)
+            else:
+                self._prev[next_id] = prev_id
+
+        self._length.set(len(self) - 1)
+
+    def get_range(self, offset: int, count: int) -> list:
+        # walk from the head, so the cost is proportional to offset + count
+        node_ids = []
+        node_id = self.head()
+        for _ in range(offset):
+            if node_id is None:
+                return node_ids
+            node_id = self.next(node_id)
+
+        while node_id is not None and len(node_ids) < count:
+            node_ids.append(node_id)
+            node_id = self.next(node_id)
+        return node_ids
+
+    def get_range_from(self, node_id: int, count: int, reverse: bool = False) -> list:
+        # walk from node_id(included) toward the tail, or toward the head if reverse is True.
+        # the cost is proportional to count. before call this method, check if node_id is included in the list
+        node_ids = []
+        while node_id is not None and len(node_ids) < count:
+            node_ids.append(node_id)
+            node_id = self.prev(node_id) if reverse else self.next(node_id)
+        return node_ids
+
+
+class RankedLinkedListDB(LinkedListDB):
+    """
+    LinkedListDB of ids appended in increasing order(e.g. transaction ids in the order of submission),
+    which finds the id at an offset without walking the list from the head.
+    The included ids are counted per bucket of _BUCKET_SIZE ** level consecutive ids for each level,
+    so appending or removing an id writes _LEVEL_COUNT more entries, and finding the id at an offset reads
+    at most _BUCKET_SIZE entries per level plus one entry per _BUCKET_SIZE ** _LEVEL_COUNT ids.
+    """
+
+    _BUCKET_SIZE = 32
+    _LEVEL_COUNT = 3
+
+    def __init__(self, var_key: str, db: IconScoreDatabase):
+        super().__init__(var_key, db)
+        # _counts' key: level, bucket(id // _BUCKET_SIZE ** level), value: the number of included ids in the bucket
+        self._counts = DictDB(f"{var_key}_counts", db, value_type=int, depth=2)
+
+    def append(self, node_id: int):
+        # the order of ids must be the order of the list to find the id at an offset by the counts
+        tail_id = self.tail()
+        if tail_id is not None and node_id <= tail_id:
+            revert(f"{node_id} must be greater than the tail of the list")
+
+        super().append(node_id)
+        self._update_counts(node_id, 1)
+
+    def remove(self, node_id: int):
+        super().remove(node_id)
+        self._update_counts(node_id, -1)
+
+    def _update_counts(self, node_id: int, delta: int):
+        for level in range(1, self._LEVEL_COUNT + 1):
+            bucket = node_id // self._BUCKET_SIZE ** level
+            self._counts[level][bucket] += delta
+
+    def get_range(self, offset: int, count: int) -> list:
+        # find the id at the offset by skipping the buckets before it from the top level, then walk from the id
+        if offset >= len(self):
+            return []
+
+        bucket = 0
+        for level in range(self._LEVEL_COUNT, 0, -1):
+            bucket_count = self._counts[level][bucket]
+            while offset >= bucket_count:
+                offset -= bucket_count
+                bucket += 1
+                bucket_count = self._counts[level][bucket]
+            # the first bucket of the lower level(or the first id) in this bucket
+            bucket *= self._BUCKET_SIZE
+
+        node_id = bucket
+        while True:
+            if node_id in self:
+                if offset == 0:
+                    break
+                offset -= 1
+            node_id += 1
+        return self.get_range_from(node_id, count)
@@ -14,19 +14,38 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .type_converter.type_converter import params_type_converter
+from .type_converter.type_converter import params_type_converter, convert_params, validate_params, \
+    typed_params_to_kwargs, encode_typed_params, decode_typed_params, is_invalid_params_error
 from .qualification_check.qualification_check import *
-from .transaction import Transaction
+from .linked_list.linked_list import LinkedListDB, RankedLinkedListDB
+from .wallet_owner_snapshot.wallet_owner_snapshot import WalletOwnerSnapshot, encode_owner_index_history
+from .transaction import Transaction, TRANSACTION_STATUS_EXECUTED, MAX_MULTI_CALL_PARAMS_LEN, MAX_MULTI_CALL_COUNT, \
+    encode_multi_call, decode_multi_call
 
 
 class MultiSigWallet(IconScoreBase):
     _MAX_WALLET_OWNER_COUNT = 50
     _MAX_DATA_REQUEST_AMOUNT = 50
+    _MAX_TRANSACTION_INFO_REQUEST_AMOUNT = 200
+    _MAX_AWAITING_TRANSACTION_SCAN_AMOUNT = 200
+    _MAX_BATCH_TRANSACTION_AMOUNT = 100
+    _OWNER_EPOCH_BITS = 32
+    _MULTI_CALL_METHOD = "executeMultiCall"
+    # signature hash's layout(see _get_signature_hash)
+    _SIGNATURE_DOMAIN = b"multisig_wallet_signature"
+    _SIGNATURE_NETWORK_ID_BYTES = 4
+    _SIGNATURE_INT_BYTES = 32
+    _SIGNATURE_FIELD_LENGTH_BYTES = 2
+    _MAINNET_NETWORK_ID = 1
 
     @eventlog(indexed=2)
     def Confirmation(self, _sender: Address, _transactionId: int):
         pass
 
+    @eventlog(indexed=2)
+    def ConfirmationFailure(self, _sender: Address, _transactionId: int, _reason: str):
+        pass
+
     @eventlog(indexed=2)
     def Revocation(self, _sender: Address, _transactionId: int):
         pass
@@ -43,6 +62,14 @@ class MultiSigWallet(IconScoreBase):
     def ExecutionFailure(self, _transactionId: int):
         pass
 
+    @eventlog(indexed=1)
+    def ExecutionDeferral(self, _transactionId: int):
+        pass
+
+    @eventlog(indexed=1)
+    def ExecutionCancellation(self, _transactionId: int):
+        pass
+
     @eventlog(indexed=1)
     def Deposit(self, _sender: Address, _value: int):
         pass
@@ -63,19 +90,71 @@ class MultiSigWallet(IconScoreBase):
     def RequirementChange(self, _required: int):
         pass
 
+    @eventlog
+    def DeferredExecutionChange(self, _deferredExecution: bool):
+        pass
+
     def __init__(self, db: IconScoreDatabase) -> None:
         super().__init__(db)
         # store transaction instance as a serialized bytes
         # _transactions's key: transaction id(int type)
         self._transactions = DictDB("transactions", db, value_type=bytes)
-        # store wallet owners' confirmations of each transaction
-        # _confirmations's key: transaction id(int type), address(Address type)
+        # store status of each transaction(e.g. executed) apart from the transaction,
+        # so that the transaction is written only once when it is submitted
+        # _transaction_status's key: transaction id(int type)
+        self._transaction_status = DictDB("transaction_status", db, value_type=int)
+        # store how many times the execution of each transaction has failed and the block height of the last failure
+        # _execution_failure_count's, _last_execution_failure_height's key: transaction id(int type)
+        self._execution_failure_count = DictDB("execution_failure_count", db, value_type=int)
+        self._last_execution_failure_height = DictDB("last_execution_failure_height", db, value_type=int)
         self._wallet_owners = ArrayDB("wallet_owners", db, value_type=Address)
+        # store the index of each wallet owner in _wallet_owners
+        # _wallet_owner_index's key: address(Address type)
+        self._wallet_owner_index = DictDB("wallet_owner_index", db, value_type=int)
+        # store wallet owners' confirmations of each transaction as a bitmask.
+        # n-th bit is set if the wallet owner of which index in _wallet_owners is n has confirmed.
+        # the owner epoch when the mask is written is stored together in the lower _OWNER_EPOCH_BITS bits
+        # _confirmation_masks's key: transaction id(int type)
+        self._confirmation_masks = DictDB("confirmation_masks", db, value_type=int)
+        # increased whenever a wallet owner is removed or replaced
+        self._owner_epoch = VarDB("owner_epoch", db, value_type=int)
+        # store the indexes each wallet owner has had in _wallet_owners and the owner epochs they were changed at,
+        # so that the confirmation masks written before can be remapped when they are read.
+        # they are stored together, as the wallet owners moved or added after an owner change are only a few
+        # (see encode_owner_index_history)
+        self._owner_index_history = VarDB("owner_index_history", db, value_type=bytes)
+        # legacy storage of wallet owners' confirmations, only read for transactions without a confirmation mask
+        # _confirmations's key: transaction id(int type), address(Address type)
         self._confirmations = DictDB("confirmations", db, value_type=bool, depth=2)
         self._required = VarDB("required", db, value_type=int)
+        # if True, confirmed transactions are queued in _ready_transactions instead of being executed immediately
+        self._deferred_execution = VarDB("deferred_execution", db, value_type=bool)
         self._transaction_count = VarDB('transactionCount', db, value_type=int)
-
-    def on_install(self, _walletOwners: str, _required: int) -> None:
+        # increased whenever the state is changed, so that clients can check if their cached data is outdated
+        self._state_version = VarDB("state_version", db, value_type=int)
+        # included in the hash signed by the wallet owners(see _get_signature_hash) to prevent replaying the signatures
+        self._signature_nonce = VarDB("signature_nonce", db, value_type=int)
+        # network id of the chain which the wallet is deployed on. as SCOREs can't get it from the transaction,
+        # it is given when the wallet is deployed. included in the signature hash to prevent replaying the signatures
+        # on other networks
+        self._network_id = VarDB("network_id", db, value_type=int)
+        # store ids of pending transactions in the order of submission
+        self._pending_transactions = RankedLinkedListDB("pending_transactions", db)
+        # store ids of executed transactions in the order of execution. as executed transactions are never removed,
+        # an array is enough to get them by the offset, and the position of each is stored to get them by the id
+        # _executed_transaction_position's key: transaction id(int type)
+        self._executed_transactions = ArrayDB("executed_transactions", db, value_type=int)
+        self._executed_transaction_position = DictDB("executed_transaction_position", db, value_type=int)
+        # store ids of confirmed transactions waiting to be executed by executeReady in the order of confirmation
+        self._ready_transactions = LinkedListDB("ready_transactions", db)
+        # wallet owners and requirement loaded during the current external call(see _get_wallet_owner_snapshot)
+        self._wallet_owner_snapshot = None
+        self._wallet_owner_snapshot_msg = None
+        # transaction which has increased the state version(see _increase_state_version)
+        self._state_version_tx = None
+
+    def on_install(self, _walletOwners: str, _required: int, _deferredExecution: bool = False,
+                   _networkId: int = _MAINNET_NETWORK_ID) -> None:
         super().on_install()
 
         wallet_owner_list = _walletOwners.replace(" ", "").split(",")
@@ -83,30 +162,69 @@ class MultiSigWallet(IconScoreBase):
 
         for wallet_owner in wallet_owner_list:
             wallet_owner_address = Address.from_string(wallet_owner)
-            self._wallet_owners.put(wallet_owner_address)
+            self._put_wallet_owner(wallet_owner_address)
 
         self._required.set(_required)
+        self._deferred_execution.set(_deferredExecution)
+        self._network_id.set(_networkId)
         self._transaction_count.set(0)
 
-    def on_update(self) -> None:
+    def on_update(self, _networkId: int = _MAINNET_NETWORK_ID) -> None:
         super().on_update()
 
+        # each migration writes only the data which is not migrated yet, so updating the wallet again doesn't write.
+        # the first update after the wallet was deployed with the legacy version writes a few entries
+        # per wallet owner and per transaction(see "Update" in README.md)
+        # wallets deployed before the network id was introduced don't have it
+        if self._network_id.get() == 0:
+            self._network_id.set(_networkId)
+        self._migrate_wallet_owner_index()
+        self._migrate_transaction_indexes()
+
+    def _migrate_wallet_owner_index(self):
+        # wallets deployed before the owner index was introduced don't have it, so build it from the owner list
+        for idx, wallet_owner in enumerate(self._wallet_owners):
+            if wallet_owner not in self._wallet_owner_index:
+                self._wallet_owner_index[wallet_owner] = idx
+
+    def _migrate_transaction_indexes(self):
+        # wallets deployed before the pending/executed transaction indexes were introduced don't have them.
+        # every transaction is included in exactly one of them, so index only the transactions not included yet.
+        # those transactions store their executed flag in the transaction itself, so move it to _transaction_status
+        indexed_count = len(self._pending_transactions) + len(self._executed_transactions)
+        for transaction_id in range(indexed_count, self._transaction_count.get()):
+            if Transaction.from_bytes(self._transactions[transaction_id]).executed:
+                self._transaction_status[transaction_id] = TRANSACTION_STATUS_EXECUTED
+                self._put_executed_transaction(transaction_id)
+            else:
+                self._pending_transactions.append(transaction_id)
+                # legacy confirmations are stored by address, so a wallet owner removed and added again later would
+                # get the confirmation back. store them as a confirmation mask which is remapped by the owner epoch
+                self._set_confirmation_mask(transaction_id, self._get_confirmation_mask(transaction_id))
+
     @staticmethod
-    def _check_params_format_convertible(json_formatted_params: str):
+    def _convert_params(json_formatted_params: str, params: list = None) -> list:
+        # returns a list of (name, type, converted value) which is stored with the transaction,
+        # so that executing transaction doesn't need to parse and convert 'params' again.
+        # params: 'params' parsed already(e.g. '_params' of submitTransactions given as a json array), if any.
         # when user input None as a _params' value,
         # this will be changed to "" when creating Transaction instance.
         # "" will be changed to {} when finally execute transaction. so doesn't check format
-        if json_formatted_params != "" and json_formatted_params is not None:
+        if json_formatted_params == "" or json_formatted_params is None:
+            return []
+
+        if params is None:
             try:
                 params = json_loads(json_formatted_params)
-                for param in params:
-                    params_type_converter(param["type"], param["value"])
             except ValueError:
                 revert("json decode error")
-            except IconScoreException as e:
-                raise e
-            except:
-                revert("can not convert 'params' json data, check the 'params' parameter")
+
+        if not isinstance(params, list):
+            revert("'params' should be a json array")
+        typed_params, errors = validate_params(params)
+        if errors:
+            revert(f"invalid 'params': {'; '.join(errors)}")
+        return typed_params
 
     @staticmethod
     def _only_positive_number(*args):
@@ -114,12 +232,28 @@ class MultiSigWallet(IconScoreBase):
             if number < 0:
                 revert("only positive number is accepted")
 
+    def _get_wallet_owner_snapshot(self) -> WalletOwnerSnapshot:
+        # a SCORE instance can be reused by following calls, so the snapshot is only valid
+        # during the external call(message) which has loaded it
+        if self._wallet_owner_snapshot is None or self._wallet_owner_snapshot_msg is not self.msg:
+            self._wallet_owner_snapshot = WalletOwnerSnapshot(self._wallet_owners,
+                                                              self._wallet_owner_index,
+                                                              self._required,
+                                                              self._owner_epoch,
+                                                              self._owner_index_history)
+            self._wallet_owner_snapshot_msg = self.msg
+        return self._wallet_owner_snapshot
+
+    def _discard_wallet_owner_snapshot(self):
+        # must be called after changing the wallet owners or the requirement
+        self._wallet_owner_snapshot = None
+
     def _wallet_owner_does_not_exist(self, wallet_owner: Address):
-        if wallet_owner in self._wallet_owners:
+        if self._get_wallet_owner_snapshot().contains(wallet_owner):
             revert(f"{wallet_owner} already exists as an owner of the wallet")
 
     def _wallet_owner_exist(self, wallet_owner: Address):
-        if wallet_owner not in self._wallet_owners:
+        if not self._get_wallet_owner_snapshot().contains(wallet_owner):
             revert(f"{wallet_owner} is not an owner of wallet")
 
     def _transaction_exists(self, transaction_id: int):
@@ -128,18 +262,22 @@ class MultiSigWallet(IconScoreBase):
             revert(f"transaction id '{transaction_id}' is not exist")
 
     def _confirmed(self, transaction_id: int, wallet_owner: Address):
-        if not self._confirmations[transaction_id][wallet_owner]:
+        if not self._get_confirmation_mask(transaction_id) & self._get_wallet_owner_bit(wallet_owner):
             revert(f"{wallet_owner} has not confirmed to the transaction id '{transaction_id}' yet")
 
     def _not_confirmed(self, transaction_id: int, wallet_owner: Address):
-        if self._confirmations[transaction_id][wallet_owner]:
+        if self._get_confirmation_mask(transaction_id) & self._get_wallet_owner_bit(wallet_owner):
             revert(f"{wallet_owner} has already confirmed to the transaction '{transaction_id}'")
 
     def _not_executed(self, transaction_id: int):
         # before call this method, check if transaction is exists(use transaction_exists method)
-        if self._transactions[transaction_id][0] == 1:
+        if self._transaction_status[transaction_id] == TRANSACTION_STATUS_EXECUTED:
             revert(f"transaction id '{transaction_id}' has already been executed")
 
+    def _fully_confirmed(self, transaction_id: int):
+        if not self._meets_requirement(transaction_id):
+            revert(f"transaction id '{transaction_id}' has not been fully confirmed yet")
+
     def _check_requirement(self, wallet_owner_count: int, required: int):
         if wallet_owner_count > self._MAX_WALLET_OWNER_COUNT or \
                 required > wallet_owner_count or \
@@ -161,26 +299,148 @@ class MultiSigWallet(IconScoreBase):
     def submitTransaction(self, _destination: Address,
                           _method: str = "", _params: str = "", _value: int = 0, _description: str = ""):
         self._wallet_owner_exist(self.msg.sender)
-        # prevent failure of executing transaction caused by 'params' conversion problems
-        self._check_params_format_convertible(_params)
-        self._only_positive_number(_value)
+        transaction = self._create_transaction(_destination, _method, _params, _value, _description)
 
         # add transaction
-        transaction_id = self._add_transaction(_destination, _method, _params, _value, _description)
+        transaction_id = self._add_transaction(transaction)
         # confirm_transaction
         self.confirmTransaction(transaction_id)
 
+    @external
+    def submitTransactions(self, _transactions: str):
+        # _transactions: json formatted list of transactions. each transaction has the parameters of
+        # submitTransaction as keys(e.g. '[{"_destination": "hx...", "_value": "0x1", "_description": "payroll"}]').
+        # every transaction is validated before any of them is added, and they get consecutive ids
+        self._wallet_owner_exist(self.msg.sender)
+        transactions = self._create_transactions_from_json(_transactions, self._MAX_BATCH_TRANSACTION_AMOUNT)
+
+        transaction_ids = [self._add_transaction(transaction) for transaction in transactions]
+        for transaction_id in transaction_ids:
+            self.confirmTransaction(transaction_id)
+
+    @external
+    def submitTransactionWithSignatures(self, _destination: Address, _signatures: str,
+                                        _method: str = "", _params: str = "", _value: int = 0, _description: str = ""):
+        # _signatures: comma separated signatures of the wallet owners over the signature hash of the transaction
+        # (see getSignatureHash). each signature is 65 bytes(signature(64) + recovery id(1)).
+        # the transaction is submitted and confirmed by the signers in one transaction, and executed if
+        # the confirmations meet the requirement. as the signatures authorize it, anyone can call this method
+        transaction = self._create_transaction(_destination, _method, _params, _value, _description)
+
+        signature_nonce = self._signature_nonce.get()
+        signers = self._recover_signers(self._get_signature_hash(transaction, signature_nonce), _signatures)
+        self._signature_nonce.set(signature_nonce + 1)
+
+        transaction_id = self._add_transaction(transaction)
+        for signer in signers:
+            self._confirm_transaction(transaction_id, signer)
+
+    @external
+    def submitMultiCallTransaction(self, _calls: str, _description: str = ""):
+        # _calls: json formatted list of calls which are executed in order as one transaction.
+        # each call has the parameters of submitTransaction as keys(same as submitTransactions).
+        # if any of the calls fails, all of them are reverted(see executeMultiCall)
+        self._wallet_owner_exist(self.msg.sender)
+        calls = self._create_transactions_from_json(_calls, MAX_MULTI_CALL_COUNT)
+        if len(calls) == 0:
+            revert("multi-call transaction should have at least one call")
+
+        typed_params = encode_typed_params([("_calls", "bytes", encode_multi_call(calls))])
+        transaction = Transaction.create_transaction_with_validation(destination=self.address,
+                                                                     method=self._MULTI_CALL_METHOD,
+                                                                     params=_calls,
+                                                                     value=0,
+                                                                     description=_description,
+                                                                     typed_params=typed_params,
+                                                                     max_params_len=MAX_MULTI_CALL_PARAMS_LEN)
+        transaction_id = self._add_transaction(transaction)
+        self.confirmTransaction(transaction_id)
+
+    @only_wallet
+    @external
+    def executeMultiCall(self, _calls: bytes):
+        # as this method is called by the wallet itself, reverting it reverts the calls executed before
+        for idx, call in enumerate(decode_multi_call(_calls)):
+            if not self._external_call(call):
+                revert(f"call {idx} of the multi-call transaction failed")
+
     @external
     def confirmTransaction(self, _transactionId: int):
         self._wallet_owner_exist(self.msg.sender)
         self._transaction_exists(_transactionId)
+        self._not_executed(_transactionId)
         self._not_confirmed(_transactionId, self.msg.sender)
 
-        self._confirmations[_transactionId][self.msg.sender] = True
+        self._confirm_transaction(_transactionId, self.msg.sender)
+
+    @external
+    def confirmTransactions(self, _transactionIds: str, _atomic: bool = False):
+        # _transactionIds: comma separated transaction ids(e.g. "0x0,0x1,2")
+        # if _atomic is True, whole confirmations are reverted when any of them can't be confirmed.
+        # otherwise the transaction which can't be confirmed is skipped with ConfirmationFailure event
+        self._wallet_owner_exist(self.msg.sender)
+        transaction_ids = self._parse_transaction_ids(_transactionIds, self._MAX_BATCH_TRANSACTION_AMOUNT)
+
+        for transaction_id in transaction_ids:
+            # checking methods revert before changing any state, so the confirmation can be skipped safely.
+            # executed transaction may have removed the sender from the wallet owners, so check it again
+            try:
+                self._wallet_owner_exist(self.msg.sender)
+                self._transaction_exists(transaction_id)
+                self._not_executed(transaction_id)
+                self._not_confirmed(transaction_id, self.msg.sender)
+            except IconScoreException as e:
+                if _atomic:
+                    raise e
+                self.ConfirmationFailure(self.msg.sender, transaction_id, e.message)
+                continue
+
+            self._confirm_transaction(transaction_id, self.msg.sender)
+
+    def _confirm_transaction(self, transaction_id: int, wallet_owner: Address):
+        # before call this method, check if the wallet owner can confirm the transaction
+        confirmation_mask = self._get_confirmation_mask(transaction_id) | self._get_wallet_owner_bit(wallet_owner)
+        self._set_confirmation_mask(transaction_id, confirmation_mask)
+
+        self._increase_state_version()
+
+        self.Confirmation(wallet_owner, transaction_id)
+
+        self._execute_transaction(transaction_id)
+
+    @external
+    def executeTransaction(self, _transactionId: int):
+        # retry the execution of the transaction which has failed to be executed(e.g. lack of balance)
+        self._wallet_owner_exist(self.msg.sender)
+        self._transaction_exists(_transactionId)
+        self._not_executed(_transactionId)
+        self._fully_confirmed(_transactionId)
+
+        self._call_transaction(_transactionId)
+
+    @external
+    def executeReady(self, _max: int):
+        # execute up to _max transactions queued in deferred execution mode, in the order they were queued.
+        # anyone(e.g. keeper bots) can call this method, as the transactions have been confirmed already
+        self._only_positive_number(_max)
 
-        self.Confirmation(self.msg.sender, _transactionId)
+        if _max > self._MAX_BATCH_TRANSACTION_AMOUNT:
+            revert("requests that exceed the allowed amount")
 
-        self._execute_transaction(_transactionId)
+        for transaction_id in self._ready_transactions.get_range(0, _max):
+            # executed transaction may have executed the queued transactions already
+            if transaction_id not in self._ready_transactions:
+                continue
+
+            # failed transaction is not queued again, and can be retried by executeTransaction
+            self._ready_transactions.remove(transaction_id)
+            self._increase_state_version()
+            # the requirement may have been raised after the transaction was queued. the transaction stays pending,
+            # and is queued again when its confirmations meet the requirement
+            if self._meets_requirement(transaction_id):
+                self._call_transaction(transaction_id)
+            else:
+                self.ExecutionCancellation(transaction_id)
 
     @external
     def revokeTransaction(self, _transactionId: int):
@@ -189,20 +449,130 @@ class MultiSigWallet(IconScoreBase):
         self._not_executed(_transactionId)
         self._confirmed(_transactionId, self.msg.sender)
 
-        self._confirmations[_transactionId][self.msg.sender] = False
+        confirmation_mask = self._get_confirmation_mask(_transactionId) & ~self._get_wallet_owner_bit(self.msg.sender)
+        self._set_confirmation_mask(_transactionId, confirmation_mask)
+        # revoked transaction is queued again when it is confirmed again
+        if _transactionId in self._ready_transactions:
+            self._ready_transactions.remove(_transactionId)
+        self._increase_state_version()
 
         self.Revocation(self.msg.sender, _transactionId)
 
-    def _add_transaction(self, destination: Address, method: str, params: str, value: int, description: str) -> int:
-        transaction = Transaction.create_transaction_with_validation(destination=destination,
-                                                                     method=method,
-                                                                     params=params,
-                                                                     value=value,
-                                                                     description=description)
+    def _create_transaction(self, destination: Address, method: str, params: str, value: int,
+                            description: str, parsed_params: list = None) -> Transaction:
+        # prevent failure of executing transaction caused by 'params' conversion problems
+        typed_params = self._convert_params(params, parsed_params)
+        self._only_positive_number(value)
+
+        return Transaction.create_transaction_with_validation(destination=destination,
+                                                              method=method,
+                                                              params=params,
+                                                              value=value,
+                                                              description=description,
+                                                              typed_params=encode_typed_params(typed_params))
+
+    def _get_signature_hash(self, transaction: Transaction, signature_nonce: int) -> bytes:
+        # the domain, the network id and the wallet address prevent the signatures from being used
+        # for other purposes, networks or wallets. the layout is documented(see getSignatureHash in README.md)
+        # so that the signers can compute the hash by themselves, and doesn't depend on how transactions are stored
+        return sha3_256(self._SIGNATURE_DOMAIN +
+                        self._network_id.get().to_bytes(self._SIGNATURE_NETWORK_ID_BYTES, "big") +
+                        str(self.address).encode() +
+                        signature_nonce.to_bytes(self._SIGNATURE_INT_BYTES, "big") +
+                        str(transaction.destination).encode() +
+                        transaction.value.to_bytes(self._SIGNATURE_INT_BYTES, "big") +
+                        self._encode_signature_field(transaction.method) +
+                        self._encode_signature_field(transaction.params) +
+                        self._encode_signature_field(transaction.description))
+
+    def _encode_signature_field(self, field: str) -> bytes:
+        encoded_field = field.encode()
+        return len(encoded_field).to_bytes(self._SIGNATURE_FIELD_LENGTH_BYTES, "big") + encoded_field
+
+    def _recover_signers(self, signature_hash: bytes, signatures: str) -> list:
+        signers = []
+        for signature in signatures.replace(" ", "").split(","):
+            try:
+                signature = params_type_converter("bytes", signature)
+            except ValueError:
+                revert("invalid signature format")
+
+            public_key = recover_key(signature_hash, signature, compressed=False)
+            signer = create_address_with_key(public_key) if public_key is not None else None
+            if signer is None or not self._get_wallet_owner_snapshot().contains(signer):
+                revert("signature is not signed by a wallet owner")
+            if signer in signers:
+                revert(f"{signer} has signed more than once")
+            signers.append(signer)
+
+        # as the transaction is executed when the confirmation count is equal to the requirement,
+        # more confirmations than the requirement would leave the transaction not executed
+        if len(signers) > self._get_wallet_owner_snapshot().required:
+            revert("signatures exceed the requirement")
+        return signers
+
+    def _create_transactions_from_json(self, json_formatted_transactions: str, max_amount: int) -> list:
+        # every transaction is validated before any of them is added
+        try:
+            transaction_params_list = json_loads(json_formatted_transactions)
+        except ValueError:
+            revert("json decode error")
+
+        if not isinstance(transaction_params_list, list):
+            revert("transactions should be a json array")
+        if len(transaction_params_list) > max_amount:
+            revert("requests that exceed the allowed amount")
+
+        transactions = []
+        for idx, transaction_params in enumerate(transaction_params_list):
+            try:
+                transactions.append(self._create_transaction_from_dict(transaction_params))
+            except IconScoreException as e:
+                revert(f"invalid transaction at index {idx}: {e.message}")
+        return transactions
+
+    def _create_transaction_from_dict(self, transaction_params: dict) -> Transaction:
+        # '_params' can be a json formatted string(same as submitTransaction) or a json array
+        try:
+            destination = Address.from_string(transaction_params["_destination"])
+            # null optional fields take their default values(same as submitTransaction),
+            # e.g. null '_params' means no params, not a json 'null' to be called with
+            method = self._get_optional_field(transaction_params, "_method", "")
+            params = self._get_optional_field(transaction_params, "_params", "")
+            parsed_params = None
+            if not isinstance(params, str):
+                parsed_params = params
+                params = json_dumps(params)
+            value = params_type_converter("int", self._get_optional_field(transaction_params, "_value", 0))
+            description = self._get_optional_field(transaction_params, "_description", "")
+        except IconScoreException as e:
+            raise e
+        except (KeyError, TypeError, ValueError, AttributeError):
+            revert("invalid transaction format")
+        except IconScoreException.__base__ as e:
+            # invalid '_destination'. the other errors(e.g. out of step) are not caught
+            if not is_invalid_params_error(e):
+                raise e
+            revert("invalid transaction format")
+
+        if not isinstance(method, str) or not isinstance(description, str):
+            revert("invalid transaction format")
+
+        return self._create_transaction(destination, method, params, value, description, parsed_params)
+
+    @staticmethod
+    def _get_optional_field(fields: dict, key: str, default):
+        value = fields.get(key)
+        return default if value is None else value
+
+    def _add_transaction(self, transaction: Transaction) -> int:
         transaction_id = self._transaction_count.get()
 
         self._transactions[transaction_id] = transaction.to_bytes()
+        self._set_confirmation_mask(transaction_id, 0)
         self._transaction_count.set(transaction_id + 1)
+        self._pending_transactions.append(transaction_id)
+        self._increase_state_version()
 
         self.Submission(transaction_id)
         return transaction_id
@@ -210,24 +580,51 @@ class MultiSigWallet(IconScoreBase):
     def _execute_transaction(self, transaction_id: int):
         # as this method can't be called from other SCORE or EOA, doesn't check owner, transactions_id, confirmations.
         if self._is_confirmed(transaction_id):
-            if self._external_call(self._transactions[transaction_id]):
-                self._transactions[transaction_id] = True.to_bytes(1, "big") + self._transactions[transaction_id][1:]
-
-                self.Execution(transaction_id)
-            else:
-                self.ExecutionFailure(transaction_id)
+            if not self._deferred_execution.get():
+                self._call_transaction(transaction_id)
+            elif transaction_id not in self._ready_transactions:
+                self._ready_transactions.append(transaction_id)
+                self._increase_state_version()
+
+                self.ExecutionDeferral(transaction_id)
+
+    def _call_transaction(self, transaction_id: int):
+        # executing a transaction which is not pending(e.g. executed already) would execute it twice
+        if transaction_id not in self._pending_transactions:
+            revert(f"transaction id '{transaction_id}' is not pending")
+
+        # increase the state version before the call. if a called wallet method increased it first and was
+        # reverted, the increase would be rolled back but the transaction would be kept as having increased it
+        self._increase_state_version()
+        execute_result = self._external_call(Transaction.from_bytes(self._transactions[transaction_id]))
+        # executed transaction may have changed the wallet owners or the requirement
+        self._discard_wallet_owner_snapshot()
+
+        if execute_result:
+            self._transaction_status[transaction_id] = TRANSACTION_STATUS_EXECUTED
+            self._pending_transactions.remove(transaction_id)
+            self._put_executed_transaction(transaction_id)
+            if transaction_id in self._ready_transactions:
+                self._ready_transactions.remove(transaction_id)
+
+            self.Execution(transaction_id)
+        else:
+            self._execution_failure_count[transaction_id] += 1
+            self._last_execution_failure_height[transaction_id] = self.block_height
 
-    def _external_call(self, serialized_tx: bytes) -> bool:
-        transaction = Transaction.from_bytes(serialized_tx)
+            self.ExecutionFailure(transaction_id)
 
+    def _external_call(self, transaction: Transaction) -> bool:
         # if method == "" -> None
         method_name = None if transaction.method == "" else transaction.method
-        # if params == "" -> {}
-        method_params = {}
-        if transaction.params != "":
-            params = json_loads(transaction.params)
-            for param in params:
-                method_params[param["name"]] = params_type_converter(param["type"], param["value"])
+        if transaction.typed_params is not None:
+            # params were converted when the transaction was submitted
+            method_params = decode_typed_params(transaction.typed_params)
+        else:
+            # if params == "" -> {}
+            method_params = {}
+            if transaction.params != "":
+                method_params = typed_params_to_kwargs(convert_params(json_loads(transaction.params)))
         try:
             if transaction.destination.is_contract:
                 self.call(addr_to=transaction.destination,
@@ -242,22 +639,180 @@ class MultiSigWallet(IconScoreBase):
 
         return execute_result
 
+    @staticmethod
+    def _parse_transaction_ids(transaction_ids: str, max_amount: int) -> list:
+        try:
+            transaction_id_list = [params_type_converter("int", tx_id)
+                                   for tx_id in transaction_ids.replace(" ", "").split(",") if tx_id]
+        except ValueError:
+            revert("invalid transaction id format")
+
+        if len(transaction_id_list) > max_amount:
+            revert("requests that exceed the allowed amount")
+        return transaction_id_list
+
+    def _put_executed_transaction(self, transaction_id: int):
+        self._executed_transaction_position[transaction_id] = len(self._executed_transactions)
+        self._executed_transactions.put(transaction_id)
+
+    def _get_transaction_ids_by_cursor(self, cursor: int, count: int, transaction_list: LinkedListDB,
+                                       newest_first: bool) -> tuple:
+        # returns (transaction ids, next cursor). next cursor is None if there are no more transactions
+        if cursor is None:
+            cursor = transaction_list.tail() if newest_first else transaction_list.head()
+        elif cursor not in transaction_list:
+            revert("invalid cursor")
+
+        # read one more id to get the next cursor
+        transaction_ids = transaction_list.get_range_from(cursor, count + 1, reverse=newest_first)
+        next_cursor = transaction_ids.pop() if len(transaction_ids) > count else None
+        return transaction_ids, next_cursor
+
+    def _get_executed_transaction_ids_by_cursor(self, cursor: int, count: int, newest_first: bool) -> tuple:
+        # same as _get_transaction_ids_by_cursor, but for _executed_transactions which is an array
+        executed_transaction_count = len(self._executed_transactions)
+        if cursor is None:
+            position = executed_transaction_count - 1 if newest_first else 0
+        elif self._transaction_status[cursor] == TRANSACTION_STATUS_EXECUTED:
+            position = self._executed_transaction_position[cursor]
+        else:
+            revert("invalid cursor")
+
+        # read one more id to get the next cursor
+        if newest_first:
+            positions = range(position, max(position - count - 1, -1), -1)
+        else:
+            positions = range(position, min(position + count + 1, executed_transaction_count))
+        transaction_ids = [self._executed_transactions[idx] for idx in positions]
+        next_cursor = transaction_ids.pop() if len(transaction_ids) > count else None
+        return transaction_ids, next_cursor
+
+    def _get_transaction_info(self, transaction_id: int) -> dict:
+        # returns empty dict if the transaction does not exist
+        serialized_transaction = self._transactions[transaction_id]
+        if serialized_transaction is None:
+            return {}
+
+        transaction = Transaction.from_bytes(serialized_transaction)
+        transaction.executed = self._transaction_status[transaction_id] == TRANSACTION_STATUS_EXECUTED
+        tx_dict = transaction.to_dict()
+        tx_dict["_transactionId"] = transaction_id
+        if transaction.destination == self.address and transaction.method == self._MULTI_CALL_METHOD:
+            tx_dict["_params"] = self._get_multi_call_params(transaction)
+        # execution failure is included only if the execution of the transaction has ever failed
+        execution_failure_count = self._execution_failure_count[transaction_id]
+        if execution_failure_count > 0:
+            tx_dict["_executionFailureCount"] = execution_failure_count
+            tx_dict["_lastExecutionFailureHeight"] = self._last_execution_failure_height[transaction_id]
+        return tx_dict
+
+    @staticmethod
+    def _get_multi_call_params(transaction: Transaction) -> str:
+        # the calls are stored encoded in the typed params, so they are shown in the format of '_calls'
+        # of submitMultiCallTransaction rather than as the encoded bytes
+        calls = decode_multi_call(decode_typed_params(transaction.typed_params)["_calls"])
+        return json_dumps([{key: value for key, value in call.to_dict().items() if key != "_executed"}
+                           for call in calls])
+
+    def _increase_state_version(self):
+        # the version is increased once per transaction however many changes it makes. the wallet methods
+        # executed by the transaction run in inner calls with their own msg, so the transaction is kept instead
+        if self._state_version_tx is self.tx:
+            return
+        self._state_version.set(self._state_version.get() + 1)
+        self._state_version_tx = self.tx
+
+    def _put_wallet_owner(self, wallet_owner: Address):
+        self._wallet_owner_index[wallet_owner] = len(self._wallet_owners)
+        self._wallet_owners.put(wallet_owner)
+        self._discard_wallet_owner_snapshot()
+
     def _is_confirmed(self, transaction_id) -> bool:
-        count = 0
-        for wallet_owner in self._wallet_owners:
-            if self._confirmations[transaction_id][wallet_owner]:
-                count += 1
+        return self._count_bits(self._get_confirmation_mask(transaction_id)) == \
+            self._get_wallet_owner_snapshot().required
+
+    def _meets_requirement(self, transaction_id: int) -> bool:
+        # unlike _is_confirmed, confirmations exceeding the requirement(e.g. the requirement has been lowered after
+        # confirming) are accepted. use this only for the transactions checked not to be executed yet
+        return self._count_bits(self._get_confirmation_mask(transaction_id)) >= \
+            self._get_wallet_owner_snapshot().required
 
-        return count == self._required.get()
+    @staticmethod
+    def _count_bits(mask: int) -> int:
+        return bin(mask).count("1")
+
+    def _get_wallet_owner_bit(self, wallet_owner: Address) -> int:
+        # before call this method, check if wallet owner exists(use wallet_owner_exist method)
+        return 1 << self._get_wallet_owner_snapshot().index_of(wallet_owner)
+
+    def _get_confirmation_mask(self, transaction_id: int) -> int:
+        stored_mask = self._confirmation_masks[transaction_id]
+        # as every submitted transaction stores its confirmation mask, check if the mask exists only when it is 0
+        if stored_mask != 0 or transaction_id in self._confirmation_masks:
+            confirmation_mask = stored_mask >> self._OWNER_EPOCH_BITS
+            mask_epoch = stored_mask & ((1 << self._OWNER_EPOCH_BITS) - 1)
+            return self._remap_confirmation_mask(confirmation_mask, mask_epoch)
+
+        # transactions submitted before the confirmation masks were introduced store confirmations by address
+        confirmation_mask = 0
+        for idx, wallet_owner in enumerate(self._get_wallet_owner_snapshot().wallet_owners):
+            if self._confirmations[transaction_id][wallet_owner]:
+                confirmation_mask |= 1 << idx
+        return confirmation_mask
+
+    def _set_confirmation_mask(self, transaction_id: int, confirmation_mask: int):
+        owner_epoch = self._get_wallet_owner_snapshot().owner_epoch
+        self._confirmation_masks[transaction_id] = (confirmation_mask << self._OWNER_EPOCH_BITS) | owner_epoch
+
+    def _remap_confirmation_mask(self, confirmation_mask: int, mask_epoch: int) -> int:
+        # move each bit of the mask to the current index of the wallet owner who had the index at mask_epoch.
+        # confirmations of the removed(or replaced) wallet owners are discarded, as no wallet owner had their index.
+        # the owner index history is read once per call, so remapping doesn't read the state DB
+        wallet_owner_snapshot = self._get_wallet_owner_snapshot()
+        if mask_epoch == wallet_owner_snapshot.owner_epoch:
+            return confirmation_mask
+
+        remapped_mask = 0
+        owner_index_history = wallet_owner_snapshot.owner_index_history
+        for idx in range(wallet_owner_snapshot.wallet_owner_count):
+            mask_idx = idx
+            for owner_epoch, previous_idx in owner_index_history.get(idx, ()):
+                if owner_epoch <= mask_epoch:
+                    break
+                mask_idx = previous_idx
+                if mask_idx is None:
+                    break
+            if mask_idx is not None and confirmation_mask & (1 << mask_idx):
+                remapped_mask |= 1 << idx
+        return remapped_mask
+
+    def _change_owner_epoch(self, vacated_idx: int, moved_idx: int):
+        # confirmation masks refer to the wallet owners by their index in _wallet_owners.
+        # instead of remapping all of them, record the index change and remap each mask when it is read.
+        # moved_idx is the same as vacated_idx if no wallet owner is moved.
+        # a wallet owner moves only from the last index to a lower index, so each wallet owner's history
+        # has at most _MAX_WALLET_OWNER_COUNT entries however many times the wallet owners are changed
+        wallet_owner_snapshot = self._get_wallet_owner_snapshot()
+        owner_epoch = wallet_owner_snapshot.owner_epoch + 1
+        owner_index_history = dict(wallet_owner_snapshot.owner_index_history)
+        moved_owner_history = owner_index_history.pop(moved_idx, [])
+        # a wallet owner put at moved_idx later(e.g. added, or replacing the removed one) has no confirmation before
+        owner_index_history[moved_idx] = [(owner_epoch, None)]
+        if moved_idx != vacated_idx:
+            owner_index_history[vacated_idx] = [(owner_epoch, moved_idx)] + moved_owner_history
+        self._owner_index_history.set(encode_owner_index_history(owner_index_history))
+        self._owner_epoch.set(owner_epoch)
 
     @only_wallet
     @external
     def addWalletOwner(self, _walletOwner: Address):
         self._wallet_owner_does_not_exist(_walletOwner)
         # check if owner's count exceed '_MAX_OWNER_COUNT'
-        self._check_requirement(len(self._wallet_owners) + 1, self._required.get())
+        wallet_owner_snapshot = self._get_wallet_owner_snapshot()
+        self._check_requirement(wallet_owner_snapshot.wallet_owner_count + 1, wallet_owner_snapshot.required)
 
-        self._wallet_owners.put(_walletOwner)
+        self._put_wallet_owner(_walletOwner)
+        self._increase_state_version()
 
         self.WalletOwnerAddition(_walletOwner)
 
@@ -267,10 +822,14 @@ class MultiSigWallet(IconScoreBase):
         self._wallet_owner_exist(_walletOwner)
         self._wallet_owner_does_not_exist(_newWalletOwner)
 
-        for idx, wallet_owner in enumerate(self._wallet_owners):
-            if wallet_owner == _walletOwner:
-                self._wallet_owners[idx] = _newWalletOwner
-                break
+        idx = self._get_wallet_owner_snapshot().index_of(_walletOwner)
+        self._change_owner_epoch(idx, idx)
+
+        self._wallet_owners[idx] = _newWalletOwner
+        self._wallet_owner_index[_newWalletOwner] = idx
+        self._wallet_owner_index.remove(_walletOwner)
+        self._discard_wallet_owner_snapshot()
+        self._increase_state_version()
 
         self.WalletOwnerRemoval(_walletOwner)
         self.WalletOwnerAddition(_newWalletOwner)
@@ -281,100 +840,250 @@ class MultiSigWallet(IconScoreBase):
         self._wallet_owner_exist(_walletOwner)
         # if all owners are removed, this contract can not be executed.
         # so check if _owner is only one left in this wallet
-        wallet_owners_count = len(self._wallet_owners)
-        self._check_requirement(wallet_owners_count - 1, self._required.get())
-
-        for idx, owner in enumerate(self._wallet_owners):
-            if owner == _walletOwner:
-                if idx == wallet_owners_count - 1:
-                    self._wallet_owners.pop()
-                else:
-                    self._wallet_owners[idx] = self._wallet_owners.pop()
-                break
+        wallet_owner_snapshot = self._get_wallet_owner_snapshot()
+        wallet_owners_count = wallet_owner_snapshot.wallet_owner_count
+        self._check_requirement(wallet_owners_count - 1, wallet_owner_snapshot.required)
+
+        # move the last wallet owner to the removed owner's index
+        idx = wallet_owner_snapshot.index_of(_walletOwner)
+        last_idx = wallet_owners_count - 1
+        self._change_owner_epoch(idx, last_idx)
+
+        last_wallet_owner = self._wallet_owners.pop()
+        if idx != last_idx:
+            self._wallet_owners[idx] = last_wallet_owner
+            self._wallet_owner_index[last_wallet_owner] = idx
+        self._wallet_owner_index.remove(_walletOwner)
+        self._discard_wallet_owner_snapshot()
+        self._increase_state_version()
 
         self.WalletOwnerRemoval(_walletOwner)
 
     @only_wallet
     @external
     def changeRequirement(self, _required: int):
-        self._check_requirement(len(self._wallet_owners), _required)
+        self._check_requirement(self._get_wallet_owner_snapshot().wallet_owner_count, _required)
 
         self._required.set(_required)
+        self._discard_wallet_owner_snapshot()
+        self._increase_state_version()
 
         self.RequirementChange(_required)
 
+    @only_wallet
+    @external
+    def changeDeferredExecution(self, _deferredExecution: bool):
+        # transactions queued already are still executed by executeReady after turning off deferred execution
+        self._deferred_execution.set(_deferredExecution)
+        self._increase_state_version()
+
+        self.DeferredExecutionChange(_deferredExecution)
+
+    @external(readonly=True)
+    def getStateVersion(self) -> int:
+        return self._state_version.get()
+
+    @external(readonly=True)
+    def getSignatureNonce(self) -> int:
+        return self._signature_nonce.get()
+
+    @external(readonly=True)
+    def getSignatureHash(self, _destination: Address,
+                         _method: str = "", _params: str = "", _value: int = 0, _description: str = "") -> bytes:
+        # hash which the wallet owners sign for submitTransactionWithSignatures with the current signature nonce
+        transaction = self._create_transaction(_destination, _method, _params, _value, _description)
+        return self._get_signature_hash(transaction, self._signature_nonce.get())
+
     @external(readonly=True)
     def getRequirement(self) -> int:
-        return self._required.get()
+        return self._get_wallet_owner_snapshot().required
+
+    @external(readonly=True)
+    def getDeferredExecution(self) -> bool:
+        return self._deferred_execution.get()
+
+    @external(readonly=True)
+    def getReadyTransactionCount(self) -> int:
+        return len(self._ready_transactions)
+
+    @external(readonly=True)
+    def getReadyTransactions(self, _count: int, _cursor: int = None) -> dict:
+        # transactions queued in deferred execution mode, in the order they will be executed by executeReady.
+        # _cursor: transaction id to start from(included). starts from the first queued transaction if not given
+        self._only_positive_number(_count)
+
+        if _count > self._MAX_DATA_REQUEST_AMOUNT:
+            revert("requests that exceed the allowed amount")
+
+        transaction_ids, next_cursor = \
+            self._get_transaction_ids_by_cursor(_cursor, _count, self._ready_transactions, False)
+        result = {"_transactions": [self._get_transaction_info(tx_id) for tx_id in transaction_ids]}
+        if next_cursor is not None:
+            result["_nextCursor"] = next_cursor
+        return result
 
     @external(readonly=True)
     def getTransactionInfo(self, _transactionId: int) -> dict:
-        if self._transactions[_transactionId] is not None:
-            transaction = Transaction.from_bytes(self._transactions[_transactionId])
-            tx_dict = transaction.to_dict()
-            tx_dict["_transactionId"] = _transactionId
-            return tx_dict
+        return self._get_transaction_info(_transactionId)
+
+    @external(readonly=True)
+    def getTransactionListByCursor(self, _count: int, _cursor: int = None, _pending: bool = True,
+                                   _executed: bool = True, _newestFirst: bool = True) -> dict:
+        # _cursor: transaction id to start from(included). starts from the newest(or the oldest) if not given.
+        # returns the transactions and "_nextCursor" which should be passed to get the next page.
+        # "_nextCursor" is not included if there are no more transactions
+        self._only_positive_number(_count)
+
+        if _count > self._MAX_DATA_REQUEST_AMOUNT:
+            revert("requests that exceed the allowed amount")
+
+        if _pending and _executed:
+            total_transaction_count = self._transaction_count.get()
+            if _cursor is None:
+                _cursor = total_transaction_count - 1 if _newestFirst else 0
+            elif not 0 <= _cursor < total_transaction_count:
+                revert("invalid cursor")
+
+            if _newestFirst:
+                transaction_ids = range(_cursor, max(_cursor - _count, -1), -1)
+                next_cursor = _cursor - _count if _cursor - _count >= 0 else None
+            else:
+                transaction_ids = range(_cursor, min(_cursor + _count, total_transaction_count))
+                next_cursor = _cursor + _count if _cursor + _count < total_transaction_count else None
+        elif _pending:
+            # pending transactions are listed in the order of submission
+            transaction_ids, next_cursor = \
+                self._get_transaction_ids_by_cursor(_cursor, _count, self._pending_transactions, _newestFirst)
+        elif _executed:
+            # executed transactions are listed in the order of execution
+            transaction_ids, next_cursor = \
+                self._get_executed_transaction_ids_by_cursor(_cursor, _count, _newestFirst)
         else:
-            return {}
+            transaction_ids, next_cursor = [], None
+
+        result = {"_transactions": [self._get_transaction_info(tx_id) for tx_id in transaction_ids]}
+        if next_cursor is not None:
+            result["_nextCursor"] = next_cursor
+        return result
 
     @external(readonly=True)
-    def getTransactionsExecuted(self, _transactionId: int) -> bool:
-        if self._transactions[_transactionId] is not None:
-            return bool(self._transactions[_transactionId][0])
+    def getTransactionsAwaitingConfirmation(self, _walletOwner: Address, _count: int, _cursor: int = None) -> dict:
+        # pending transactions which are not confirmed by _walletOwner, in the order of submission.
+        # they are found by scanning the pending transactions from _cursor(included, the oldest if not given) and
+        # checking their confirmations, so at most _MAX_AWAITING_TRANSACTION_SCAN_AMOUNT transactions are scanned.
+        # "_nextCursor" is included if there are more pending transactions to scan,
+        # even if the number of the returned transactions is less than _count
+        self._only_positive_number(_count)
+
+        if _count > self._MAX_DATA_REQUEST_AMOUNT:
+            revert("requests that exceed the allowed amount")
+
+        if _cursor is None:
+            _cursor = self._pending_transactions.head()
+        elif _cursor not in self._pending_transactions:
+            revert("invalid cursor")
+
+        transaction_ids = []
+        transaction_id = _cursor
+        # a non wallet owner doesn't await any transaction
+        if self._get_wallet_owner_snapshot().contains(_walletOwner):
+            wallet_owner_bit = self._get_wallet_owner_bit(_walletOwner)
+            for _ in range(self._MAX_AWAITING_TRANSACTION_SCAN_AMOUNT):
+                if transaction_id is None or len(transaction_ids) == _count:
+                    break
+                if not self._get_confirmation_mask(transaction_id) & wallet_owner_bit:
+                    transaction_ids.append(transaction_id)
+                transaction_id = self._pending_transactions.next(transaction_id)
         else:
-            return False
+            transaction_id = None
+
+        result = {"_transactions": [self._get_transaction_info(tx_id) for tx_id in transaction_ids]}
+        if transaction_id is not None:
+            result["_nextCursor"] = transaction_id
+        return result
+
+    @external(readonly=True)
+    def getWalletSnapshot(self, _pendingCount: int = 10) -> dict:
+        # wallet state for dashboards in one query. "_latestTransactionId" is not included if there is no transaction.
+        # "_pendingTransactions" are the most recent pending transactions(newest first) with their confirmation count
+        self._only_positive_number(_pendingCount)
+
+        if _pendingCount > self._MAX_DATA_REQUEST_AMOUNT:
+            revert("requests that exceed the allowed amount")
+
+        wallet_owner_snapshot = self._get_wallet_owner_snapshot()
+        transaction_count = self._transaction_count.get()
+
+        pending_transactions = []
+        transaction_ids = self._pending_transactions.get_range_from(self._pending_transactions.tail(),
+                                                                    _pendingCount, reverse=True)
+        for tx_id in transaction_ids:
+            tx_dict = self._get_transaction_info(tx_id)
+            tx_dict["_confirmationCount"] = self._count_bits(self._get_confirmation_mask(tx_id))
+            pending_transactions.append(tx_dict)
+
+        snapshot = {
+            "_walletOwners": [str(wallet_owner) for wallet_owner in wallet_owner_snapshot.wallet_owners],
+            "_requirement": wallet_owner_snapshot.required,
+            "_pendingTransactionCount": len(self._pending_transactions),
+            "_executedTransactionCount": len(self._executed_transactions),
+            "_pendingTransactions": pending_transactions,
+            "_stateVersion": self._state_version.get()
+        }
+        if transaction_count > 0:
+            snapshot["_latestTransactionId"] = transaction_count - 1
+        return snapshot
+
+    @external(readonly=True)
+    def getTransactionInfos(self, _transactionIds: str) -> list:
+        # _transactionIds: comma separated transaction ids(e.g. "0x0,0x1,2")
+        transaction_ids = self._parse_transaction_ids(_transactionIds, self._MAX_TRANSACTION_INFO_REQUEST_AMOUNT)
+        return [self._get_transaction_info(tx_id) for tx_id in transaction_ids]
+
+    @external(readonly=True)
+    def getTransactionsExecuted(self, _transactionId: int) -> bool:
+        return self._transaction_status[_transactionId] == TRANSACTION_STATUS_EXECUTED
 
     @external(readonly=True)
     def checkIfWalletOwner(self, _walletOwner: Address) -> bool:
-        return _walletOwner in self._wallet_owners
+        return self._get_wallet_owner_snapshot().contains(_walletOwner)
 
     @external(readonly=True)
     def getWalletOwnerCount(self) -> int:
-        return len(self._wallet_owners)
+        return self._get_wallet_owner_snapshot().wallet_owner_count
 
     @external(readonly=True)
     def getWalletOwners(self, _offset: int, _count: int) -> list:
         self._only_positive_number(_offset, _count)
 
-        wallet_owner_list = []
-        wallet_owners_count = len(self._wallet_owners)
-
-        for idx in range(_offset, _offset + _count):
-            if idx >= wallet_owners_count:
-                break
-            wallet_owner_list.append(str(self._wallet_owners[idx]))
-
-        return wallet_owner_list
+        wallet_owners = self._get_wallet_owner_snapshot().get_wallet_owners(_offset, _count)
+        return [str(wallet_owner) for wallet_owner in wallet_owners]
 
     @external(readonly=True)
     def getConfirmationCount(self, _transactionId: int) -> int:
-        count = 0
-        for wallet_owner in self._wallet_owners:
-            if self._confirmations[_transactionId][wallet_owner]:
-                count += 1
-        return count
+        return self._count_bits(self._get_confirmation_mask(_transactionId))
 
     @external(readonly=True)
     def getConfirmations(self, _offset: int, _count: int, _transactionId: int) -> list:
         self._only_positive_number(_offset, _count)
 
         confirmed_wallet_owners = []
-        wallet_owners_count = len(self._wallet_owners)
+        confirmation_mask = self._get_confirmation_mask(_transactionId)
+        wallet_owners = self._get_wallet_owner_snapshot().get_wallet_owners(_offset, _count)
 
-        for idx in range(_offset, _offset + _count):
-            if idx >= wallet_owners_count:
-                break
-            if self._confirmations[_transactionId][self._wallet_owners[idx]]:
-                confirmed_wallet_owners.append(str(self._wallet_owners[idx]))
+        for idx, wallet_owner in enumerate(wallet_owners, _offset):
+            if confirmation_mask & (1 << idx):
+                confirmed_wallet_owners.append(str(wallet_owner))
 
         return confirmed_wallet_owners
 
     @external(readonly=True)
     def getTransactionCount(self, _pending: bool = True, _executed: bool = True) -> int:
         tx_count = 0
-        for tx_id in range(self._transaction_count.get()):
-            if (_pending and not self._transactions[tx_id][0]) or (_executed and self._transactions[tx_id][0]):
-                tx_count += 1
+        if _pending:
+            tx_count += len(self._pending_transactions)
+        if _executed:
+            tx_count += len(self._executed_transactions)
 
         return tx_count
 
@@ -385,18 +1094,21 @@ class MultiSigWallet(IconScoreBase):
         if _count > self._MAX_DATA_REQUEST_AMOUNT:
             revert("requests that exceed the allowed amount")
 
-        transaction_list = []
-        total_transaction_count = self._transaction_count.get()
-
-        # prevent searching not existed transaction
-        _count = _offset + _count if total_transaction_count >= _offset + _count else total_transaction_count
-
-        for tx_id in range(_offset, _count):
-            if (_pending and not self._transactions[tx_id][0]) or (_executed and self._transactions[tx_id][0]):
-                transaction = Transaction.from_bytes(self._transactions[tx_id])
-
-                tx_dict = transaction.to_dict()
-                tx_dict["_transactionId"] = tx_id
-                transaction_list.append(tx_dict)
+        if _pending and _executed:
+            total_transaction_count = self._transaction_count.get()
+
+            # prevent searching not existed transaction
+            _count = _offset + _count if total_transaction_count >= _offset + _count else total_transaction_count
+            transaction_ids = range(_offset, _count)
+        elif _pending:
+            # _offset is an offset among the pending transactions
+            transaction_ids = self._pending_transactions.get_range(_offset, _count)
+        elif _executed:
+            # _offset is an offset among the executed transactions
+            executed_transaction_count = len(self._executed_transactions)
+            transaction_ids = [self._executed_transactions[position]
+                               for position in range(_offset, min(_offset + _count, executed_transaction_count))]
+        else:
+            transaction_ids = []
 
-        return transaction_list
+        return [self._get_transaction_info(tx_id) for tx_id in transaction_ids]
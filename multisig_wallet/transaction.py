@@ -15,15 +15,36 @@
 # limitations under the License.
 
 from iconservice import *
+from .type_converter.type_converter import decode_typed_params_to_params
 
 # address, value fix
 ADDRESS_BYTE_LEN = 21
 DEFAULT_VALUE_BYTES = 16
 DATA_BYTE_ORDER = "big"
+HEADER_BYTE_LEN = 1 + ADDRESS_BYTE_LEN + DEFAULT_VALUE_BYTES
+
+# format version of the flexible variables which follow the header.
+# each variable is encoded as a length prefix followed by bytes(utf-8 encoded bytes in case of str).
+# version 1: method, params, description
+# version 2: method, description, typed params(params converted and encoded when submitted).
+#            params are not stored as they are, but rebuilt from the typed params when they are accessed
+# legacy transactions store method, params and description as a JSON string which always starts with '{'
+TRANSACTION_FORMAT_VERSION_1 = 1
+TRANSACTION_FORMAT_VERSION = 2
+FIELD_LENGTH_BYTES = 2
 
 MAX_METHOD_LEN = 100
 MAX_PARAMS_LEN = 1000
 MAX_DESCRIPTION_LEN = 1000
+# a multi-call transaction stores its calls(JSON formatted) as params
+MAX_MULTI_CALL_PARAMS_LEN = 10000
+MAX_MULTI_CALL_COUNT = 20
+
+# status of the transaction. it is stored apart from the serialized transaction,
+# so the executed flag in the serialized transaction is always False except for legacy transactions.
+# as the status which is not stored is read as 0, a submitted transaction doesn't need to store the pending status
+TRANSACTION_STATUS_PENDING = 0
+TRANSACTION_STATUS_EXECUTED = 1
 
 
 class Transaction:
@@ -33,7 +54,8 @@ class Transaction:
                  params: str,
                  value: int,
                  description: str,
-                 executed: bool):
+                 executed: bool,
+                 typed_params: bytes = None):
 
         self._executed = executed
         self._destination = destination
@@ -41,6 +63,12 @@ class Transaction:
         self._method = method
         self._params = params
         self._description = description
+        # params which are converted to each type and encoded(see type_converter.encode_typed_params).
+        # None if the transaction was submitted before typed params were stored
+        self._typed_params = typed_params
+        # encoded flexible variables(method, description, typed params or params) which are not decoded yet.
+        # a transaction loaded by from_bytes decodes them only when one of them is accessed
+        self._encoded_flexible_vars = None
 
     @property
     def executed(self) -> bool:
@@ -56,24 +84,57 @@ class Transaction:
 
     @property
     def method(self) -> str:
+        self._load_flexible_vars()
         return self._method
 
     @property
     def params(self) -> str:
+        self._load_flexible_vars()
+        if self._params is None:
+            # rebuilt params are equivalent to the submitted ones, but may differ in format(e.g. int value as hex)
+            params = decode_typed_params_to_params(self._typed_params)
+            self._params = json_dumps(params) if len(params) > 0 else ""
         return self._params
 
+    @property
+    def typed_params(self) -> bytes:
+        self._load_flexible_vars()
+        return self._typed_params
+
     @property
     def value(self) -> int:
         return self._value
 
     @property
     def description(self) -> str:
+        self._load_flexible_vars()
         return self._description
 
-    def to_dict(self):
-        tx_dict = self.__dict__
-        tx_dict['_destination'] = str(self.destination)
-        return tx_dict
+    def to_dict(self) -> dict:
+        return {"_executed": self.executed,
+                "_destination": str(self.destination),
+                "_value": self.value,
+                "_method": self.method,
+                "_params": self.params,
+                "_description": self.description}
+
+    def _load_flexible_vars(self):
+        if self._encoded_flexible_vars is None:
+            return
+
+        encoded_flexible_vars = self._encoded_flexible_vars
+        if encoded_flexible_vars[0] == TRANSACTION_FORMAT_VERSION:
+            method, description, self._typed_params = self._decode_flexible_vars(encoded_flexible_vars, 3)
+            self._method, self._description = method.decode(), description.decode()
+        elif encoded_flexible_vars[0] == TRANSACTION_FORMAT_VERSION_1:
+            method, params, description = self._decode_flexible_vars(encoded_flexible_vars, 3)
+            self._method, self._params, self._description = method.decode(), params.decode(), description.decode()
+        else:
+            flexible_vars_json = json_loads(encoded_flexible_vars.decode())
+            self._method = flexible_vars_json["method"]
+            self._params = flexible_vars_json["params"]
+            self._description = flexible_vars_json["description"]
+        self._encoded_flexible_vars = None
 
     @classmethod
     def create_transaction_with_validation(cls,
@@ -82,13 +143,15 @@ class Transaction:
                                            params: str,
                                            value: int,
                                            description: str,
-                                           executed: bool = False):
+                                           executed: bool = False,
+                                           typed_params: bytes = b"",
+                                           max_params_len: int = MAX_PARAMS_LEN):
         # as None type can't be converted to bytes, must be changed to ""
         method = "" if method is None else method
         params = "" if params is None else params
 
         if len(method) > MAX_METHOD_LEN \
-                or len(params) > MAX_PARAMS_LEN \
+                or len(params) > max_params_len \
                 or len(description) > MAX_DESCRIPTION_LEN:
             revert("too long parameter length")
         try:
@@ -101,22 +164,40 @@ class Transaction:
                    value=value,
                    method=method,
                    params=params,
-                   description=description)
+                   description=description,
+                   typed_params=typed_params)
 
     @classmethod
     def from_bytes(cls, buf: bytes):
+        # decode the fixed size header only. flexible variables are decoded when they are accessed
         encoded_executed = bool(buf[0])
         encoded_destination = buf[1: 1 + ADDRESS_BYTE_LEN]
-        encoded_value = buf[1 + ADDRESS_BYTE_LEN: 1 + ADDRESS_BYTE_LEN + DEFAULT_VALUE_BYTES]
-        flexible_vars_json_string = buf[1 + ADDRESS_BYTE_LEN + DEFAULT_VALUE_BYTES:].decode()
-        flexible_vars_json = json_loads(flexible_vars_json_string)
-
-        return cls(executed=encoded_executed,
-                   destination=Address.from_bytes(encoded_destination),
-                   value=int.from_bytes(encoded_value, DATA_BYTE_ORDER),
-                   method=flexible_vars_json["method"],
-                   params=flexible_vars_json["params"],
-                   description=flexible_vars_json["description"])
+        encoded_value = buf[1 + ADDRESS_BYTE_LEN: HEADER_BYTE_LEN]
+
+        transaction = cls(executed=encoded_executed,
+                          destination=Address.from_bytes(encoded_destination),
+                          value=int.from_bytes(encoded_value, DATA_BYTE_ORDER),
+                          method=None,
+                          params=None,
+                          description=None)
+        transaction._encoded_flexible_vars = buf[HEADER_BYTE_LEN:]
+        return transaction
+
+    @staticmethod
+    def _decode_flexible_vars(buf: bytes, var_count: int) -> list:
+        # skip the format version
+        offset = 1
+        flexible_vars = []
+        for _ in range(var_count):
+            var_len = int.from_bytes(buf[offset: offset + FIELD_LENGTH_BYTES], DATA_BYTE_ORDER)
+            offset += FIELD_LENGTH_BYTES
+            flexible_vars.append(buf[offset: offset + var_len])
+            offset += var_len
+        return flexible_vars
+
+    @staticmethod
+    def _encode_flexible_var(var: bytes) -> bytes:
+        return len(var).to_bytes(FIELD_LENGTH_BYTES, DATA_BYTE_ORDER) + var
 
     def to_bytes(self) -> bytes:
         encoded_executed = self.executed.to_bytes(1, DATA_BYTE_ORDER)
@@ -125,10 +206,37 @@ class Transaction:
         destination_bytes = destination_bytes if len(destination_bytes) == ADDRESS_BYTE_LEN \
             else b'\x00' + destination_bytes
 
-        flexible_vars = dict()
-        flexible_vars["method"] = self.method
-        flexible_vars["params"] = self.params
-        flexible_vars["description"] = self.description
-
-        encoded_flexible_vars_json = json_dumps(flexible_vars).encode(encoding="utf-8")
-        return encoded_executed + destination_bytes + encoded_value + encoded_flexible_vars_json
+        # flexible variables which are not decoded yet don't need to be encoded again
+        encoded_flexible_vars = self._encoded_flexible_vars
+        if encoded_flexible_vars is None and self.typed_params is None:
+            encoded_flexible_vars = TRANSACTION_FORMAT_VERSION_1.to_bytes(1, DATA_BYTE_ORDER) + \
+                self._encode_flexible_var(self.method.encode(encoding="utf-8")) + \
+                self._encode_flexible_var(self.params.encode(encoding="utf-8")) + \
+                self._encode_flexible_var(self.description.encode(encoding="utf-8"))
+        elif encoded_flexible_vars is None:
+            # params are stored only as the typed params, which are smaller and used for the execution
+            encoded_flexible_vars = TRANSACTION_FORMAT_VERSION.to_bytes(1, DATA_BYTE_ORDER) + \
+                self._encode_flexible_var(self.method.encode(encoding="utf-8")) + \
+                self._encode_flexible_var(self.description.encode(encoding="utf-8")) + \
+                self._encode_flexible_var(self.typed_params)
+        return encoded_executed + destination_bytes + encoded_value + encoded_flexible_vars
+
+
+def encode_multi_call(transactions: list) -> bytes:
+    # each call of a multi-call transaction is encoded as a transaction with a length prefix
+    buf = b""
+    for transaction in transactions:
+        encoded = transaction.to_bytes()
+        buf += len(encoded).to_bytes(FIELD_LENGTH_BYTES, DATA_BYTE_ORDER) + encoded
+    return buf
+
+
+def decode_multi_call(buf: bytes) -> list:
+    transactions = []
+    offset = 0
+    while offset < len(buf):
+        transaction_len = int.from_bytes(buf[offset: offset + FIELD_LENGTH_BYTES], DATA_BYTE_ORDER)
+        offset += FIELD_LENGTH_BYTES
+        transactions.append(Transaction.from_bytes(buf[offset: offset + transaction_len]))
+        offset += transaction_len
+    return transactions
@@ -16,29 +16,210 @@
 
 from iconservice import *
 
+# besides the basic types(see _VALUE_CONVERTERS), an array of any type("[]" + element type, e.g. "[]Address")
+# and a struct("struct") are supported. struct's value is a list of fields which have the same format as the params
+# (e.g. [{"name": "_to", "type": "Address", "value": "hx..."}]) and it is passed to the method as a dict.
+# arrays and structs can be nested up to MAX_PARAM_DEPTH, and have up to MAX_PARAM_LENGTH elements or fields
+ARRAY_TYPE_PREFIX = "[]"
+STRUCT_TYPE = "struct"
+MAX_PARAM_DEPTH = 3
+MAX_PARAM_LENGTH = 100
+# errors of converting an invalid value(e.g. int("a"), bytes.fromhex("zz")). besides them, InvalidParamsException
+# raised for an invalid address is expected(see is_invalid_params_error). any other error is not caught
+_CONVERSION_ERRORS = (IconScoreException, ValueError, TypeError)
+# conversion plans memoized by the schema of the params(tuple of (name, type) of each param, see _get_conversion_plan).
+# the number of plans is bounded, as they are kept as long as the SCORE is loaded
+MAX_CONVERSION_PLAN_COUNT = 100
+_conversion_plans = {}
+
+
+class ParamsConversionError(IconScoreException):
+    # error of converting the param at the path(e.g. "_orders[1].id": field "id" of the 2nd element of "_orders")
+    def __init__(self, path: str, reason: str):
+        super().__init__(f"{path}: {reason}")
+        self.path = path
+        self.reason = reason
+
 
 def params_type_converter(param_type: str, value: any):
-    if param_type == "int":
-        param = _convert_value_int(value)
-    elif param_type == "str":
-        param = _convert_value_string(value)
-    elif param_type == "bool":
-        param = _convert_value_bool(value)
-    elif param_type == "Address":
-        param = _convert_value_address(value)
-    elif param_type == "bytes":
-        param = _convert_value_bytes(value)
+    # struct is converted to a list of (name, type, converted value) like convert_params
+    # (use typed_params_to_kwargs to get the value passed to the method)
+    return _convert_value(param_type, value, 0)
+
+
+def convert_params(params: list) -> list:
+    # params: list of {"name": name, "type": type, "value": value} (e.g. parsed 'params' of the transaction)
+    # returns a list of (name, type, converted value). raises ParamsConversionError of the first invalid param
+    plan = _get_conversion_plan(params)
+    if plan is None:
+        return _convert_params(params, 0)
+    return [_convert_planned_param(planned_param, param) for planned_param, param in zip(plan, params)]
+
+
+def validate_params(params: list) -> tuple:
+    # converts every param like convert_params, but collects the errors of all the invalid params
+    # instead of raising the first one. returns (list of (name, type, converted value), list of error messages)
+    plan = _get_conversion_plan(params)
+    typed_params = []
+    errors = []
+    for idx, param in enumerate(params):
+        try:
+            if plan is None:
+                typed_params.append(_convert_param(param, idx, 0))
+            else:
+                typed_params.append(_convert_planned_param(plan[idx], param))
+        except ParamsConversionError as e:
+            errors.append(e.message)
+    return typed_params, errors
+
+
+def typed_params_to_kwargs(typed_params: list) -> dict:
+    # typed_params: list of (name, type, converted value)
+    return {name: _typed_value_to_kwarg(param_type, value) for name, param_type, value in typed_params}
+
+
+def _get_conversion_plan(params: list) -> list:
+    # returns the plan of the params' schema, which is a list of (name, type, converter of the type's values) of
+    # each param, so that converting params of the same schema(e.g. payroll's transfer(_to, _value)) skips
+    # dispatching each param by its type. the converter is None for arrays and structs, which are dispatched
+    # as usual. returns None if any param is malformed(e.g. without a name), to report it by _convert_param
+    try:
+        schema = tuple((param["name"], param["type"]) for param in params if "value" in param)
+        plan = _conversion_plans.get(schema)
+    except (KeyError, TypeError):
+        return None
+    if len(schema) != len(params):
+        return None
+    if plan is not None:
+        return plan
+
+    if any(not isinstance(name, str) or not isinstance(param_type, str) for name, param_type in schema):
+        return None
+    plan = [(name, param_type, _VALUE_CONVERTERS.get(param_type)) for name, param_type in schema]
+    if len(_conversion_plans) < MAX_CONVERSION_PLAN_COUNT:
+        _conversion_plans[schema] = plan
+    return plan
+
+
+def _convert_planned_param(planned_param: tuple, param: dict) -> tuple:
+    name, param_type, converter = planned_param
+    return name, param_type, _convert_nested_value(name, param_type, param["value"], 0, converter)
+
+
+def _convert_params(params: list, depth: int) -> list:
+    return [_convert_param(param, idx, depth) for idx, param in enumerate(params)]
+
+
+def _convert_param(param: dict, idx: int, depth: int) -> tuple:
+    # the param is referred by its name in the error, or by its index if it doesn't have a valid name
+    name = param.get("name") if isinstance(param, dict) else None
+    path = name if isinstance(name, str) else f"[{idx}]"
+    if not isinstance(param, dict) or any(key not in param for key in ("name", "type", "value")):
+        raise ParamsConversionError(path, "param should have name, type and value")
+    if not isinstance(name, str):
+        raise ParamsConversionError(path, "name should be a string")
+
+    return name, param["type"], _convert_nested_value(path, param["type"], param["value"], depth)
+
+
+def _convert_nested_value(path: str, param_type: str, value, depth: int, converter: callable = None):
+    # converter: converter of the type's values which is looked up already(see _get_conversion_plan), if any
+    try:
+        if converter is not None:
+            return converter(value)
+        return _convert_value(param_type, value, depth)
+    except ParamsConversionError as e:
+        raise ParamsConversionError(path + e.path, e.reason)
+    except _CONVERSION_ERRORS as e:
+        raise ParamsConversionError(path, e.message if isinstance(e, IconScoreException) else str(e))
+    except IconScoreException.__base__ as e:
+        if not is_invalid_params_error(e):
+            raise e
+        raise ParamsConversionError(path, e.message)
+
+
+def is_invalid_params_error(error: BaseException) -> bool:
+    # Address.from_string raises InvalidParamsException for an invalid address. as iconservice doesn't export it
+    # (and SCOREs can't import the other modules), it is caught as the base class it shares with IconScoreException
+    # and checked by its name, so that the other errors(e.g. out of step) are not caught
+    return type(error).__name__ == "InvalidParamsException"
+
+
+def _convert_value(param_type: str, value, depth: int):
+    if isinstance(param_type, str) and param_type.startswith(ARRAY_TYPE_PREFIX):
+        result = _convert_value_array(param_type[len(ARRAY_TYPE_PREFIX):], value, depth + 1)
+    elif param_type == STRUCT_TYPE:
+        result = _convert_value_struct(value, depth + 1)
     else:
+        result = _get_value_converter(param_type)(value)
+    return result
+
+
+def _check_param_type(param_type: str, depth: int):
+    # check the type before converting the value, as the value(e.g. empty array) may not be converted
+    while param_type.startswith(ARRAY_TYPE_PREFIX):
+        param_type = param_type[len(ARRAY_TYPE_PREFIX):]
+        depth += 1
+    if param_type == STRUCT_TYPE:
+        depth += 1
+    else:
+        _get_value_converter(param_type)
+
+    if depth > MAX_PARAM_DEPTH:
+        raise IconScoreException(f"params can't be nested more than {MAX_PARAM_DEPTH} times")
+
+
+def _get_value_converter(param_type: str) -> callable:
+    converter = _VALUE_CONVERTERS.get(param_type)
+    if converter is None:
         raise IconScoreException(
-            f"{param_type} is not supported type (only int, str, bool, Address, bytes are supported)")
-    return param
+            f"{param_type} is not supported type (only int, str, bool, Address, bytes, struct and arrays of them "
+            f"are supported)")
+    return converter
+
+
+def _convert_value_array(element_type: str, value, depth: int) -> list:
+    _check_param_type(element_type, depth)
+    if not isinstance(value, list):
+        raise IconScoreException("type and value's actual type are not match.")
+    if len(value) > MAX_PARAM_LENGTH:
+        raise IconScoreException(f"array can't have more than {MAX_PARAM_LENGTH} elements")
+
+    return [_convert_nested_value(f"[{idx}]", element_type, element, depth) for idx, element in enumerate(value)]
+
+
+def _convert_value_struct(value, depth: int) -> list:
+    if depth > MAX_PARAM_DEPTH:
+        raise IconScoreException(f"params can't be nested more than {MAX_PARAM_DEPTH} times")
+    if not isinstance(value, list):
+        raise IconScoreException("type and value's actual type are not match.")
+    if len(value) > MAX_PARAM_LENGTH:
+        raise IconScoreException(f"struct can't have more than {MAX_PARAM_LENGTH} fields")
+
+    try:
+        return _convert_params(value, depth)
+    except ParamsConversionError as e:
+        # field is referred by its name after ".", or by its index
+        separator = "" if e.path.startswith("[") else "."
+        raise ParamsConversionError(separator + e.path, e.reason)
+
+
+def _typed_value_to_kwarg(param_type: str, value):
+    if param_type.startswith(ARRAY_TYPE_PREFIX):
+        element_type = param_type[len(ARRAY_TYPE_PREFIX):]
+        result = [_typed_value_to_kwarg(element_type, element) for element in value]
+    elif param_type == STRUCT_TYPE:
+        result = typed_params_to_kwargs(value)
+    else:
+        result = value
+    return result
 
 
 def _convert_value_int(value) -> int:
     if isinstance(value, int):
         result = value
     elif isinstance(value, str):
-        if value.startswith('0x') or value.startswith('-0x'):
+        if value.startswith(('0x', '-0x')):
             result = int(value, 16)
         else:
             result = int(value)
@@ -74,10 +255,136 @@ def _convert_value_address(value) -> 'Address':
 def _convert_value_bytes(value) -> bytes:
     # as JSON format doesn't accept bytes type, don't check if is instance of bytes.
     if isinstance(value, str):
-        if value.startswith('0x'):
-            result = bytes.fromhex(value[2:])
-        else:
-            result = bytes.fromhex(value)
+        result = bytes.fromhex(value[2:] if value.startswith('0x') else value)
     else:
         raise IconScoreException("type and value's actual type are not match.")
     return result
+
+
+_VALUE_CONVERTERS = {
+    "int": _convert_value_int,
+    "str": _convert_value_string,
+    "bool": _convert_value_bool,
+    "Address": _convert_value_address,
+    "bytes": _convert_value_bytes
+}
+
+
+# converted params are stored as a sequence of (name, type, value) and each of them is encoded
+# as a length prefix followed by the bytes. value's bytes depend on the type
+TYPED_PARAM_LENGTH_BYTES = 2
+TYPED_PARAM_BYTE_ORDER = "big"
+
+
+def encode_typed_params(typed_params: list) -> bytes:
+    # typed_params: list of (name, type, converted value)
+    encoded_params = b""
+    for name, param_type, value in typed_params:
+        encoded_params += _encode_with_length(name.encode("utf-8"))
+        encoded_params += _encode_with_length(param_type.encode("utf-8"))
+        encoded_params += _encode_with_length(_typed_value_to_bytes(param_type, value))
+    return encoded_params
+
+
+def decode_typed_params(buf: bytes) -> dict:
+    # returns kwargs which can be passed to the method directly
+    return {name: _typed_value_from_bytes(param_type, value) for name, param_type, value in _iter_typed_params(buf)}
+
+
+def decode_typed_params_to_params(buf: bytes) -> list:
+    # returns params in the format of the transaction's 'params'(list of {"name": name, "type": type, "value": value}),
+    # which are converted to the same typed params again. values are formatted like the JSON-RPC(e.g. int as hex)
+    return [{"name": name, "type": param_type, "value": _typed_value_to_param_value(param_type, value)}
+            for name, param_type, value in _iter_typed_params(buf)]
+
+
+def _iter_typed_params(buf: bytes):
+    # yields (name, type, encoded value) of each typed param
+    offset = 0
+    while offset < len(buf):
+        name, offset = _decode_with_length(buf, offset)
+        param_type, offset = _decode_with_length(buf, offset)
+        value, offset = _decode_with_length(buf, offset)
+        yield name.decode(), param_type.decode(), value
+
+
+def _encode_with_length(buf: bytes) -> bytes:
+    return len(buf).to_bytes(TYPED_PARAM_LENGTH_BYTES, TYPED_PARAM_BYTE_ORDER) + buf
+
+
+def _decode_with_length(buf: bytes, offset: int) -> tuple:
+    length = int.from_bytes(buf[offset: offset + TYPED_PARAM_LENGTH_BYTES], TYPED_PARAM_BYTE_ORDER)
+    offset += TYPED_PARAM_LENGTH_BYTES
+    return buf[offset: offset + length], offset + length
+
+
+def _typed_value_to_bytes(param_type: str, value) -> bytes:
+    # array is encoded as a sequence of its elements with length prefix, and struct is encoded like the params
+    if param_type.startswith(ARRAY_TYPE_PREFIX):
+        element_type = param_type[len(ARRAY_TYPE_PREFIX):]
+        result = b"".join(_encode_with_length(_typed_value_to_bytes(element_type, element)) for element in value)
+    elif param_type == STRUCT_TYPE:
+        result = encode_typed_params(value)
+    else:
+        result = _get_typed_value_codec(param_type)[0](value)
+    return result
+
+
+def _typed_value_from_bytes(param_type: str, buf: bytes):
+    if param_type.startswith(ARRAY_TYPE_PREFIX):
+        element_type = param_type[len(ARRAY_TYPE_PREFIX):]
+        result = []
+        offset = 0
+        while offset < len(buf):
+            element, offset = _decode_with_length(buf, offset)
+            result.append(_typed_value_from_bytes(element_type, element))
+    elif param_type == STRUCT_TYPE:
+        result = decode_typed_params(buf)
+    else:
+        result = _get_typed_value_codec(param_type)[1](buf)
+    return result
+
+
+def _typed_value_to_param_value(param_type: str, buf: bytes):
+    if param_type.startswith(ARRAY_TYPE_PREFIX):
+        element_type = param_type[len(ARRAY_TYPE_PREFIX):]
+        result = []
+        offset = 0
+        while offset < len(buf):
+            element, offset = _decode_with_length(buf, offset)
+            result.append(_typed_value_to_param_value(element_type, element))
+    elif param_type == STRUCT_TYPE:
+        result = decode_typed_params_to_params(buf)
+    else:
+        result = _typed_value_from_bytes(param_type, buf)
+        if param_type in ("int", "bool"):
+            result = hex(result)
+        elif param_type == "Address":
+            result = str(result)
+        elif param_type == "bytes":
+            result = "0x" + result.hex()
+    return result
+
+
+def _get_typed_value_codec(param_type: str) -> tuple:
+    codec = _TYPED_VALUE_CODECS.get(param_type)
+    if codec is None:
+        raise IconScoreException(
+            f"{param_type} is not supported type (only int, str, bool, Address, bytes, struct and arrays of them "
+            f"are supported)")
+    return codec
+
+
+# (encoder, decoder) of each type
+_TYPED_VALUE_CODECS = {
+    "int": (lambda value: value.to_bytes((value.bit_length() + 8) // 8, TYPED_PARAM_BYTE_ORDER, signed=True),
+            lambda buf: int.from_bytes(buf, TYPED_PARAM_BYTE_ORDER, signed=True)),
+    "str": (lambda value: value.encode("utf-8"),
+            lambda buf: buf.decode()),
+    "bool": (lambda value: int(value).to_bytes(1, TYPED_PARAM_BYTE_ORDER),
+             lambda buf: bool(buf[0])),
+    "Address": (lambda value: value.to_bytes(),
+                lambda buf: Address.from_bytes(buf)),
+    "bytes": (lambda value: value,
+              lambda buf: buf)
+}
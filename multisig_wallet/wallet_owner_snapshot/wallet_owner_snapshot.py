@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+
+# owner index history's layout(see encode_owner_index_history)
+_OWNER_INDEX_BYTES = 1
+_OWNER_EPOCH_BYTES = 4
+_NO_OWNER_INDEX = 0xff
+
+
+def encode_owner_index_history(owner_index_history: dict) -> bytes:
+    """Encodes the index history of each wallet owner index
+
+    :param owner_index_history: index -> list of (owner epoch, previous index) of the wallet owner at the index,
+        newest first. the previous index is None if the wallet owner wasn't a wallet owner before the owner epoch
+    :return: for each index in ascending order, the index and the entry count(1 byte each) followed by the entries.
+        each entry is the owner epoch(4 bytes, big endian) and the previous index(1 byte, 0xff if None)
+    """
+    buf = bytearray()
+    for idx in sorted(owner_index_history):
+        entries = owner_index_history[idx]
+        buf += bytes([idx, len(entries)])
+        for owner_epoch, previous_idx in entries:
+            buf += owner_epoch.to_bytes(_OWNER_EPOCH_BYTES, "big")
+            buf.append(_NO_OWNER_INDEX if previous_idx is None else previous_idx)
+    return bytes(buf)
+
+
+def decode_owner_index_history(buf: bytes) -> dict:
+    owner_index_history = {}
+    offset = 0
+    while offset < len(buf):
+        idx, entry_count = buf[offset], buf[offset + 1]
+        offset += 2
+        entries = []
+        for _ in range(entry_count):
+            owner_epoch = int.from_bytes(buf[offset: offset + _OWNER_EPOCH_BYTES], "big")
+            previous_idx = buf[offset + _OWNER_EPOCH_BYTES]
+            entries.append((owner_epoch, None if previous_idx == _NO_OWNER_INDEX else previous_idx))
+            offset += _OWNER_EPOCH_BYTES + _OWNER_INDEX_BYTES
+        owner_index_history[idx] = entries
+    return owner_index_history
+
+
+class WalletOwnerSnapshot:
+    """
+    Read-only view of the wallet owners, the requirement, the owner epoch and the owner index history
+    during one external call.
+    Each value is read from the state DB at most once and reused by the following accesses,
+    so the snapshot must be discarded when the wallet owners or the requirement are changed.
+    """
+
+    def __init__(self, wallet_owners: ArrayDB, wallet_owner_index: DictDB, required: VarDB, owner_epoch: VarDB,
+                 owner_index_history: VarDB):
+        self._wallet_owners_db = wallet_owners
+        self._wallet_owner_index_db = wallet_owner_index
+        self._required_db = required
+        self._owner_epoch_db = owner_epoch
+        self._owner_index_history_db = owner_index_history
+
+        self._wallet_owners = None
+        self._wallet_owner_count = None
+        # _wallet_owner_index's value is None if the address is not a wallet owner
+        self._wallet_owner_index = {}
+        self._required = None
+        self._owner_epoch = None
+        self._owner_index_history = None
+
+    @property
+    def wallet_owners(self) -> list:
+        if self._wallet_owners is None:
+            self._wallet_owners = list(self._wallet_owners_db)
+            self._wallet_owner_count = len(self._wallet_owners)
+            self._wallet_owner_index = {wallet_owner: idx for idx, wallet_owner in enumerate(self._wallet_owners)}
+        return self._wallet_owners
+
+    @property
+    def wallet_owner_count(self) -> int:
+        if self._wallet_owner_count is None:
+            self._wallet_owner_count = len(self._wallet_owners_db)
+        return self._wallet_owner_count
+
+    @property
+    def required(self) -> int:
+        if self._required is None:
+            self._required = self._required_db.get()
+        return self._required
+
+    @property
+    def owner_epoch(self) -> int:
+        if self._owner_epoch is None:
+            self._owner_epoch = self._owner_epoch_db.get()
+        return self._owner_epoch
+
+    @property
+    def owner_index_history(self) -> dict:
+        # see encode_owner_index_history. don't modify the returned dict
+        if self._owner_index_history is None:
+            buf = self._owner_index_history_db.get()
+            self._owner_index_history = {} if buf is None else decode_owner_index_history(buf)
+        return self._owner_index_history
+
+    def get_wallet_owners(self, offset: int, count: int) -> list:
+        if self._wallet_owners is not None:
+            return self._wallet_owners[offset: offset + count]
+
+        # read wallet owners until the last requested index only
+        wallet_owners = []
+        for idx, wallet_owner in enumerate(self._wallet_owners_db):
+            if idx >= offset + count:
+                break
+            if idx >= offset:
+                wallet_owners.append(wallet_owner)
+        return wallet_owners
+
+    def index_of(self, wallet_owner: Address) -> int:
+        # returns None if wallet_owner is not a wallet owner
+        if wallet_owner not in self._wallet_owner_index and self._wallet_owners is None:
+            if wallet_owner in self._wallet_owner_index_db:
+                self._wallet_owner_index[wallet_owner] = self._wallet_owner_index_db[wallet_owner]
+            else:
+                self._wallet_owner_index[wallet_owner] = None
+        return self._wallet_owner_index.get(wallet_owner)
+
+    def contains(self, wallet_owner: Address) -> bool:
+        return self.index_of(wallet_owner) is not None
@@ -20,6 +20,7 @@ import sys
 from iconcommons.logger import Logger
 from iconservice.base.address import Address, AddressPrefix
 from iconservice.icon_constant import DATA_BYTE_ORDER
+from secp256k1 import PrivateKey
 
 TEST_ROOT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../'))
 
@@ -44,6 +45,20 @@ def create_address(prefix: int = 0, data: bytes=None) -> 'Address':
     return Address(AddressPrefix(prefix), hash_value[-20:])
 
 
+def create_key_pair() -> tuple:
+    # returns a private key and the address of it, which can be used as a wallet owner signing data
+    private_key = PrivateKey()
+    public_key = private_key.pubkey.serialize(compressed=False)
+    return private_key, Address(AddressPrefix.EOA, hashlib.sha3_256(public_key[1:]).digest()[-20:])
+
+
+def sign_recoverable(private_key: 'PrivateKey', msg_hash: bytes) -> bytes:
+    # returns signature(64 bytes) + recovery id(1 byte)
+    signature = private_key.ecdsa_sign_recoverable(msg_hash, raw=True)
+    serialized_signature, recovery_id = private_key.ecdsa_recoverable_serialize(signature)
+    return serialized_signature + bytes([recovery_id])
+
+
 def create_hash_256(data: bytes=None) -> bytes:
     if data is None:
         max_int = sys.maxsize
@@ -0,0 +1 @@
+from .multisig_wallet import MultiSigWallet
\ No newline at end of file
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+import unittest
+from time import perf_counter
+
+from tests import create_address, create_key_pair, sign_recoverable
+from tests.test_integrate_base import TestIntegrateBase
+
+ICX_FACTOR = 10 ** 18
+
+# the benchmark takes long as it submits tens of thousands of transactions, so it runs only when
+# MULTISIG_BENCHMARK is set. the report is written to MULTISIG_BENCHMARK_REPORT
+# (default: benchmark_report.json in the temporary directory, not to leave it in the working tree)
+BENCHMARK_ENABLED = bool(os.environ.get("MULTISIG_BENCHMARK"))
+BENCHMARK_REPORT_PATH = os.environ.get("MULTISIG_BENCHMARK_REPORT",
+                                       os.path.join(tempfile.gettempdir(), "benchmark_report.json"))
+
+WALLET_OWNER_COUNTS = (1, 10, 25, 50)
+TRANSACTION_COUNTS = (10, 1000, 10000)
+# number of transactions submitted in a block while filling the wallet
+FILL_BLOCK_SIZE = 500
+BATCH_SIZE = 10
+
+
+@unittest.skipUnless(BENCHMARK_ENABLED, "set MULTISIG_BENCHMARK to run the benchmark")
+class TestBenchmark(TestIntegrateBase):
+    def setUp(self):
+        super().setUp()
+        self.results = []
+
+    def _make_query_request(self, method: str, params: dict) -> dict:
+        return {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": method,
+                "params": params
+            }
+        }
+
+    def _make_wallet_call_tx(self, addr_from: 'Address', method: str, params: dict) -> dict:
+        return self._make_score_call_tx(addr_from=addr_from,
+                                        addr_to=self.multisig_score_addr,
+                                        method=method,
+                                        params=params)
+
+    def _make_submit_tx(self, params: dict) -> dict:
+        # transaction submitted by the first wallet owner(confirmed by the submission)
+        return self._make_wallet_call_tx(self.wallet_owners[0], 'submitTransaction', params)
+
+    def _make_wallet_method_params(self, method: str, params: list) -> dict:
+        return {'_destination': str(self.multisig_score_addr),
+                '_method': method,
+                '_params': json.dumps(params)}
+
+    def _make_send_icx_params(self, value: int = 0) -> dict:
+        return {'_destination': str(self.receiver), '_value': hex(value)}
+
+    def _invoke(self, tx_list: list) -> list:
+        prev_block, tx_results = self._make_and_req_block(tx_list)
+        self._write_precommit_state(prev_block)
+        for tx_result in tx_results:
+            self.assertEqual(int(True), tx_result.status)
+        return tx_results
+
+    def _get_transaction_count(self) -> int:
+        return self._query(self._make_query_request("getTransactionCount", {}))
+
+    def _submit(self, params_list: list) -> list:
+        # submits the transactions(not measured), and returns their ids
+        transaction_count = self._get_transaction_count()
+        self._invoke([self._make_submit_tx(params) for params in params_list])
+        return list(range(transaction_count, transaction_count + len(params_list)))
+
+    def _submit_and_execute(self, params: dict):
+        # submits and confirms the transaction(not measured) which is executed by the confirmations
+        transaction_id = self._submit([params])[0]
+        if self.required > 1:
+            self._invoke([self._make_wallet_call_tx(self.wallet_owners[1], 'confirmTransaction',
+                                                    {'_transactionId': hex(transaction_id)})])
+
+    def _record(self, method: str, readonly: bool, step_used, elapsed_time: float, reads: int, writes: int):
+        self.results.append({"walletOwnerCount": self.wallet_owner_count,
+                             "transactionCount": self.transaction_count,
+                             "method": method,
+                             "readonly": readonly,
+                             "stepUsed": step_used,
+                             "time": elapsed_time,
+                             "reads": reads,
+                             "writes": writes})
+
+    def _measure_invoke(self, method: str, tx: dict, expected_event: str = None):
+        # expected_event: signature of the event the measured path must emit(e.g. 'Execution(int)'),
+        # so that the measurement of the execution path doesn't silently measure a shorter path
+        def invoke():
+            start = perf_counter()
+            tx_result = self._invoke([tx])[0]
+            return tx_result, perf_counter() - start
+
+        (tx_result, elapsed_time), reads, writes = self._count_storage_access(self.multisig_score_addr, invoke)
+        if expected_event is not None:
+            self.assertIn(expected_event, [event_log.indexed[0] for event_log in tx_result.event_logs])
+        self._record(method, False, tx_result.step_used, elapsed_time, reads, writes)
+
+    def _measure_query(self, label: str, method: str, params: dict):
+        # steps are not counted on queries
+        query_request = self._make_query_request(method, params)
+
+        def query():
+            start = perf_counter()
+            self._query(query_request)
+            return perf_counter() - start
+
+        elapsed_time, reads, writes = self._count_storage_access(self.multisig_score_addr, query)
+        self._record(label, True, None, elapsed_time, reads, writes)
+
+    def _deploy_wallet(self, wallet_owner_count: int):
+        # the first two wallet owners sign the transactions for submitTransactionWithSignatures
+        self.key_pairs = [create_key_pair() for _ in range(min(2, wallet_owner_count))]
+        self.wallet_owners = [address for _, address in self.key_pairs] + \
+                             [create_address() for _ in range(wallet_owner_count - len(self.key_pairs))]
+        self.wallet_owner_count = wallet_owner_count
+        self.required = len(self.key_pairs)
+        self.receiver = create_address()
+        self.multisig_score_addr = self._deploy_multisig_wallet_with_owners(self.wallet_owners, self.required)
+
+    def _fill_transactions(self, transaction_count: int):
+        # submitted transactions stay pending unless the requirement is 1
+        remaining_count = transaction_count - self._get_transaction_count()
+        while remaining_count > 0:
+            block_size = min(FILL_BLOCK_SIZE, remaining_count)
+            self._invoke([self._make_submit_tx(self._make_send_icx_params()) for _ in range(block_size)])
+            remaining_count -= block_size
+        self.transaction_count = transaction_count
+
+    def _measure_external_methods(self):
+        # transactions of the wallet which requires only one confirmation are executed by the submission
+        submission_event = 'Execution(int)' if self.required < 2 else 'Submission(int)'
+        self._measure_invoke('submitTransaction', self._make_submit_tx(self._make_send_icx_params()),
+                             submission_event)
+
+        self._measure_invoke('submitTransactions', self._make_wallet_call_tx(
+            self.wallet_owners[0], 'submitTransactions',
+            {'_transactions': json.dumps([self._make_send_icx_params() for _ in range(BATCH_SIZE)])}),
+            submission_event)
+
+        self._measure_invoke('submitMultiCallTransaction', self._make_wallet_call_tx(
+            self.wallet_owners[0], 'submitMultiCallTransaction',
+            {'_calls': json.dumps([self._make_send_icx_params() for _ in range(BATCH_SIZE)])}),
+            submission_event)
+
+        signature_hash = self._query(self._make_query_request("getSignatureHash", self._make_send_icx_params()))
+        signatures = ",".join("0x" + sign_recoverable(private_key, signature_hash).hex()
+                              for private_key, _ in self.key_pairs)
+        params = dict(self._make_send_icx_params(), _signatures=signatures)
+        self._measure_invoke('submitTransactionWithSignatures', self._make_wallet_call_tx(
+            self.wallet_owners[0], 'submitTransactionWithSignatures', params), 'Execution(int)')
+
+        # the transaction sending more icx than the wallet has fails to be executed
+        self._submit_and_execute(self._make_send_icx_params(10 ** 9 * ICX_FACTOR))
+        self._measure_invoke('executeTransaction', self._make_wallet_call_tx(
+            self.wallet_owners[0], 'executeTransaction', {'_transactionId': hex(self._get_transaction_count() - 1)}),
+            'ExecutionFailure(int)')
+
+        self._measure_invoke('fallback', self._make_icx_send_tx(self._genesis, self.multisig_score_addr, ICX_FACTOR),
+                             'Deposit(Address,int)')
+
+        if self.required < 2:
+            return
+
+        transaction_id = self._submit([self._make_send_icx_params()])[0]
+        self._measure_invoke('revokeTransaction', self._make_wallet_call_tx(
+            self.wallet_owners[0], 'revokeTransaction', {'_transactionId': hex(transaction_id)}),
+            'Revocation(Address,int)')
+
+        transaction_id = self._submit([self._make_send_icx_params()])[0]
+        self._measure_invoke('confirmTransaction', self._make_wallet_call_tx(
+            self.wallet_owners[1], 'confirmTransaction', {'_transactionId': hex(transaction_id)}), 'Execution(int)')
+
+        transaction_ids = self._submit([self._make_send_icx_params() for _ in range(BATCH_SIZE)])
+        self._measure_invoke('confirmTransactions', self._make_wallet_call_tx(
+            self.wallet_owners[1], 'confirmTransactions',
+            {'_transactionIds': ",".join(hex(tx_id) for tx_id in transaction_ids)}), 'Execution(int)')
+
+        # methods only callable by the wallet are measured by the confirmations executing them
+        self._measure_wallet_method('changeRequirement', [
+            {'name': '_required', 'type': 'int', 'value': self.required}])
+
+        self._measure_wallet_method('changeDeferredExecution', [
+            {'name': '_deferredExecution', 'type': 'bool', 'value': '0x1'}])
+        transaction_id = self._submit([self._make_send_icx_params()])[0]
+        self._invoke([self._make_wallet_call_tx(self.wallet_owners[1], 'confirmTransaction',
+                                                {'_transactionId': hex(transaction_id)})])
+        self._measure_invoke('executeReady', self._make_wallet_call_tx(
+            self.wallet_owners[0], 'executeReady', {'_max': hex(BATCH_SIZE)}), 'Execution(int)')
+        # turning off deferred execution is queued as well
+        self._submit_and_execute(self._make_wallet_method_params('changeDeferredExecution', [
+            {'name': '_deferredExecution', 'type': 'bool', 'value': '0x0'}]))
+        self._invoke([self._make_wallet_call_tx(self.wallet_owners[0], 'executeReady', {'_max': hex(1)})])
+
+        if self.wallet_owner_count > 2:
+            # keep the wallet owner count by adding the removed wallet owner again
+            removed_wallet_owner = self.wallet_owners[-1]
+            self._measure_wallet_method('removeWalletOwner', [
+                {'name': '_walletOwner', 'type': 'Address', 'value': str(removed_wallet_owner)}])
+            self._measure_wallet_method('addWalletOwner', [
+                {'name': '_walletOwner', 'type': 'Address', 'value': str(removed_wallet_owner)}])
+
+            new_wallet_owner = create_address()
+            self._measure_wallet_method('replaceWalletOwner', [
+                {'name': '_walletOwner', 'type': 'Address', 'value': str(self.wallet_owners[-1])},
+                {'name': '_newWalletOwner', 'type': 'Address', 'value': str(new_wallet_owner)}])
+            self.wallet_owners[-1] = new_wallet_owner
+
+    def _measure_wallet_method(self, method: str, params: list):
+        transaction_id = self._submit([self._make_wallet_method_params(method, params)])[0]
+        self._measure_invoke(method, self._make_wallet_call_tx(
+            self.wallet_owners[1], 'confirmTransaction', {'_transactionId': hex(transaction_id)}), 'Execution(int)')
+
+    def _measure_readonly_methods(self):
+        transaction_id = hex(self._get_transaction_count() - 1)
+        transaction_ids = ",".join(hex(tx_id) for tx_id in range(min(BATCH_SIZE, self._get_transaction_count())))
+        paging_params = {"_offset": "0x0", "_count": "0x32"}
+
+        # (label in the report, method, params)
+        for label, method, params in (
+                ("getStateVersion", "getStateVersion", {}),
+                ("getSignatureNonce", "getSignatureNonce", {}),
+                ("getSignatureHash", "getSignatureHash", self._make_send_icx_params()),
+                ("getDeferredExecution", "getDeferredExecution", {}),
+                ("getReadyTransactionCount", "getReadyTransactionCount", {}),
+                ("getReadyTransactions", "getReadyTransactions", {"_count": "0x32"}),
+                ("getRequirement", "getRequirement", {}),
+                ("getTransactionInfo", "getTransactionInfo", {"_transactionId": transaction_id}),
+                ("getTransactionInfos", "getTransactionInfos", {"_transactionIds": transaction_ids}),
+                ("getTransactionListByCursor", "getTransactionListByCursor", {"_count": "0x32"}),
+                ("getTransactionsAwaitingConfirmation", "getTransactionsAwaitingConfirmation",
+                 {"_walletOwner": str(self.wallet_owners[-1]), "_count": "0x32"}),
+                ("getWalletSnapshot", "getWalletSnapshot", {}),
+                ("getTransactionsExecuted", "getTransactionsExecuted", {"_transactionId": transaction_id}),
+                ("checkIfWalletOwner", "checkIfWalletOwner", {"_walletOwner": str(self.wallet_owners[-1])}),
+                ("getWalletOwnerCount", "getWalletOwnerCount", {}),
+                ("getWalletOwners", "getWalletOwners", paging_params),
+                ("getConfirmationCount", "getConfirmationCount", {"_transactionId": transaction_id}),
+                ("getConfirmations", "getConfirmations", dict(paging_params, _transactionId=transaction_id)),
+                ("getTransactionCount", "getTransactionCount", {}),
+                ("getTransactionList", "getTransactionList", paging_params),
+                ("getTransactionList(pending)", "getTransactionList", dict(paging_params, _executed="0x0")),
+                ("getTransactionList(executed)", "getTransactionList", dict(paging_params, _pending="0x0"))):
+            self._measure_query(label, method, params)
+
+    def test_benchmark(self):
+        for wallet_owner_count in WALLET_OWNER_COUNTS:
+            self._deploy_wallet(wallet_owner_count)
+            for transaction_count in TRANSACTION_COUNTS:
+                self._fill_transactions(transaction_count)
+                self._measure_readonly_methods()
+                self._measure_external_methods()
+
+        report = {"walletOwnerCounts": WALLET_OWNER_COUNTS,
+                  "transactionCounts": TRANSACTION_COUNTS,
+                  "results": self.results}
+        with open(BENCHMARK_REPORT_PATH, "w") as report_file:
+            json.dump(report, report_file, indent=2)
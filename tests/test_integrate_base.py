@@ -27,6 +27,7 @@ from iconservice.base.address import ZERO_SCORE_ADDRESS
 from iconservice.icon_constant import ConfigKey
 from iconservice.icon_service_engine import IconServiceEngine
 from iconservice.base.address import Address
+from iconservice.database.db import IconScoreDatabase
 from tests import create_address, create_tx_hash, create_block_hash
 from tests import root_clear, create_timestamp, get_score_path
 from tests.in_memory_zip import InMemoryZip
@@ -192,6 +193,22 @@ class TestIntegrateBase(TestCase):
 
         return multisig_score_addr
 
+    def _deploy_multisig_wallet_with_owners(self, wallet_owners: list, required: int,
+                                            deferred_execution: bool = False) -> 'Address':
+        tx = self._make_deploy_tx("",
+                                  "multisig_wallet",
+                                  self._addr_array[0],
+                                  ZERO_SCORE_ADDRESS,
+                                  deploy_params={"_walletOwners": ",".join(str(owner) for owner in wallet_owners),
+                                                 "_required": hex(required),
+                                                 "_deferredExecution": hex(deferred_execution)})
+
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+
+        self.assertEqual(tx_results[0].status, int(True))
+        return tx_results[0].score_address
+
     # Todo: need to be refactoring
     def _deploy_multisig_wallet_and_token_score(self, token_total_supply:int, token_owner: Address):
         tx1 = self._make_deploy_tx("",
@@ -411,6 +428,34 @@ class TestIntegrateBase(TestCase):
         response = self.icon_service_engine.query(method, request)
         return response
 
+    @staticmethod
+    def _count_storage_access(score_address: 'Address', func: callable) -> tuple:
+        """Calls func and counts the storage reads and writes of the SCORE while func is running
+
+        :return: (func's return value, read count, write count)
+        """
+        access_count = {"get": 0, "put": 0, "delete": 0}
+        original_methods = {name: getattr(IconScoreDatabase, name) for name in access_count}
+
+        def make_counting_method(name: str):
+            original_method = original_methods[name]
+
+            def counting_method(score_db: 'IconScoreDatabase', *args, **kwargs):
+                if score_db.address == score_address:
+                    access_count[name] += 1
+                return original_method(score_db, *args, **kwargs)
+            return counting_method
+
+        for method_name in access_count:
+            setattr(IconScoreDatabase, method_name, make_counting_method(method_name))
+        try:
+            result = func()
+        finally:
+            for method_name, original_method in original_methods.items():
+                setattr(IconScoreDatabase, method_name, original_method)
+
+        return result, access_count["get"], access_count["put"] + access_count["delete"]
+
     def _create_invalid_block(self, block_height: int = None) -> 'Block':
         if block_height is None:
             block_height: int = self._block_height
@@ -345,3 +345,165 @@ class TestIntegrateConfirmTransaction(TestIntegrateBase):
         expected_execution_event_log = 'ExecutionFailure(int)'
         actual_execution_event_log = tx_results[0].event_logs[1].indexed[0]
         self.assertEqual(expected_execution_event_log, actual_execution_event_log)
+
+    def test_confirm_transactions(self):
+        # submit 3 transactions
+        change_requirement_params = [
+            {'name': '_required',
+             'type': 'int',
+             'value': 2}
+        ]
+        submit_tx_params = {'_destination': str(self.multisig_score_addr),
+                            '_method': 'changeRequirement',
+                            '_params': json.dumps(change_requirement_params),
+                            '_description': 'change requirements from 2 to 2'}
+        submit_txs = []
+        for _ in range(3):
+            submit_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                                 addr_to=self.multisig_score_addr,
+                                                 method='submitTransaction',
+                                                 params=submit_tx_params
+                                                 )
+            submit_txs.append(submit_tx)
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x01'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block(submit_txs + [confirm_tx])
+        self._write_precommit_state(prev_block)
+        for tx_result in tx_results:
+            self.assertEqual(int(True), tx_result.status)
+
+        # failure case: atomic confirmation including already confirmed transaction(should be reverted)
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransactions',
+                                              params={'_transactionIds': '0x0,0x1,0x2', '_atomic': '0x1'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([confirm_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(False), tx_results[0].status)
+
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": "getConfirmationCount",
+                "params": {'_transactionId': "0x00"}
+            }
+        }
+        self.assertEqual(1, self._query(query_request))
+
+        # success case: already confirmed and not existing transactions should be skipped
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransactions',
+                                              params={'_transactionIds': '0x0,0x1,0x2,0x3'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([confirm_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(True), tx_results[0].status)
+
+        # transaction 0: Confirmation, RequirementChange, Execution
+        # transaction 1: ConfirmationFailure
+        # transaction 2: Confirmation, RequirementChange, Execution
+        # transaction 3: ConfirmationFailure
+        event_logs = tx_results[0].event_logs
+        self.assertEqual(8, len(event_logs))
+        self.assertEqual("Execution(int)", event_logs[2].indexed[0])
+        self.assertEqual("ConfirmationFailure(Address,int,str)", event_logs[3].indexed[0])
+        self.assertEqual(1, event_logs[3].indexed[2])
+        self.assertEqual("Execution(int)", event_logs[6].indexed[0])
+        self.assertEqual("ConfirmationFailure(Address,int,str)", event_logs[7].indexed[0])
+        self.assertEqual(3, event_logs[7].indexed[2])
+
+        for transaction_id in ("0x0", "0x1", "0x2"):
+            query_request = {
+                "version": self._version,
+                "from": self._admin,
+                "to": self.multisig_score_addr,
+                "dataType": "call",
+                "data": {
+                    "method": "getTransactionsExecuted",
+                    "params": {'_transactionId': transaction_id}
+                }
+            }
+            self.assertEqual(True, self._query(query_request))
+
+    def test_confirm_executed_transaction(self):
+        # transaction 0: send 0 icx(executed by the confirmation of owner2)
+        # transaction 1: change requirement from 2 to 3(executed by the confirmation of owner2)
+        change_requirement_params = [
+            {'name': '_required',
+             'type': 'int',
+             'value': 3}
+        ]
+        submit_txs = [self._make_score_call_tx(addr_from=self._owner1,
+                                               addr_to=self.multisig_score_addr,
+                                               method='submitTransaction',
+                                               params={'_destination': str(self._owner4), '_value': '0x0'}),
+                      self._make_score_call_tx(addr_from=self._owner1,
+                                               addr_to=self.multisig_score_addr,
+                                               method='submitTransaction',
+                                               params={'_destination': str(self.multisig_score_addr),
+                                                       '_method': 'changeRequirement',
+                                                       '_params': json.dumps(change_requirement_params)})]
+        confirm_txs = [self._make_score_call_tx(addr_from=self._owner2,
+                                                addr_to=self.multisig_score_addr,
+                                                method='confirmTransaction',
+                                                params={'_transactionId': hex(transaction_id)})
+                       for transaction_id in range(2)]
+        prev_block, tx_results = self._make_and_req_block(submit_txs + confirm_txs)
+        self._write_precommit_state(prev_block)
+        for tx_result in tx_results:
+            self.assertEqual(int(True), tx_result.status)
+
+        # failure case: confirming the executed transaction which has 2 of 3 confirmations
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner3,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x0'})
+        prev_block, tx_results = self._make_and_req_block([confirm_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(False), tx_results[0].status)
+        self.assertEqual("transaction id '0' has already been executed", tx_results[0].failure.message)
+
+        # failure case: the executed transaction is skipped in confirming several transactions
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner3,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransactions',
+                                              params={'_transactionIds': '0x0'})
+        prev_block, tx_results = self._make_and_req_block([confirm_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(True), tx_results[0].status)
+        self.assertEqual(1, len(tx_results[0].event_logs))
+        self.assertEqual("ConfirmationFailure(Address,int,str)", tx_results[0].event_logs[0].indexed[0])
+
+        # the transactions are counted once as executed
+        for pending, executed, expected_count in ((True, True, 2), (True, False, 0), (False, True, 2)):
+            query_request = {
+                "version": self._version,
+                "from": self._admin,
+                "to": self.multisig_score_addr,
+                "dataType": "call",
+                "data": {
+                    "method": "getTransactionCount",
+                    "params": {'_pending': hex(pending), '_executed': hex(executed)}
+                }
+            }
+            self.assertEqual(expected_count, self._query(query_request))
+
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": "getTransactionList",
+                "params": {'_offset': '0x0', '_count': '0xa', '_pending': '0x0'}
+            }
+        }
+        self.assertEqual([0, 1], [tx["_transactionId"] for tx in self._query(query_request)])
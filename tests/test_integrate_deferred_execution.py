@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+from tests.test_integrate_base import TestIntegrateBase
+
+ICX_FACTOR = 10 ** 18
+
+
+class TestIntegrateDeferredExecution(TestIntegrateBase):
+    def setUp(self):
+        super().setUp()
+        self.multisig_score_addr = \
+            self._deploy_multisig_wallet_with_owners([self._owner1, self._owner2, self._owner3], 2,
+                                                     deferred_execution=True)
+
+        icx_send_tx = self._make_icx_send_tx(self._genesis, self.multisig_score_addr, 100 * ICX_FACTOR)
+        prev_block, tx_results = self._make_and_req_block([icx_send_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(True), tx_results[0].status)
+
+    def _make_query_request(self, method: str, params: dict) -> dict:
+        return {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": method,
+                "params": params
+            }
+        }
+
+    def _submit_and_confirm_send_icx_transactions(self, values: list) -> list:
+        # submit transactions which send icx to owner4 and confirm them, returns the results of the confirmations
+        tx_list = []
+        transaction_count = self._query(self._make_query_request("getTransactionCount", {}))
+        for tx_id, value in enumerate(values, transaction_count):
+            tx_list.append(self._make_score_call_tx(addr_from=self._owner1,
+                                                    addr_to=self.multisig_score_addr,
+                                                    method='submitTransaction',
+                                                    params={'_destination': str(self._owner4),
+                                                            '_value': hex(value * ICX_FACTOR)}
+                                                    ))
+            tx_list.append(self._make_score_call_tx(addr_from=self._owner2,
+                                                    addr_to=self.multisig_score_addr,
+                                                    method='confirmTransaction',
+                                                    params={'_transactionId': hex(tx_id)}
+                                                    ))
+        prev_block, tx_results = self._make_and_req_block(tx_list)
+        self._write_precommit_state(prev_block)
+        for tx_result in tx_results:
+            self.assertEqual(int(True), tx_result.status)
+        return tx_results[1::2]
+
+    def _execute_ready(self, max_count: int) -> 'TransactionResult':
+        # executeReady can be called by anyone
+        execute_ready_tx = self._make_score_call_tx(addr_from=self._owner4,
+                                                    addr_to=self.multisig_score_addr,
+                                                    method='executeReady',
+                                                    params={'_max': hex(max_count)}
+                                                    )
+        prev_block, tx_results = self._make_and_req_block([execute_ready_tx])
+        self._write_precommit_state(prev_block)
+        return tx_results[0]
+
+    def _get_ready_transaction_ids(self) -> list:
+        query_request = self._make_query_request("getReadyTransactions", {"_count": "0xa"})
+        return [tx["_transactionId"] for tx in self._query(query_request)["_transactions"]]
+
+    def _assert_owner4_balance(self, expected_icx: int):
+        response = self._query({"address": self._owner4}, "icx_getBalance")
+        self.assertEqual(expected_icx * ICX_FACTOR, response)
+
+    def test_execute_ready(self):
+        self.assertEqual(True, self._query(self._make_query_request("getDeferredExecution", {})))
+
+        # confirmed transactions are queued instead of being executed
+        confirm_tx_results = self._submit_and_confirm_send_icx_transactions([10, 20, 30])
+        for tx_id, tx_result in enumerate(confirm_tx_results):
+            self.assertEqual("Confirmation(Address,int)", tx_result.event_logs[0].indexed[0])
+            self.assertEqual("ExecutionDeferral(int)", tx_result.event_logs[1].indexed[0])
+            self.assertEqual(tx_id, tx_result.event_logs[1].indexed[1])
+        self._assert_owner4_balance(0)
+        self.assertEqual([0, 1, 2], self._get_ready_transaction_ids())
+
+        # success case: executes queued transactions in the order they were queued
+        tx_result = self._execute_ready(2)
+        self.assertEqual(int(True), tx_result.status)
+        self._assert_owner4_balance(30)
+        self.assertEqual([2], self._get_ready_transaction_ids())
+        self.assertEqual(1, self._query(self._make_query_request("getReadyTransactionCount", {})))
+
+        # revoked transaction is removed from the queue
+        revoke_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                             addr_to=self.multisig_score_addr,
+                                             method='revokeTransaction',
+                                             params={'_transactionId': '0x02'}
+                                             )
+        prev_block, tx_results = self._make_and_req_block([revoke_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(True), tx_results[0].status)
+        self.assertEqual([], self._get_ready_transaction_ids())
+
+        # failed transaction is removed from the queue, and the failure is recorded
+        self._submit_and_confirm_send_icx_transactions([1000])
+        self.assertEqual([3], self._get_ready_transaction_ids())
+        tx_result = self._execute_ready(10)
+        self.assertEqual(int(True), tx_result.status)
+        self.assertEqual("ExecutionFailure(int)", tx_result.event_logs[0].indexed[0])
+        self.assertEqual([], self._get_ready_transaction_ids())
+        response = self._query(self._make_query_request("getTransactionInfo", {"_transactionId": "0x03"}))
+        self.assertEqual(1, response["_executionFailureCount"])
+
+        # failure case: exceed the allowed amount
+        tx_result = self._execute_ready(101)
+        self.assertEqual(int(False), tx_result.status)
+        self.assertEqual("requests that exceed the allowed amount", tx_result.failure.message)
+
+    def test_execute_ready_after_raising_requirement(self):
+        # queue the transaction raising the requirement to 3 first, and the transactions sending icx after it
+        change_requirement_params = [
+            {'name': '_required',
+             'type': 'int',
+             'value': 3}
+        ]
+        submit_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                             addr_to=self.multisig_score_addr,
+                                             method='submitTransaction',
+                                             params={'_destination': str(self.multisig_score_addr),
+                                                     '_method': 'changeRequirement',
+                                                     '_params': json.dumps(change_requirement_params)}
+                                             )
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x00'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([submit_tx, confirm_tx])
+        self._write_precommit_state(prev_block)
+        for tx_result in tx_results:
+            self.assertEqual(int(True), tx_result.status)
+        self._submit_and_confirm_send_icx_transactions([10, 20])
+        self.assertEqual([0, 1, 2], self._get_ready_transaction_ids())
+
+        # success case: the transactions queued with 2 confirmations are removed from the queue without being executed
+        tx_result = self._execute_ready(10)
+        self.assertEqual(int(True), tx_result.status)
+        self.assertEqual(3, self._query(self._make_query_request("getRequirement", {})))
+        cancellation_logs = [event_log for event_log in tx_result.event_logs
+                             if event_log.indexed[0] == "ExecutionCancellation(int)"]
+        self.assertEqual([1, 2], [event_log.indexed[1] for event_log in cancellation_logs])
+        self.assertEqual([], self._get_ready_transaction_ids())
+        self._assert_owner4_balance(0)
+
+        # removed transactions stay pending, and are queued again when their confirmations meet the requirement
+        self.assertEqual(2, self._query(self._make_query_request("getTransactionCount", {"_executed": "0x0"})))
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner3,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x02'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([confirm_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual("ExecutionDeferral(int)", tx_results[0].event_logs[1].indexed[0])
+        self.assertEqual([2], self._get_ready_transaction_ids())
+
+        tx_result = self._execute_ready(10)
+        self.assertEqual(int(True), tx_result.status)
+        self._assert_owner4_balance(20)
+
+    def test_get_ready_transactions_by_cursor(self):
+        self._submit_and_confirm_send_icx_transactions([10, 20, 30])
+
+        query_request = self._make_query_request("getReadyTransactions", {"_count": "0x2"})
+        response = self._query(query_request)
+        self.assertEqual([0, 1], [tx["_transactionId"] for tx in response["_transactions"]])
+        self.assertEqual(2, response["_nextCursor"])
+
+        query_request = self._make_query_request("getReadyTransactions", {"_count": "0x2", "_cursor": "0x2"})
+        response = self._query(query_request)
+        self.assertEqual([2], [tx["_transactionId"] for tx in response["_transactions"]])
+        self.assertNotIn("_nextCursor", response)
+
+    def test_change_deferred_execution(self):
+        # failure case: only wallet can change the deferred execution mode
+        change_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                             addr_to=self.multisig_score_addr,
+                                             method='changeDeferredExecution',
+                                             params={'_deferredExecution': '0x0'}
+                                             )
+        prev_block, tx_results = self._make_and_req_block([change_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(False), tx_results[0].status)
+
+        # queue a transaction before turning off deferred execution
+        self._submit_and_confirm_send_icx_transactions([10])
+
+        change_deferred_execution_params = [
+            {'name': '_deferredExecution',
+             'type': 'bool',
+             'value': '0x0'}
+        ]
+        submit_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                             addr_to=self.multisig_score_addr,
+                                             method='submitTransaction',
+                                             params={'_destination': str(self.multisig_score_addr),
+                                                     '_method': 'changeDeferredExecution',
+                                                     '_params': json.dumps(change_deferred_execution_params)}
+                                             )
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x01'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([submit_tx, confirm_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(True), tx_results[0].status)
+        self.assertEqual(int(True), tx_results[1].status)
+        self.assertEqual("ExecutionDeferral(int)", tx_results[1].event_logs[1].indexed[0])
+
+        # change of the deferred execution mode is queued as well
+        tx_result = self._execute_ready(10)
+        self.assertEqual(int(True), tx_result.status)
+        self.assertEqual(False, self._query(self._make_query_request("getDeferredExecution", {})))
+        self._assert_owner4_balance(10)
+
+        # confirmed transaction is executed immediately after turning off deferred execution
+        confirm_tx_results = self._submit_and_confirm_send_icx_transactions([20])
+        self.assertEqual("Execution(int)", confirm_tx_results[0].event_logs[-1].indexed[0])
+        self._assert_owner4_balance(30)
+        self.assertEqual([], self._get_ready_transaction_ids())
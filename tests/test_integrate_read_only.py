@@ -15,6 +15,7 @@
 # limitations under the License.
 
 import json
+from time import perf_counter
 
 from iconservice.base.exception import IconScoreException
 
@@ -82,6 +83,254 @@ class TestIntegrateReadOnly(TestIntegrateBase):
         actual_transaction_data = self._query(query_request)
         self.assertEqual({}, actual_transaction_data)
 
+    def _submit_change_requirement_transactions(self, transaction_count: int):
+        submit_txs = []
+        for idx in range(0, transaction_count):
+            change_requirement_params = [
+                {'name': '_required',
+                 'type': 'int',
+                 'value': 2}
+            ]
+            submit_tx_params = {'_destination': str(self.multisig_score_addr),
+                                '_method': 'changeRequirement',
+                                '_params': json.dumps(change_requirement_params),
+                                '_description': f'get transaction test id:{idx}'}
+
+            submit_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                                 addr_to=self.multisig_score_addr,
+                                                 method='submitTransaction',
+                                                 params=submit_tx_params
+                                                 )
+            submit_txs.append(submit_tx)
+
+        prev_block, tx_results = self._make_and_req_block(submit_txs)
+        self._write_precommit_state(prev_block)
+
+    def _make_query_request(self, method: str, params: dict) -> dict:
+        return {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": method,
+                "params": params
+            }
+        }
+
+    def test_get_transaction_infos(self):
+        self._submit_change_requirement_transactions(3)
+
+        # success case: not existing transaction's info should be empty dict
+        query_request = self._make_query_request("getTransactionInfos", {"_transactionIds": "0x2, 0, 0x5"})
+        actual_transaction_infos = self._query(query_request)
+        self.assertEqual(3, len(actual_transaction_infos))
+        self.assertEqual(2, actual_transaction_infos[0]["_transactionId"])
+        self.assertEqual('get transaction test id:2', actual_transaction_infos[0]["_description"])
+        self.assertEqual(0, actual_transaction_infos[1]["_transactionId"])
+        self.assertEqual(str(self.multisig_score_addr), actual_transaction_infos[1]["_destination"])
+        self.assertEqual({}, actual_transaction_infos[2])
+
+        # each info should be the same as the result of getTransactionInfo
+        query_request = self._make_query_request("getTransactionInfo", {"_transactionId": "0x2"})
+        self.assertEqual(self._query(query_request), actual_transaction_infos[0])
+
+        # failure case: invalid transaction id
+        query_request = self._make_query_request("getTransactionInfos", {"_transactionIds": "0x1,one"})
+        expected_massage = "invalid transaction id format"
+        try:
+            actual_massage = self._query(query_request)
+        except IconScoreException as e:
+            actual_massage = e.message
+        self.assertEqual(expected_massage, actual_massage)
+
+        # failure case: request more than 200 transactions
+        transaction_ids = ",".join(hex(tx_id) for tx_id in range(201))
+        query_request = self._make_query_request("getTransactionInfos", {"_transactionIds": transaction_ids})
+        expected_massage = "requests that exceed the allowed amount"
+        try:
+            actual_massage = self._query(query_request)
+        except IconScoreException as e:
+            actual_massage = e.message
+        self.assertEqual(expected_massage, actual_massage)
+
+    def test_compare_get_transaction_infos_with_single_queries(self):
+        transaction_count = 200
+        self._submit_change_requirement_transactions(transaction_count)
+
+        start = perf_counter()
+        single_query_results = []
+        for tx_id in range(transaction_count):
+            query_request = self._make_query_request("getTransactionInfo", {"_transactionId": hex(tx_id)})
+            single_query_results.append(self._query(query_request))
+        single_query_time = perf_counter() - start
+
+        transaction_ids = ",".join(hex(tx_id) for tx_id in range(transaction_count))
+        start = perf_counter()
+        query_request = self._make_query_request("getTransactionInfos", {"_transactionIds": transaction_ids})
+        batch_query_result = self._query(query_request)
+        batch_query_time = perf_counter() - start
+
+        self.assertEqual(single_query_results, batch_query_result)
+        # the batch query saves the overhead of the query per transaction
+        self.assertLess(batch_query_time, single_query_time)
+
+    def _get_transaction_ids_by_cursor(self, params: dict) -> tuple:
+        query_request = self._make_query_request("getTransactionListByCursor", params)
+        response = self._query(query_request)
+        transaction_ids = [tx["_transactionId"] for tx in response["_transactions"]]
+        return transaction_ids, response.get("_nextCursor")
+
+    def test_get_transaction_list_by_cursor(self):
+        self._submit_change_requirement_transactions(10)
+
+        # execute transaction 7, 4, 1 in order
+        confirm_txs = []
+        for tx_id in (7, 4, 1):
+            confirm_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                                  addr_to=self.multisig_score_addr,
+                                                  method='confirmTransaction',
+                                                  params={'_transactionId': hex(tx_id)}
+                                                  )
+            confirm_txs.append(confirm_tx)
+        prev_block, tx_results = self._make_and_req_block(confirm_txs)
+        self._write_precommit_state(prev_block)
+
+        # success case: all transactions(newest first)
+        self.assertEqual(([9, 8, 7, 6], 5), self._get_transaction_ids_by_cursor({"_count": "4"}))
+        self.assertEqual(([5, 4, 3, 2], 1), self._get_transaction_ids_by_cursor({"_count": "4", "_cursor": "5"}))
+        self.assertEqual(([1, 0], None), self._get_transaction_ids_by_cursor({"_count": "4", "_cursor": "1"}))
+
+        # success case: pending transactions(oldest first)
+        params = {"_count": "3", "_executed": "0", "_newestFirst": "0"}
+        self.assertEqual(([0, 2, 3], 5), self._get_transaction_ids_by_cursor(params))
+        params["_cursor"] = "5"
+        self.assertEqual(([5, 6, 8], 9), self._get_transaction_ids_by_cursor(params))
+        params["_cursor"] = "9"
+        self.assertEqual(([9], None), self._get_transaction_ids_by_cursor(params))
+
+        # success case: executed transactions(newest first, in the order of execution)
+        params = {"_count": "3", "_pending": "0"}
+        self.assertEqual(([1, 4, 7], None), self._get_transaction_ids_by_cursor(params))
+        params = {"_count": "2", "_pending": "0", "_newestFirst": "0"}
+        self.assertEqual(([7, 4], 1), self._get_transaction_ids_by_cursor(params))
+
+        # failure case: cursor which is not a pending transaction
+        params = {"_count": "3", "_executed": "0", "_cursor": "4"}
+        query_request = self._make_query_request("getTransactionListByCursor", params)
+        expected_massage = "invalid cursor"
+        try:
+            actual_massage = self._query(query_request)
+        except IconScoreException as e:
+            actual_massage = e.message
+        self.assertEqual(expected_massage, actual_massage)
+
+    def test_get_wallet_snapshot(self):
+        # success case: wallet without transactions
+        query_request = self._make_query_request("getWalletSnapshot", {})
+        actual_snapshot = self._query(query_request)
+        self.assertEqual([str(self._owner1), str(self._owner2), str(self._owner3)], actual_snapshot["_walletOwners"])
+        self.assertEqual(2, actual_snapshot["_requirement"])
+        self.assertEqual(0, actual_snapshot["_pendingTransactionCount"])
+        self.assertEqual(0, actual_snapshot["_executedTransactionCount"])
+        self.assertEqual([], actual_snapshot["_pendingTransactions"])
+        self.assertNotIn("_latestTransactionId", actual_snapshot)
+
+        # success case: execute transaction 1 of 3 transactions
+        self._submit_change_requirement_transactions(3)
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x01'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([confirm_tx])
+        self._write_precommit_state(prev_block)
+
+        query_request = self._make_query_request("getWalletSnapshot", {"_pendingCount": "1"})
+        actual_snapshot = self._query(query_request)
+        self.assertEqual(2, actual_snapshot["_pendingTransactionCount"])
+        self.assertEqual(1, actual_snapshot["_executedTransactionCount"])
+        self.assertEqual(2, actual_snapshot["_latestTransactionId"])
+        self.assertEqual(1, len(actual_snapshot["_pendingTransactions"]))
+        self.assertEqual(2, actual_snapshot["_pendingTransactions"][0]["_transactionId"])
+        self.assertEqual(1, actual_snapshot["_pendingTransactions"][0]["_confirmationCount"])
+
+        # failure case: request more than 50 pending transactions
+        query_request = self._make_query_request("getWalletSnapshot", {"_pendingCount": "51"})
+        expected_massage = "requests that exceed the allowed amount"
+        try:
+            actual_massage = self._query(query_request)
+        except IconScoreException as e:
+            actual_massage = e.message
+        self.assertEqual(expected_massage, actual_massage)
+
+    def test_get_state_version(self):
+        query_request = self._make_query_request("getStateVersion", {})
+        self.assertEqual(0, self._query(query_request))
+
+        # submit transaction(submission and confirmation). the state version is increased once per transaction
+        self._submit_change_requirement_transactions(1)
+        state_version = self._query(query_request)
+        self.assertEqual(1, state_version)
+
+        # failure case: confirmation by non wallet owner should not change the state version
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner4,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x00'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([confirm_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(False, tx_results[0].status)
+        self.assertEqual(state_version, self._query(query_request))
+
+        # confirm and execute transaction
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x00'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([confirm_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(True, tx_results[0].status)
+        self.assertEqual(state_version + 1, self._query(query_request))
+
+        # failure case: the retried execution fails in the wallet method, which is reverted, but the failure
+        # is recorded and increases the state version
+        change_requirement_params = [
+            {'name': '_required',
+             'type': 'int',
+             'value': 10}
+        ]
+        submit_tx_params = {'_destination': str(self.multisig_score_addr),
+                            '_method': 'changeRequirement',
+                            '_params': json.dumps(change_requirement_params),
+                            '_description': 'change requirement to invalid value'}
+        submit_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                             addr_to=self.multisig_score_addr,
+                                             method='submitTransaction',
+                                             params=submit_tx_params
+                                             )
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x01'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([submit_tx, confirm_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(state_version + 3, self._query(query_request))
+
+        execute_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                              addr_to=self.multisig_score_addr,
+                                              method='executeTransaction',
+                                              params={'_transactionId': '0x01'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([execute_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(True, tx_results[0].status)
+        self.assertEqual("ExecutionFailure(int)", tx_results[0].event_logs[0].indexed[0])
+        self.assertEqual(state_version + 4, self._query(query_request))
+
     def test_get_transaction_list_and_get_transaction_count(self):
         # success case: get transaction list
         submit_txs = []
@@ -198,6 +447,35 @@ class TestIntegrateReadOnly(TestIntegrateBase):
                 self.assertEqual(f'get transaction test id:{idx}', actual_tx["_description"])
                 idx += 2
 
+        # success case: filtered transaction list should be filled with matched transactions only
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": "getTransactionList",
+                "params": {"_offset": "5", "_count": "10", "_executed": "0"}
+            }
+        }
+        actual_tx_list = self._query(query_request)
+        expected_tx_ids = [idx for idx in range(11, 31, 2)]
+        self.assertEqual(expected_tx_ids, [actual_tx["_transactionId"] for actual_tx in actual_tx_list])
+
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": "getTransactionList",
+                "params": {"_offset": "20", "_count": "10", "_pending": "0"}
+            }
+        }
+        actual_tx_list = self._query(query_request)
+        expected_tx_ids = [idx for idx in range(40, 50, 2)]
+        self.assertEqual(expected_tx_ids, [actual_tx["_transactionId"] for actual_tx in actual_tx_list])
+
         # success case: get exceed transaction list
         query_request = {
             "version": self._version,
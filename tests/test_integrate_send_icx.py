@@ -14,6 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+
 from tests.test_integrate_base import TestIntegrateBase
 
 ICX_FACTOR = 10 ** 18
@@ -140,7 +142,8 @@ class TestIntegrateSendIcx(TestIntegrateBase):
                                               )
         prev_block, tx_results = self._make_and_req_block([confirm_tx])
         self._write_precommit_state(prev_block)
-        self.assertEqual(int(True), tx_results[0].status)
+        self.assertEqual(int(False), tx_results[0].status)
+        self.assertEqual("transaction id '0' has already been executed", tx_results[0].failure.message)
 
         # check the token score address' icx
         query_request = {
@@ -228,3 +231,203 @@ class TestIntegrateSendIcx(TestIntegrateBase):
         }
         response = self._query(query_request, "icx_getBalance")
         self.assertEqual(90 * ICX_FACTOR, response)
+
+    def test_send_icx_with_multi_call_transaction(self):
+        # deposit 100 icx to wallet SCORE
+        send_icx_value = 100 * ICX_FACTOR
+        self.deposit_icx_to_multisig_score(send_icx_value)
+
+        # success case: send 10 icx to owner4, 20 icx to owner5 and change requirement to 3 as one transaction
+        calls = [
+            {'_destination': str(self._owner4),
+             '_value': hex(10 * ICX_FACTOR)},
+            {'_destination': str(self._owner5),
+             '_value': hex(20 * ICX_FACTOR)},
+            {'_destination': str(self.multisig_score_addr),
+             '_method': 'changeRequirement',
+             '_params': [{'name': '_required', 'type': 'int', 'value': 3}]}
+        ]
+        submit_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                             addr_to=self.multisig_score_addr,
+                                             method='submitMultiCallTransaction',
+                                             params={'_calls': json.dumps(calls),
+                                                     '_description': 'multi-call transaction'}
+                                             )
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x00'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([submit_tx, confirm_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(True), tx_results[0].status)
+        self.assertEqual(int(True), tx_results[1].status)
+
+        for address, expected_icx in ((self._owner4, 10 * ICX_FACTOR),
+                                      (self._owner5, 20 * ICX_FACTOR),
+                                      (self.multisig_score_addr, 70 * ICX_FACTOR)):
+            response = self._query({"address": address}, "icx_getBalance")
+            self.assertEqual(expected_icx, response)
+
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": "getRequirement",
+                "params": {}
+            }
+        }
+        self.assertEqual(3, self._query(query_request))
+
+        # success case: the calls are shown as '_params' in the format of '_calls'
+        info_query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": "getTransactionInfo",
+                "params": {"_transactionId": "0x00"}
+            }
+        }
+        response = self._query(info_query_request)
+        self.assertEqual("executeMultiCall", response["_method"])
+        actual_calls = json.loads(response["_params"])
+        self.assertEqual([str(self._owner4), str(self._owner5), str(self.multisig_score_addr)],
+                         [call["_destination"] for call in actual_calls])
+        self.assertEqual([10 * ICX_FACTOR, 20 * ICX_FACTOR, 0], [call["_value"] for call in actual_calls])
+        self.assertEqual([{"name": "_required", "type": "int", "value": "0x3"}], json.loads(actual_calls[2]["_params"]))
+
+        # failure case: if any of the calls fails, icx sent by the other calls should be reverted
+        calls = [
+            {'_destination': str(self._owner4),
+             '_value': hex(5 * ICX_FACTOR)},
+            {'_destination': str(self.multisig_score_addr),
+             '_method': 'changeRequirement',
+             '_params': [{'name': '_required', 'type': 'int', 'value': 10}]}
+        ]
+        submit_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                             addr_to=self.multisig_score_addr,
+                                             method='submitMultiCallTransaction',
+                                             params={'_calls': json.dumps(calls)}
+                                             )
+        confirm_txs = [self._make_score_call_tx(addr_from=owner,
+                                                addr_to=self.multisig_score_addr,
+                                                method='confirmTransaction',
+                                                params={'_transactionId': '0x01'}
+                                                ) for owner in (self._owner2, self._owner3)]
+        prev_block, tx_results = self._make_and_req_block([submit_tx] + confirm_txs)
+        self._write_precommit_state(prev_block)
+        for tx_result in tx_results:
+            self.assertEqual(int(True), tx_result.status)
+        self.assertEqual("ExecutionFailure(int)", tx_results[2].event_logs[1].indexed[0])
+
+        for address, expected_icx in ((self._owner4, 10 * ICX_FACTOR),
+                                      (self.multisig_score_addr, 70 * ICX_FACTOR)):
+            response = self._query({"address": address}, "icx_getBalance")
+            self.assertEqual(expected_icx, response)
+        self.assertEqual(3, self._query(query_request))
+
+    def test_execute_transaction(self):
+        # submit and confirm transaction which send 10 icx to eoa without enough icx in the wallet
+        submit_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                             addr_to=self.multisig_score_addr,
+                                             method='submitTransaction',
+                                             params={'_destination': str(self._owner4),
+                                                     '_value': hex(10 * ICX_FACTOR)}
+                                             )
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x00'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([submit_tx, confirm_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(True), tx_results[0].status)
+        self.assertEqual(int(True), tx_results[1].status)
+        self.assertEqual("ExecutionFailure(int)", tx_results[1].event_logs[1].indexed[0])
+        failure_block_height = tx_results[1].block_height
+
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": "getTransactionInfo",
+                "params": {'_transactionId': '0x00'}
+            }
+        }
+        response = self._query(query_request)
+        self.assertEqual(0, response["_executed"])
+        self.assertEqual(1, response["_executionFailureCount"])
+        self.assertEqual(failure_block_height, response["_lastExecutionFailureHeight"])
+
+        # failure case: only wallet owners can execute the transaction
+        execute_tx = self._make_score_call_tx(addr_from=self._owner4,
+                                              addr_to=self.multisig_score_addr,
+                                              method='executeTransaction',
+                                              params={'_transactionId': '0x00'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([execute_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(False), tx_results[0].status)
+        self.assertEqual(f"{self._owner4} is not an owner of wallet", tx_results[0].failure.message)
+
+        # failure case: transaction which has not been fully confirmed can't be executed
+        submit_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                             addr_to=self.multisig_score_addr,
+                                             method='submitTransaction',
+                                             params={'_destination': str(self._owner4),
+                                                     '_value': hex(1 * ICX_FACTOR)}
+                                             )
+        execute_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                              addr_to=self.multisig_score_addr,
+                                              method='executeTransaction',
+                                              params={'_transactionId': '0x01'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([submit_tx, execute_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(True), tx_results[0].status)
+        self.assertEqual(int(False), tx_results[1].status)
+        self.assertEqual("transaction id '1' has not been fully confirmed yet", tx_results[1].failure.message)
+
+        # failure of the retry is recorded as well
+        execute_tx = self._make_score_call_tx(addr_from=self._owner3,
+                                              addr_to=self.multisig_score_addr,
+                                              method='executeTransaction',
+                                              params={'_transactionId': '0x00'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([execute_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(True), tx_results[0].status)
+        self.assertEqual("ExecutionFailure(int)", tx_results[0].event_logs[0].indexed[0])
+        failure_block_height = tx_results[0].block_height
+
+        response = self._query(query_request)
+        self.assertEqual(2, response["_executionFailureCount"])
+        self.assertEqual(failure_block_height, response["_lastExecutionFailureHeight"])
+
+        # success case: any wallet owner can retry the execution after depositing icx
+        self.deposit_icx_to_multisig_score(100 * ICX_FACTOR)
+        prev_block, tx_results = self._make_and_req_block([execute_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(True), tx_results[0].status)
+        self.assertEqual("Execution(int)", tx_results[0].event_logs[-1].indexed[0])
+
+        response = self._query(query_request)
+        self.assertEqual(1, response["_executed"])
+        self.assertEqual(2, response["_executionFailureCount"])
+
+        for address, expected_icx in ((self._owner4, 10 * ICX_FACTOR),
+                                      (self.multisig_score_addr, 90 * ICX_FACTOR)):
+            response = self._query({"address": address}, "icx_getBalance")
+            self.assertEqual(expected_icx, response)
+
+        # failure case: executed transaction can't be executed again
+        prev_block, tx_results = self._make_and_req_block([execute_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(False), tx_results[0].status)
+        self.assertEqual("transaction id '0' has already been executed", tx_results[0].failure.message)
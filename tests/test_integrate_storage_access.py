@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+from iconservice import ZERO_SCORE_ADDRESS
+
+from tests import create_address
+from tests.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateStorageAccess(TestIntegrateBase):
+    def _count_invoke_reads(self, score_address, tx) -> int:
+        def invoke():
+            prev_block, tx_results = self._make_and_req_block([tx])
+            self._write_precommit_state(prev_block)
+            self.assertEqual(int(True), tx_results[0].status)
+
+        _, read_count, _ = self._count_storage_access(score_address, invoke)
+        return read_count
+
+    def _count_invoke_writes(self, score_address, tx) -> int:
+        def invoke():
+            prev_block, tx_results = self._make_and_req_block([tx])
+            self._write_precommit_state(prev_block)
+            self.assertEqual(int(True), tx_results[0].status)
+
+        _, _, write_count = self._count_storage_access(score_address, invoke)
+        return write_count
+
+    def _count_query_reads(self, score_address, method: str, params: dict) -> int:
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": score_address,
+            "dataType": "call",
+            "data": {
+                "method": method,
+                "params": params
+            }
+        }
+        _, read_count, _ = self._count_storage_access(score_address, lambda: self._query(query_request))
+        return read_count
+
+    def _deploy_wallet(self, score_name: str, wallet_owners: list) -> 'Address':
+        # deploy params which both the current and the legacy wallet accept
+        deploy_params = {"_walletOwners": ",".join(str(owner) for owner in wallet_owners),
+                         "_required": "0x02"}
+        deploy_tx = self._make_deploy_tx("",
+                                         score_name,
+                                         self._addr_array[0],
+                                         ZERO_SCORE_ADDRESS,
+                                         deploy_params=deploy_params)
+        prev_block, tx_results = self._make_and_req_block([deploy_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(True), tx_results[0].status)
+        return tx_results[0].score_address
+
+    def _measure_storage_reads(self, wallet_owner_count: int, score_name: str = "multisig_wallet") -> dict:
+        wallet_owners = [self._owner1, self._owner2] + [create_address() for _ in range(wallet_owner_count - 2)]
+        multisig_score_addr = self._deploy_wallet(score_name, wallet_owners)
+
+        change_requirement_params = [
+            {'name': '_required',
+             'type': 'int',
+             'value': 2}
+        ]
+        submit_tx_params = {'_destination': str(multisig_score_addr),
+                            '_method': 'changeRequirement',
+                            '_params': json.dumps(change_requirement_params),
+                            '_description': 'change requirement 2 to 2'}
+        submit_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                             addr_to=multisig_score_addr,
+                                             method='submitTransaction',
+                                             params=submit_tx_params)
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                              addr_to=multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x00'})
+
+        reads = dict()
+        reads["submitTransaction"] = self._count_invoke_reads(multisig_score_addr, submit_tx)
+        reads["getConfirmationCount"] = self._count_query_reads(multisig_score_addr,
+                                                                "getConfirmationCount",
+                                                                {"_transactionId": "0x00"})
+        reads["checkIfWalletOwner"] = self._count_query_reads(multisig_score_addr,
+                                                              "checkIfWalletOwner",
+                                                              {"_walletOwner": str(wallet_owners[-1])})
+        reads["confirmTransaction"] = self._count_invoke_reads(multisig_score_addr, confirm_tx)
+        reads["getWalletOwners"] = self._count_query_reads(multisig_score_addr,
+                                                           "getWalletOwners",
+                                                           {"_offset": "0", "_count": "50"})
+        reads["getConfirmations"] = self._count_query_reads(multisig_score_addr,
+                                                            "getConfirmations",
+                                                            {"_offset": "0", "_count": "50", "_transactionId": "0x00"})
+        return reads
+
+    def _make_wallet_method_submit_tx(self, multisig_score_addr, method: str, params: list) -> 'Transaction':
+        submit_tx_params = {'_destination': str(multisig_score_addr),
+                            '_method': method,
+                            '_params': json.dumps(params),
+                            '_description': f'{method} test'}
+        return self._make_score_call_tx(addr_from=self._owner1,
+                                        addr_to=multisig_score_addr,
+                                        method='submitTransaction',
+                                        params=submit_tx_params)
+
+    def _measure_storage_writes(self, wallet_owner_count: int, pending_transaction_count: int) -> dict:
+        wallet_owners = [self._owner1, self._owner2] + [create_address() for _ in range(wallet_owner_count - 2)]
+        multisig_score_addr = self._deploy_multisig_wallet_with_owners(wallet_owners, 2)
+
+        change_requirement_params = [
+            {'name': '_required',
+             'type': 'int',
+             'value': 2}
+        ]
+        submit_txs = [self._make_wallet_method_submit_tx(multisig_score_addr, 'changeRequirement',
+                                                         change_requirement_params)
+                      for _ in range(pending_transaction_count)]
+        prev_block, tx_results = self._make_and_req_block(submit_txs)
+        self._write_precommit_state(prev_block)
+
+        writes = dict()
+        submit_tx = self._make_wallet_method_submit_tx(multisig_score_addr, 'changeRequirement',
+                                                       change_requirement_params)
+        writes["submitTransaction"] = self._count_invoke_writes(multisig_score_addr, submit_tx)
+
+        # each wallet method is executed by the confirmation of owner2
+        for method, params in (('addWalletOwner', [{'name': '_walletOwner',
+                                                    'type': 'Address',
+                                                    'value': str(create_address())}]),
+                               ('removeWalletOwner', [{'name': '_walletOwner',
+                                                       'type': 'Address',
+                                                       'value': str(wallet_owners[-1])}])):
+            submit_tx = self._make_wallet_method_submit_tx(multisig_score_addr, method, params)
+            prev_block, tx_results = self._make_and_req_block([submit_tx])
+            self._write_precommit_state(prev_block)
+            transaction_id = tx_results[0].event_logs[0].indexed[1]
+
+            confirm_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                                  addr_to=multisig_score_addr,
+                                                  method='confirmTransaction',
+                                                  params={'_transactionId': hex(transaction_id)})
+            writes[method] = self._count_invoke_writes(multisig_score_addr, confirm_tx)
+        return writes
+
+    def test_storage_writes_per_submission_and_owner_change(self):
+        # the pending transactions a wallet owner hasn't confirmed are found from the confirmations when queried,
+        # so neither the wallet owner count nor the pending transaction count costs writes
+        writes_3_owners = self._measure_storage_writes(3, 1)
+        writes_49_owners = self._measure_storage_writes(49, 20)
+        self.assertEqual(writes_3_owners, writes_49_owners)
+
+        self.assertLessEqual(writes_3_owners["submitTransaction"], 11)
+        for method in ("addWalletOwner", "removeWalletOwner"):
+            self.assertLessEqual(writes_3_owners[method], 20)
+
+    def test_awaiting_transaction_reads_after_owner_changes(self):
+        extra_wallet_owner = create_address()
+        multisig_score_addr = self._deploy_multisig_wallet_with_owners([self._owner1, self._owner2,
+                                                                        extra_wallet_owner], 2)
+
+        # 10 pending transactions confirmed by the extra wallet owner at index 2
+        change_requirement_params = [
+            {'name': '_required',
+             'type': 'int',
+             'value': 2}
+        ]
+        submit_tx_params = {'_destination': str(multisig_score_addr),
+                            '_method': 'changeRequirement',
+                            '_params': json.dumps(change_requirement_params),
+                            '_description': 'change requirement 2 to 2'}
+        submit_txs = [self._make_score_call_tx(addr_from=extra_wallet_owner,
+                                               addr_to=multisig_score_addr,
+                                               method='submitTransaction',
+                                               params=submit_tx_params) for _ in range(10)]
+        prev_block, tx_results = self._make_and_req_block(submit_txs)
+        self._write_precommit_state(prev_block)
+        pending_transaction_ids = [tx_result.event_logs[0].indexed[1] for tx_result in tx_results]
+
+        awaiting_params = {"_walletOwner": str(self._owner2), "_count": "50"}
+        reads_before_owner_changes = self._count_query_reads(multisig_score_addr,
+                                                             "getTransactionsAwaitingConfirmation", awaiting_params)
+
+        # each round adds a new wallet owner and removes the extra wallet owner, so that the new wallet owner is
+        # moved to index 2, where the first extra wallet owner has confirmed the pending transactions
+        for _ in range(5):
+            new_wallet_owner = create_address()
+            for method, wallet_owner in (('addWalletOwner', new_wallet_owner),
+                                         ('removeWalletOwner', extra_wallet_owner)):
+                params = [{'name': '_walletOwner',
+                           'type': 'Address',
+                           'value': str(wallet_owner)}]
+                submit_tx = self._make_wallet_method_submit_tx(multisig_score_addr, method, params)
+                prev_block, tx_results = self._make_and_req_block([submit_tx])
+                self._write_precommit_state(prev_block)
+                transaction_id = tx_results[0].event_logs[0].indexed[1]
+
+                confirm_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                                      addr_to=multisig_score_addr,
+                                                      method='confirmTransaction',
+                                                      params={'_transactionId': hex(transaction_id)})
+                prev_block, tx_results = self._make_and_req_block([confirm_tx])
+                self._write_precommit_state(prev_block)
+                self.assertEqual("Execution(int)", tx_results[0].event_logs[-1].indexed[0])
+            extra_wallet_owner = new_wallet_owner
+
+            # the confirmations of the removed wallet owner are discarded rather than moved to the new wallet owner
+            for wallet_owner in (self._owner1, self._owner2, new_wallet_owner):
+                query_request = {
+                    "version": self._version,
+                    "from": self._admin,
+                    "to": multisig_score_addr,
+                    "dataType": "call",
+                    "data": {
+                        "method": "getTransactionsAwaitingConfirmation",
+                        "params": {"_walletOwner": str(wallet_owner), "_count": "50"}
+                    }
+                }
+                response = self._query(query_request)
+                self.assertEqual(pending_transaction_ids, [tx["_transactionId"] for tx in response["_transactions"]])
+
+            # remapping the confirmations reads the owner index history and the wallet owner count once
+            # however many wallet owner changes there have been
+            reads = self._count_query_reads(multisig_score_addr, "getTransactionsAwaitingConfirmation", awaiting_params)
+            self.assertEqual(reads_before_owner_changes + 2, reads)
+
+    def test_storage_reads_per_method(self):
+        reads_3_owners = self._measure_storage_reads(3)
+        reads_50_owners = self._measure_storage_reads(50)
+
+        # the wallet before the storage was optimized(see tests/legacy_multisig_wallet) reads every wallet owner
+        # in most methods, so each method of the wallet with the maximum wallet owners should not read more
+        legacy_reads_50_owners = self._measure_storage_reads(50, "tests/legacy_multisig_wallet")
+        for method, read_count in reads_50_owners.items():
+            self.assertLessEqual(read_count, legacy_reads_50_owners[method], method)
+
+        # reads of the methods which check the wallet owners or the confirmations should not depend on the owner count.
+        # checkIfWalletOwner reads the owner index only, and getConfirmationCount reads the confirmation mask and
+        # the owner epoch to remap it
+        for method in ("getConfirmationCount", "checkIfWalletOwner"):
+            self.assertLessEqual(reads_3_owners[method], 2, method)
+            self.assertEqual(reads_3_owners[method], reads_50_owners[method], method)
+
+        # submission doesn't read the wallet owners but the submitter
+        self.assertEqual(reads_3_owners["submitTransaction"], reads_50_owners["submitTransaction"])
+
+        # listing methods should read each wallet owner only once
+        for method in ("getWalletOwners", "getConfirmations"):
+            self.assertEqual(reads_3_owners[method] + 47, reads_50_owners[method], method)
+
+    def test_filtered_transaction_list_reads(self):
+        multisig_score_addr = self._deploy_multisig_wallet()
+
+        change_requirement_params = [
+            {'name': '_required',
+             'type': 'int',
+             'value': 2}
+        ]
+        submit_tx_params = {'_destination': str(multisig_score_addr),
+                            '_method': 'changeRequirement',
+                            '_params': json.dumps(change_requirement_params),
+                            '_description': 'change requirement 2 to 2'}
+        submit_txs = [self._make_score_call_tx(addr_from=self._owner1,
+                                               addr_to=multisig_score_addr,
+                                               method='submitTransaction',
+                                               params=submit_tx_params) for _ in range(200)]
+        prev_block, tx_results = self._make_and_req_block(submit_txs)
+        self._write_precommit_state(prev_block)
+
+        # execute the even transactions, so that pending and executed transactions are interleaved
+        confirm_txs = [self._make_score_call_tx(addr_from=self._owner2,
+                                                addr_to=multisig_score_addr,
+                                                method='confirmTransaction',
+                                                params={'_transactionId': hex(tx_id)}) for tx_id in range(0, 200, 2)]
+        prev_block, tx_results = self._make_and_req_block(confirm_txs)
+        self._write_precommit_state(prev_block)
+        for tx_result in tx_results:
+            self.assertEqual(int(True), tx_result.status)
+
+        # executed transactions are read by the position, so the offset doesn't cost any read
+        executed_reads_at_head = self._count_query_reads(multisig_score_addr, "getTransactionList",
+                                                         {"_offset": "0", "_count": "10", "_pending": "0"})
+        executed_reads_at_offset = self._count_query_reads(multisig_score_addr, "getTransactionList",
+                                                           {"_offset": "90", "_count": "10", "_pending": "0"})
+        self.assertEqual(executed_reads_at_head, executed_reads_at_offset)
+
+        # pending transactions are found by the counts per bucket of ids instead of walking 90 transactions
+        # from the head, which would read at least once per transaction
+        pending_reads_at_head = self._count_query_reads(multisig_score_addr, "getTransactionList",
+                                                        {"_offset": "0", "_count": "10", "_executed": "0"})
+        pending_reads_at_offset = self._count_query_reads(multisig_score_addr, "getTransactionList",
+                                                          {"_offset": "90", "_count": "10", "_executed": "0"})
+        self.assertLess(pending_reads_at_offset - pending_reads_at_head, 90)
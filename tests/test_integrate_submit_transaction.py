@@ -83,7 +83,7 @@ class TestIntegrateSubmitTransaction(TestIntegrateBase):
                                             )
         prev_block, tx_results = self._make_and_req_block([valid_tx])
         self._write_precommit_state(prev_block)
-        expected_revert_massage = "type and value's actual type are not match. (32)"
+        expected_revert_massage = "invalid 'params': _required: type and value's actual type are not match."
         actual_revert_massage = tx_results[0].failure.message
         self.assertEqual(expected_revert_massage, actual_revert_massage)
 
@@ -106,7 +106,82 @@ class TestIntegrateSubmitTransaction(TestIntegrateBase):
         prev_block, tx_results = self._make_and_req_block([valid_tx])
         self._write_precommit_state(prev_block)
         expected_revert_massage = \
-            "dict is not supported type (only int, str, bool, Address, bytes are supported) (32)"
+            "invalid 'params': _required: dict is not supported type " \
+            "(only int, str, bool, Address, bytes, struct and arrays of them are supported)"
+        actual_revert_massage = tx_results[0].failure.message
+        self.assertEqual(expected_revert_massage, actual_revert_massage)
+
+        # success case: array and struct params
+        batch_params = [
+            {'name': '_tos',
+             'type': '[]Address',
+             'value': [str(self._owner1), str(self._owner2)]},
+            {'name': '_values',
+             'type': '[]int',
+             'value': ['0x1', '0x2']},
+            {'name': '_option',
+             'type': 'struct',
+             'value': [{'name': 'memo', 'type': 'str', 'value': 'payroll'}]}
+        ]
+        submit_tx_params = {'_destination': str(self.multisig_score_addr),
+                            '_method': 'transferBatch',
+                            '_params': json.dumps(batch_params),
+                            '_description': 'transfer tokens to owner1 and owner2'}
+
+        valid_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                            addr_to=self.multisig_score_addr,
+                                            method='submitTransaction',
+                                            params=submit_tx_params
+                                            )
+        prev_block, tx_results = self._make_and_req_block([valid_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(True), tx_results[0].status)
+
+        # failure case: params nested too deeply
+        nested_params = [
+            {'name': '_values',
+             'type': '[][][][]int',
+             'value': []}
+        ]
+        submit_tx_params['_params'] = json.dumps(nested_params)
+
+        invalid_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                              addr_to=self.multisig_score_addr,
+                                              method='submitTransaction',
+                                              params=submit_tx_params
+                                              )
+        prev_block, tx_results = self._make_and_req_block([invalid_tx])
+        self._write_precommit_state(prev_block)
+        expected_revert_massage = "invalid 'params': _values: params can't be nested more than 3 times"
+        actual_revert_massage = tx_results[0].failure.message
+        self.assertEqual(expected_revert_massage, actual_revert_massage)
+
+        # failure case: every invalid param is reported
+        invalid_params = [
+            {'name': '_required',
+             'type': 'int',
+             'value': 'three'},
+            {'name': '_tos',
+             'type': '[]Address',
+             'value': [str(self._owner1), 10]},
+            {'type': 'int',
+             'value': 3}
+        ]
+        submit_tx_params = {'_destination': str(self.multisig_score_addr),
+                            '_method': 'changeRequirement',
+                            '_params': json.dumps(invalid_params),
+                            '_description': 'change requirements 2 to 3'}
+
+        invalid_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                              addr_to=self.multisig_score_addr,
+                                              method='submitTransaction',
+                                              params=submit_tx_params
+                                              )
+        prev_block, tx_results = self._make_and_req_block([invalid_tx])
+        self._write_precommit_state(prev_block)
+        expected_revert_massage = "invalid 'params': _required: invalid literal for int() with base 10: 'three'; " \
+                                  "_tos[1]: type and value's actual type are not match.; " \
+                                  "[2]: param should have name, type and value"
         actual_revert_massage = tx_results[0].failure.message
         self.assertEqual(expected_revert_massage, actual_revert_massage)
 
@@ -126,7 +201,7 @@ class TestIntegrateSubmitTransaction(TestIntegrateBase):
         prev_block, tx_results = self._make_and_req_block([valid_tx])
         self._write_precommit_state(prev_block)
 
-        expected_revert_massage = "can not convert 'params' json data, check the 'params' parameter"
+        expected_revert_massage = "'params' should be a json array"
         actual_revert_massage = tx_results[0].failure.message
         self.assertEqual(expected_revert_massage, actual_revert_massage)
 
@@ -261,3 +336,131 @@ class TestIntegrateSubmitTransaction(TestIntegrateBase):
 
         response = self._query(query_request)
         self.assertEqual({}, response)
+
+    def test_submit_transactions(self):
+        valid_params = [
+            {'name': '_required',
+             'type': 'int',
+             'value': 3}
+        ]
+        invalid_params = [
+            {'name': '_required',
+             'type': 'dict',
+             'value': "{'test':'test'}"}
+        ]
+        transactions = [
+            {'_destination': str(self.multisig_score_addr),
+             '_method': 'changeRequirement',
+             '_params': json.dumps(valid_params),
+             '_description': 'valid transaction1'},
+            {'_destination': str(self.multisig_score_addr),
+             '_method': 'changeRequirement',
+             '_params': valid_params,
+             '_description': 'valid transaction2'},
+            {'_destination': str(self._owner4),
+             '_value': hex(10),
+             '_description': 'valid transaction3'}
+        ]
+
+        # failure case: any invalid transaction reverts all the transactions
+        invalid_transactions = transactions + [{'_destination': str(self.multisig_score_addr),
+                                                '_method': 'changeRequirement',
+                                                '_params': json.dumps(invalid_params),
+                                                '_description': 'invalid transaction'}]
+        submit_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                             addr_to=self.multisig_score_addr,
+                                             method='submitTransactions',
+                                             params={'_transactions': json.dumps(invalid_transactions)}
+                                             )
+        prev_block, tx_results = self._make_and_req_block([submit_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(False), tx_results[0].status)
+
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": "getTransactionCount",
+                "params": {}
+            }
+        }
+        self.assertEqual(0, self._query(query_request))
+
+        # success case: submit 3 transactions(should be confirmed by owner1)
+        submit_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                             addr_to=self.multisig_score_addr,
+                                             method='submitTransactions',
+                                             params={'_transactions': json.dumps(transactions)}
+                                             )
+        prev_block, tx_results = self._make_and_req_block([submit_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(True), tx_results[0].status)
+        self.assertEqual(3, self._query(query_request))
+
+        for transaction_id, transaction in enumerate(transactions):
+            query_request = {
+                "version": self._version,
+                "from": self._admin,
+                "to": self.multisig_score_addr,
+                "dataType": "call",
+                "data": {
+                    "method": "getTransactionInfo",
+                    "params": {"_transactionId": hex(transaction_id)}
+                }
+            }
+            response = self._query(query_request)
+            self.assertEqual(transaction['_description'], response['_description'])
+
+            query_request["data"] = {
+                "method": "getConfirmations",
+                "params": {"_offset": "0", "_count": "10", "_transactionId": hex(transaction_id)}
+            }
+            self.assertEqual([str(self._owner1)], self._query(query_request))
+
+    def test_submit_transactions_with_null_params(self):
+        # success case: null optional fields take their default values, same as submitTransaction
+        transactions = [{'_destination': str(self._owner4),
+                         '_method': None,
+                         '_params': None,
+                         '_value': hex(10),
+                         '_description': 'send icx with null params'},
+                        {'_destination': str(self._owner4),
+                         '_value': None,
+                         '_description': None}]
+        submit_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                             addr_to=self.multisig_score_addr,
+                                             method='submitTransactions',
+                                             params={'_transactions': json.dumps(transactions)}
+                                             )
+        prev_block, tx_results = self._make_and_req_block([submit_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(True), tx_results[0].status)
+
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": "getTransactionInfos",
+                "params": {"_transactionIds": "0x0,0x1"}
+            }
+        }
+        response = self._query(query_request)
+        self.assertEqual([("", "", 10, 'send icx with null params'), ("", "", 0, "")],
+                         [(info['_method'], info['_params'], info['_value'], info['_description'])
+                          for info in response])
+
+        # failure case: invalid destination reverts all the transactions
+        transactions = [{'_destination': str(self._owner4)}, {'_destination': 'hx1234', '_value': None}]
+        submit_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                             addr_to=self.multisig_score_addr,
+                                             method='submitTransactions',
+                                             params={'_transactions': json.dumps(transactions)}
+                                             )
+        prev_block, tx_results = self._make_and_req_block([submit_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(False), tx_results[0].status)
+        self.assertEqual("invalid transaction at index 1: invalid transaction format", tx_results[0].failure.message)
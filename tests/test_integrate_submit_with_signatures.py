@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+
+from tests import create_key_pair, sign_recoverable
+from tests.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateSubmitWithSignatures(TestIntegrateBase):
+    def setUp(self):
+        super().setUp()
+        self.key_pairs = [create_key_pair() for _ in range(3)]
+        self.multisig_score_addr = \
+            self._deploy_multisig_wallet_with_owners([address for _, address in self.key_pairs], 2)
+
+        change_requirement_params = [
+            {'name': '_required',
+             'type': 'int',
+             'value': 3}
+        ]
+        self.submit_tx_params = {'_destination': str(self.multisig_score_addr),
+                                 '_method': 'changeRequirement',
+                                 '_params': json.dumps(change_requirement_params),
+                                 '_description': 'change requirement to 3'}
+
+    def _get_signature_hash(self) -> bytes:
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": "getSignatureHash",
+                "params": self.submit_tx_params
+            }
+        }
+        return self._query(query_request)
+
+    def _submit_with_signatures(self, private_keys: list, signature_hash: bytes) -> 'TransactionResult':
+        signatures = ",".join("0x" + sign_recoverable(private_key, signature_hash).hex()
+                              for private_key in private_keys)
+        params = dict(self.submit_tx_params)
+        params["_signatures"] = signatures
+        # anyone who has the signatures can submit the transaction
+        submit_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                             addr_to=self.multisig_score_addr,
+                                             method='submitTransactionWithSignatures',
+                                             params=params
+                                             )
+        prev_block, tx_results = self._make_and_req_block([submit_tx])
+        self._write_precommit_state(prev_block)
+        return tx_results[0]
+
+    def _get_requirement(self) -> int:
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": "getRequirement",
+                "params": {}
+            }
+        }
+        return self._query(query_request)
+
+    def test_signature_hash(self):
+        # the signature hash is computed from the documented layout only(see getSignatureHash in README.md)
+        def encode_field(field: str) -> bytes:
+            encoded_field = field.encode()
+            return len(encoded_field).to_bytes(2, "big") + encoded_field
+
+        network_id = 1
+        signature_nonce = 0
+        value = 0
+        expected_signature_hash = hashlib.sha3_256(b"multisig_wallet_signature" +
+                                                   network_id.to_bytes(4, "big") +
+                                                   str(self.multisig_score_addr).encode() +
+                                                   signature_nonce.to_bytes(32, "big") +
+                                                   self.submit_tx_params['_destination'].encode() +
+                                                   value.to_bytes(32, "big") +
+                                                   encode_field(self.submit_tx_params['_method']) +
+                                                   encode_field(self.submit_tx_params['_params']) +
+                                                   encode_field(self.submit_tx_params['_description'])).digest()
+        self.assertEqual(expected_signature_hash, self._get_signature_hash())
+
+    def test_submit_transaction_with_signatures(self):
+        private_keys = [private_key for private_key, _ in self.key_pairs]
+        signature_hash = self._get_signature_hash()
+
+        # failure case: signature of non wallet owner
+        non_owner_private_key, _ = create_key_pair()
+        tx_result = self._submit_with_signatures([private_keys[0], non_owner_private_key], signature_hash)
+        self.assertEqual(int(False), tx_result.status)
+        self.assertEqual("signature is not signed by a wallet owner", tx_result.failure.message)
+
+        # failure case: duplicated signatures
+        tx_result = self._submit_with_signatures([private_keys[0], private_keys[0]], signature_hash)
+        self.assertEqual(int(False), tx_result.status)
+
+        # failure case: signatures more than the requirement
+        tx_result = self._submit_with_signatures(private_keys, signature_hash)
+        self.assertEqual(int(False), tx_result.status)
+        self.assertEqual("signatures exceed the requirement", tx_result.failure.message)
+
+        # success case: submitted, confirmed by owner1, 2 and executed in one transaction
+        tx_result = self._submit_with_signatures(private_keys[:2], signature_hash)
+        self.assertEqual(int(True), tx_result.status)
+        self.assertEqual("Submission(int)", tx_result.event_logs[0].indexed[0])
+        self.assertEqual("Confirmation(Address,int)", tx_result.event_logs[1].indexed[0])
+        self.assertEqual(self.key_pairs[0][1], tx_result.event_logs[1].indexed[1])
+        self.assertEqual("Confirmation(Address,int)", tx_result.event_logs[2].indexed[0])
+        self.assertEqual(self.key_pairs[1][1], tx_result.event_logs[2].indexed[1])
+        self.assertEqual("Execution(int)", tx_result.event_logs[4].indexed[0])
+        self.assertEqual(3, self._get_requirement())
+
+        # failure case: the signatures can't be used again as the nonce has been increased
+        tx_result = self._submit_with_signatures(private_keys[:2], signature_hash)
+        self.assertEqual(int(False), tx_result.status)
+        self.assertNotEqual(signature_hash, self._get_signature_hash())
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+from iconservice import ZERO_SCORE_ADDRESS
+
+from tests import create_address
+from tests.test_integrate_base import TestIntegrateBase
+
+ICX_FACTOR = 10 ** 18
+
+
+class TestIntegrateUpgrade(TestIntegrateBase):
+    # tests/legacy_multisig_wallet is the wallet of the version before the storage was migrated(see on_update)
+    def setUp(self):
+        super().setUp()
+        deploy_tx = self._make_deploy_tx("",
+                                         "tests/legacy_multisig_wallet",
+                                         self._addr_array[0],
+                                         ZERO_SCORE_ADDRESS,
+                                         deploy_params={"_walletOwners": ",".join(str(owner) for owner in
+                                                                                  (self._owner1,
+                                                                                   self._owner2,
+                                                                                   self._owner3)),
+                                                        "_required": "0x02"})
+        prev_block, tx_results = self._make_and_req_block([deploy_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(True), tx_results[0].status)
+        self.multisig_score_addr = tx_results[0].score_address
+
+        icx_send_tx = self._make_icx_send_tx(self._genesis, self.multisig_score_addr, 50 * ICX_FACTOR)
+        prev_block, tx_results = self._make_and_req_block([icx_send_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(True), tx_results[0].status)
+
+    def _make_query_request(self, method: str, params: dict) -> dict:
+        return {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": method,
+                "params": params
+            }
+        }
+
+    def _invoke(self, addr_from: 'Address', method: str, params: dict) -> 'TransactionResult':
+        tx = self._make_score_call_tx(addr_from=addr_from,
+                                      addr_to=self.multisig_score_addr,
+                                      method=method,
+                                      params=params
+                                      )
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(int(True), tx_results[0].status)
+        return tx_results[0]
+
+    def _submit_send_icx_transaction(self, addr_from: 'Address', value: int):
+        self._invoke(addr_from, "submitTransaction", {"_destination": str(self._owner4),
+                                                      "_value": hex(value * ICX_FACTOR),
+                                                      "_description": f"send {value} icx to owner4"})
+
+    def _update_multisig_wallet(self) -> int:
+        # returns the number of the writes to the wallet's storage during the update
+        update_tx = self._make_deploy_tx("",
+                                         "multisig_wallet",
+                                         self._addr_array[0],
+                                         self.multisig_score_addr)
+
+        def update():
+            prev_block, tx_results = self._make_and_req_block([update_tx])
+            self._write_precommit_state(prev_block)
+            self.assertEqual(int(True), tx_results[0].status)
+
+        _, _, write_count = self._count_storage_access(self.multisig_score_addr, update)
+        return write_count
+
+    def _get_transaction_ids(self, params: dict) -> list:
+        response = self._query(self._make_query_request("getTransactionList", params))
+        return [tx["_transactionId"] for tx in response]
+
+    def _get_awaiting_transaction_ids(self, wallet_owner: 'Address') -> list:
+        response = self._query(self._make_query_request("getTransactionsAwaitingConfirmation",
+                                                        {"_walletOwner": str(wallet_owner), "_count": "0xa"}))
+        return [tx["_transactionId"] for tx in response["_transactions"]]
+
+    def _get_confirmations(self, transaction_id: int) -> list:
+        return self._query(self._make_query_request("getConfirmations", {"_offset": "0x0",
+                                                                         "_count": "0xa",
+                                                                         "_transactionId": hex(transaction_id)}))
+
+    def _assert_migrated_state(self):
+        self.assertEqual(4, self._query(self._make_query_request("getTransactionCount", {})))
+        self.assertEqual(3, self._query(self._make_query_request("getTransactionCount", {"_executed": "0x0"})))
+        self.assertEqual(1, self._query(self._make_query_request("getTransactionCount", {"_pending": "0x0"})))
+        self.assertEqual([1, 2, 3], self._get_transaction_ids({"_offset": "0x0", "_count": "0xa",
+                                                               "_executed": "0x0"}))
+        self.assertEqual([0], self._get_transaction_ids({"_offset": "0x0", "_count": "0xa", "_pending": "0x0"}))
+
+        self.assertEqual(True, self._query(self._make_query_request("getTransactionsExecuted",
+                                                                    {"_transactionId": "0x0"})))
+        response = self._query(self._make_query_request("getTransactionInfo", {"_transactionId": "0x0"}))
+        self.assertEqual(1, response["_executed"])
+        self.assertEqual("send 10 icx to owner4", response["_description"])
+        for tx_id in (1, 2, 3):
+            response = self._query(self._make_query_request("getTransactionInfo", {"_transactionId": hex(tx_id)}))
+            self.assertEqual(0, response["_executed"])
+
+        self.assertEqual([str(self._owner1)], self._get_confirmations(1))
+        self.assertEqual([str(self._owner3)], self._get_confirmations(2))
+        self.assertEqual([], self._get_confirmations(3))
+        for tx_id, expected_count in ((1, 1), (2, 1), (3, 0)):
+            self.assertEqual(expected_count, self._query(self._make_query_request("getConfirmationCount",
+                                                                                  {"_transactionId": hex(tx_id)})))
+
+        self.assertEqual([2, 3], self._get_awaiting_transaction_ids(self._owner1))
+        self.assertEqual([1, 2, 3], self._get_awaiting_transaction_ids(self._owner2))
+        self.assertEqual([1, 3], self._get_awaiting_transaction_ids(self._owner3))
+
+        for wallet_owner in (self._owner1, self._owner2, self._owner3):
+            self.assertEqual(True, self._query(self._make_query_request("checkIfWalletOwner",
+                                                                        {"_walletOwner": str(wallet_owner)})))
+        self.assertEqual(False, self._query(self._make_query_request("checkIfWalletOwner",
+                                                                     {"_walletOwner": str(self._owner4)})))
+
+    def _make_legacy_transactions(self):
+        # transaction 0: executed, transaction 1: confirmed by owner1, transaction 2: confirmed by owner3,
+        # transaction 3: revoked by owner1
+        self._submit_send_icx_transaction(self._owner1, 10)
+        self._invoke(self._owner2, "confirmTransaction", {"_transactionId": "0x0"})
+        self._submit_send_icx_transaction(self._owner1, 20)
+        self._submit_send_icx_transaction(self._owner3, 30)
+        self._submit_send_icx_transaction(self._owner1, 40)
+        self._invoke(self._owner1, "revokeTransaction", {"_transactionId": "0x3"})
+
+    def _execute_wallet_method(self, addr_from: 'Address', confirming_owner: 'Address', method: str, params: list):
+        tx_result = self._invoke(addr_from, "submitTransaction", {"_destination": str(self.multisig_score_addr),
+                                                                  "_method": method,
+                                                                  "_params": json.dumps(params)})
+        transaction_id = tx_result.event_logs[0].indexed[1]
+        tx_result = self._invoke(confirming_owner, "confirmTransaction", {"_transactionId": hex(transaction_id)})
+        self.assertEqual("Execution(int)", tx_result.event_logs[-1].indexed[0])
+
+    def test_update_legacy_wallet(self):
+        self._make_legacy_transactions()
+
+        self.assertLess(0, self._update_multisig_wallet())
+        self._assert_migrated_state()
+
+        # success case: updating the wallet again doesn't write anything and keeps the state
+        self.assertEqual(0, self._update_multisig_wallet())
+        self._assert_migrated_state()
+
+        # success case: legacy transactions can be confirmed, executed and revoked after the update
+        tx_result = self._invoke(self._owner2, "confirmTransaction", {"_transactionId": "0x1"})
+        self.assertEqual("Execution(int)", tx_result.event_logs[-1].indexed[0])
+        response = self._query({"address": self._owner4}, "icx_getBalance")
+        self.assertEqual(30 * ICX_FACTOR, response)
+        self.assertEqual([2, 3], self._get_transaction_ids({"_offset": "0x0", "_count": "0xa",
+                                                            "_executed": "0x0"}))
+        self.assertEqual([0, 1], self._get_transaction_ids({"_offset": "0x0", "_count": "0xa", "_pending": "0x0"}))
+
+        self._invoke(self._owner3, "revokeTransaction", {"_transactionId": "0x2"})
+        self.assertEqual([], self._get_confirmations(2))
+        self.assertEqual([2, 3], self._get_awaiting_transaction_ids(self._owner3))
+
+        # success case: transactions submitted after the update follow the legacy transactions
+        self._submit_send_icx_transaction(self._owner1, 1)
+        self.assertEqual([2, 3, 4], self._get_transaction_ids({"_offset": "0x0", "_count": "0xa",
+                                                               "_executed": "0x0"}))
+
+    def test_change_wallet_owners_after_update(self):
+        self._make_legacy_transactions()
+        self._update_multisig_wallet()
+
+        # success case: the legacy confirmation of the replaced owner3 is discarded,
+        # and the new owner awaits the transaction
+        owner5 = create_address()
+        self._execute_wallet_method(self._owner1, self._owner2, "replaceWalletOwner",
+                                    [{"name": "_walletOwner", "type": "Address", "value": str(self._owner3)},
+                                     {"name": "_newWalletOwner", "type": "Address", "value": str(owner5)}])
+        self.assertEqual([], self._get_confirmations(2))
+        self.assertEqual(0, self._query(self._make_query_request("getConfirmationCount", {"_transactionId": "0x2"})))
+        self.assertEqual(False, self._query(self._make_query_request("checkIfWalletOwner",
+                                                                     {"_walletOwner": str(self._owner3)})))
+        self.assertEqual([1, 2, 3], self._get_awaiting_transaction_ids(owner5))
+
+        # success case: the legacy confirmation of the removed owner1 is discarded,
+        # and is not restored when owner1 is added again
+        self._execute_wallet_method(self._owner2, owner5, "removeWalletOwner",
+                                    [{"name": "_walletOwner", "type": "Address", "value": str(self._owner1)}])
+        self.assertEqual([str(owner5), str(self._owner2)],
+                         self._query(self._make_query_request("getWalletOwners", {"_offset": "0x0", "_count": "0xa"})))
+        self.assertEqual([], self._get_confirmations(1))
+
+        self._execute_wallet_method(self._owner2, owner5, "addWalletOwner",
+                                    [{"name": "_walletOwner", "type": "Address", "value": str(self._owner1)}])
+        self.assertEqual([], self._get_confirmations(1))
+        self.assertEqual(0, self._query(self._make_query_request("getConfirmationCount", {"_transactionId": "0x1"})))
+        self.assertEqual([1, 2, 3], self._get_awaiting_transaction_ids(self._owner1))
+
+        # success case: the remaining wallet owners confirm the legacy transaction
+        self._invoke(self._owner2, "confirmTransaction", {"_transactionId": "0x1"})
+        tx_result = self._invoke(self._owner1, "confirmTransaction", {"_transactionId": "0x1"})
+        self.assertEqual("Execution(int)", tx_result.event_logs[-1].indexed[0])
+        self.assertEqual([str(self._owner2), str(self._owner1)], self._get_confirmations(1))
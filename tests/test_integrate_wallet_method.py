@@ -648,3 +648,494 @@ class TestIntegrateWalletMethod(TestIntegrateBase):
         expected_requirement = 1
         actual_requiremnt = self._query(query_request)
         self.assertEqual(expected_requirement, actual_requiremnt)
+
+    def test_confirmation_count_after_remove_wallet_owner(self):
+        # submit transaction using owner3(confirmation count should be 1)
+        change_requirement_params = [
+            {"name": "_required",
+             "type": "int",
+             "value": 2}
+        ]
+        submit_tx_params = {"_destination": str(self.multisig_score_addr),
+                            "_method": "changeRequirement",
+                            "_params": json.dumps(change_requirement_params),
+                            "_description": "change requirement 2 to 2"}
+
+        change_requirement_submit_tx = self._make_score_call_tx(addr_from=self._owner3,
+                                                                addr_to=self.multisig_score_addr,
+                                                                method="submitTransaction",
+                                                                params=submit_tx_params
+                                                                )
+        prev_block, tx_results = self._make_and_req_block([change_requirement_submit_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(True, tx_results[0].status)
+
+        # remove owner3 from the wallet
+        remove_owner_params = [
+            {"name": "_walletOwner",
+             "type": "Address",
+             "value": str(self._owner3)}
+        ]
+        submit_tx_params = {"_destination": str(self.multisig_score_addr),
+                            "_method": "removeWalletOwner",
+                            "_params": json.dumps(remove_owner_params),
+                            "_description": "remove wallet owner3 in wallet"}
+
+        remove_owner_submit_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                                          addr_to=self.multisig_score_addr,
+                                                          method="submitTransaction",
+                                                          params=submit_tx_params
+                                                          )
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x01'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([remove_owner_submit_tx, confirm_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(True, tx_results[0].status)
+        self.assertEqual(True, tx_results[1].status)
+
+        # check the confirmation count of transaction 0(owner3's confirmation should be discarded)
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": "getConfirmationCount",
+                "params": {"_transactionId": "0x00"}
+            }
+        }
+        response = self._query(query_request)
+        self.assertEqual(0, response)
+
+        # confirm transaction 0 using owner1(should not be executed as only one confirmation is valid)
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x00'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([confirm_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(True, tx_results[0].status)
+
+        response = self._query(query_request)
+        self.assertEqual(1, response)
+
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": "getTransactionsExecuted",
+                "params": {"_transactionId": "0x00"}
+            }
+        }
+        response = self._query(query_request)
+        self.assertEqual(False, response)
+
+    def test_remove_and_replace_wallet_owner_index(self):
+        # remove owner1(owner3 should be moved to the removed owner's index)
+        remove_owner_params = [
+            {"name": "_walletOwner",
+             "type": "Address",
+             "value": str(self._owner1)}
+        ]
+        submit_tx_params = {"_destination": str(self.multisig_score_addr),
+                            "_method": "removeWalletOwner",
+                            "_params": json.dumps(remove_owner_params),
+                            "_description": "remove wallet owner1 in wallet"}
+
+        remove_owner_submit_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                                          addr_to=self.multisig_score_addr,
+                                                          method="submitTransaction",
+                                                          params=submit_tx_params
+                                                          )
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner3,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x00'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([remove_owner_submit_tx, confirm_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(True, tx_results[0].status)
+        self.assertEqual(True, tx_results[1].status)
+
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": "getWalletOwners",
+                "params": {"_offset": "0", "_count": "10"}
+            }
+        }
+        response = self._query(query_request)
+        expected_owners = [str(self._owner3), str(self._owner2)]
+        self.assertEqual(expected_owners, response)
+
+        # replace owner3 with owner4 using moved owner3's index
+        replace_owner_params = [
+            {"name": "_walletOwner",
+             "type": "Address",
+             "value": str(self._owner3)},
+            {"name": "_newWalletOwner",
+             "type": "Address",
+             "value": str(self._owner4)}
+        ]
+        submit_tx_params = {"_destination": str(self.multisig_score_addr),
+                            "_method": "replaceWalletOwner",
+                            "_params": json.dumps(replace_owner_params),
+                            "_description": "replace wallet owner3 with owner4"}
+
+        replace_owner_submit_tx = self._make_score_call_tx(addr_from=self._owner3,
+                                                           addr_to=self.multisig_score_addr,
+                                                           method="submitTransaction",
+                                                           params=submit_tx_params
+                                                           )
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x01'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([replace_owner_submit_tx, confirm_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(True, tx_results[0].status)
+        self.assertEqual(True, tx_results[1].status)
+
+        response = self._query(query_request)
+        expected_owners = [str(self._owner4), str(self._owner2)]
+        self.assertEqual(expected_owners, response)
+
+        for wallet_owner, expected in [(self._owner1, False), (self._owner3, False),
+                                       (self._owner2, True), (self._owner4, True)]:
+            query_request = {
+                "version": self._version,
+                "from": self._admin,
+                "to": self.multisig_score_addr,
+                "dataType": "call",
+                "data": {
+                    "method": "checkIfWalletOwner",
+                    "params": {"_walletOwner": str(wallet_owner)}
+                }
+            }
+            response = self._query(query_request)
+            self.assertEqual(expected, response)
+
+    def test_confirmations_after_wallet_owner_moved(self):
+        # submit transaction using owner3(index 2)
+        change_requirement_params = [
+            {"name": "_required",
+             "type": "int",
+             "value": 2}
+        ]
+        submit_tx_params = {"_destination": str(self.multisig_score_addr),
+                            "_method": "changeRequirement",
+                            "_params": json.dumps(change_requirement_params),
+                            "_description": "change requirement 2 to 2"}
+
+        change_requirement_submit_tx = self._make_score_call_tx(addr_from=self._owner3,
+                                                                addr_to=self.multisig_score_addr,
+                                                                method="submitTransaction",
+                                                                params=submit_tx_params
+                                                                )
+        prev_block, tx_results = self._make_and_req_block([change_requirement_submit_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(True, tx_results[0].status)
+
+        # remove owner1(owner3 should be moved to index 0)
+        remove_owner_params = [
+            {"name": "_walletOwner",
+             "type": "Address",
+             "value": str(self._owner1)}
+        ]
+        submit_tx_params = {"_destination": str(self.multisig_score_addr),
+                            "_method": "removeWalletOwner",
+                            "_params": json.dumps(remove_owner_params),
+                            "_description": "remove wallet owner1 in wallet"}
+
+        remove_owner_submit_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                                          addr_to=self.multisig_score_addr,
+                                                          method="submitTransaction",
+                                                          params=submit_tx_params
+                                                          )
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner3,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x01'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([remove_owner_submit_tx, confirm_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(True, tx_results[0].status)
+        self.assertEqual(True, tx_results[1].status)
+
+        # owner3's confirmation of transaction 0 should be kept
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": "getConfirmations",
+                "params": {"_offset": "0", "_count": "10", "_transactionId": "0x00"}
+            }
+        }
+        response = self._query(query_request)
+        self.assertEqual([str(self._owner3)], response)
+
+        # confirm transaction 0 using owner2(should be executed)
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x00'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([confirm_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(True, tx_results[0].status)
+
+        expected_execution_event_log = "Execution(int)"
+        actual_execution_event_log = tx_results[0].event_logs[2].indexed[0]
+        self.assertEqual(expected_execution_event_log, actual_execution_event_log)
+
+        response = self._query(query_request)
+        self.assertEqual([str(self._owner3), str(self._owner2)], response)
+
+    def test_confirmations_after_several_wallet_owner_changes(self):
+        # submit transaction using owner3(index 2)
+        change_requirement_params = [
+            {"name": "_required",
+             "type": "int",
+             "value": 2}
+        ]
+        submit_tx_params = {"_destination": str(self.multisig_score_addr),
+                            "_method": "changeRequirement",
+                            "_params": json.dumps(change_requirement_params),
+                            "_description": "change requirement 2 to 2"}
+
+        change_requirement_submit_tx = self._make_score_call_tx(addr_from=self._owner3,
+                                                                addr_to=self.multisig_score_addr,
+                                                                method="submitTransaction",
+                                                                params=submit_tx_params
+                                                                )
+        prev_block, tx_results = self._make_and_req_block([change_requirement_submit_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(True, tx_results[0].status)
+
+        # replace owner2 with owner4, then remove owner1(owner3 should be moved to index 0)
+        replace_owner_params = [
+            {"name": "_walletOwner",
+             "type": "Address",
+             "value": str(self._owner2)},
+            {"name": "_newWalletOwner",
+             "type": "Address",
+             "value": str(self._owner4)}
+        ]
+        submit_tx_params = {"_destination": str(self.multisig_score_addr),
+                            "_method": "replaceWalletOwner",
+                            "_params": json.dumps(replace_owner_params),
+                            "_description": "replace wallet owner2 with owner4"}
+        replace_owner_submit_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                                           addr_to=self.multisig_score_addr,
+                                                           method="submitTransaction",
+                                                           params=submit_tx_params
+                                                           )
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner3,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x01'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([replace_owner_submit_tx, confirm_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(True, tx_results[0].status)
+        self.assertEqual(True, tx_results[1].status)
+
+        remove_owner_params = [
+            {"name": "_walletOwner",
+             "type": "Address",
+             "value": str(self._owner1)}
+        ]
+        submit_tx_params = {"_destination": str(self.multisig_score_addr),
+                            "_method": "removeWalletOwner",
+                            "_params": json.dumps(remove_owner_params),
+                            "_description": "remove wallet owner1 in wallet"}
+        remove_owner_submit_tx = self._make_score_call_tx(addr_from=self._owner4,
+                                                          addr_to=self.multisig_score_addr,
+                                                          method="submitTransaction",
+                                                          params=submit_tx_params
+                                                          )
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner3,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x02'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([remove_owner_submit_tx, confirm_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(True, tx_results[0].status)
+        self.assertEqual(True, tx_results[1].status)
+
+        # only owner3's confirmation of transaction 0 should be kept
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": "getConfirmations",
+                "params": {"_offset": "0", "_count": "10", "_transactionId": "0x00"}
+            }
+        }
+        response = self._query(query_request)
+        self.assertEqual([str(self._owner3)], response)
+
+        # confirm transaction 0 using owner4(should be executed)
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner4,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x00'}
+                                              )
+        prev_block, tx_results = self._make_and_req_block([confirm_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(True, tx_results[0].status)
+
+        expected_execution_event_log = "Execution(int)"
+        actual_execution_event_log = tx_results[0].event_logs[2].indexed[0]
+        self.assertEqual(expected_execution_event_log, actual_execution_event_log)
+
+        response = self._query(query_request)
+        self.assertEqual([str(self._owner3), str(self._owner4)], response)
+
+    def _get_transactions_awaiting_confirmation(self, wallet_owner: 'Address') -> list:
+        transaction_ids, _ = self._get_transactions_awaiting_confirmation_by_cursor(
+            {"_walletOwner": str(wallet_owner), "_count": "10"})
+        return transaction_ids
+
+    def _get_transactions_awaiting_confirmation_by_cursor(self, params: dict) -> tuple:
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": self.multisig_score_addr,
+            "dataType": "call",
+            "data": {
+                "method": "getTransactionsAwaitingConfirmation",
+                "params": params
+            }
+        }
+        response = self._query(query_request)
+        return [tx["_transactionId"] for tx in response["_transactions"]], response.get("_nextCursor")
+
+    def test_transactions_awaiting_confirmation(self):
+        # submit 2 transactions using owner1
+        change_requirement_params = [
+            {"name": "_required",
+             "type": "int",
+             "value": 2}
+        ]
+        submit_tx_params = {"_destination": str(self.multisig_score_addr),
+                            "_method": "changeRequirement",
+                            "_params": json.dumps(change_requirement_params),
+                            "_description": "change requirement 2 to 2"}
+        submit_txs = []
+        for _ in range(2):
+            submit_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                                 addr_to=self.multisig_score_addr,
+                                                 method="submitTransaction",
+                                                 params=submit_tx_params
+                                                 )
+            submit_txs.append(submit_tx)
+        prev_block, tx_results = self._make_and_req_block(submit_txs)
+        self._write_precommit_state(prev_block)
+
+        self.assertEqual([], self._get_transactions_awaiting_confirmation(self._owner1))
+        self.assertEqual([0, 1], self._get_transactions_awaiting_confirmation(self._owner2))
+        self.assertEqual([0, 1], self._get_transactions_awaiting_confirmation(self._owner3))
+
+        # confirm transaction 0 using owner2(should be executed), revoke transaction 1 using owner1
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x00'}
+                                              )
+        revoke_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                             addr_to=self.multisig_score_addr,
+                                             method='revokeTransaction',
+                                             params={'_transactionId': '0x01'}
+                                             )
+        prev_block, tx_results = self._make_and_req_block([confirm_tx, revoke_tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(True, tx_results[0].status)
+        self.assertEqual(True, tx_results[1].status)
+
+        self.assertEqual([1], self._get_transactions_awaiting_confirmation(self._owner1))
+        self.assertEqual([1], self._get_transactions_awaiting_confirmation(self._owner2))
+        self.assertEqual([1], self._get_transactions_awaiting_confirmation(self._owner3))
+
+        # add owner4(should await transaction 1), remove owner3
+        add_owner_params = [
+            {"name": "_walletOwner",
+             "type": "Address",
+             "value": str(self._owner4)}
+        ]
+        submit_tx_params = {"_destination": str(self.multisig_score_addr),
+                            "_method": "addWalletOwner",
+                            "_params": json.dumps(add_owner_params),
+                            "_description": "add owner4 in wallet"}
+        add_owner_submit_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                                       addr_to=self.multisig_score_addr,
+                                                       method="submitTransaction",
+                                                       params=submit_tx_params
+                                                       )
+        confirm_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                              addr_to=self.multisig_score_addr,
+                                              method='confirmTransaction',
+                                              params={'_transactionId': '0x02'}
+                                              )
+        remove_owner_params = [
+            {"name": "_walletOwner",
+             "type": "Address",
+             "value": str(self._owner3)}
+        ]
+        submit_tx_params = {"_destination": str(self.multisig_score_addr),
+                            "_method": "removeWalletOwner",
+                            "_params": json.dumps(remove_owner_params),
+                            "_description": "remove wallet owner3 in wallet"}
+        remove_owner_submit_tx = self._make_score_call_tx(addr_from=self._owner1,
+                                                          addr_to=self.multisig_score_addr,
+                                                          method="submitTransaction",
+                                                          params=submit_tx_params
+                                                          )
+        confirm_remove_tx = self._make_score_call_tx(addr_from=self._owner2,
+                                                     addr_to=self.multisig_score_addr,
+                                                     method='confirmTransaction',
+                                                     params={'_transactionId': '0x03'}
+                                                     )
+        prev_block, tx_results = self._make_and_req_block([add_owner_submit_tx, confirm_tx,
+                                                           remove_owner_submit_tx, confirm_remove_tx])
+        self._write_precommit_state(prev_block)
+        for tx_result in tx_results:
+            self.assertEqual(True, tx_result.status)
+
+        self.assertEqual([1], self._get_transactions_awaiting_confirmation(self._owner1))
+        self.assertEqual([1], self._get_transactions_awaiting_confirmation(self._owner2))
+        self.assertEqual([], self._get_transactions_awaiting_confirmation(self._owner3))
+        self.assertEqual([1], self._get_transactions_awaiting_confirmation(self._owner4))
+
+        # success case: page the awaiting transactions by the cursor
+        submit_tx_params = {"_destination": str(self.multisig_score_addr),
+                            "_method": "changeRequirement",
+                            "_params": json.dumps(change_requirement_params),
+                            "_description": "change requirement 2 to 2"}
+        submit_txs = [self._make_score_call_tx(addr_from=self._owner1,
+                                               addr_to=self.multisig_score_addr,
+                                               method="submitTransaction",
+                                               params=submit_tx_params
+                                               ) for _ in range(3)]
+        prev_block, tx_results = self._make_and_req_block(submit_txs)
+        self._write_precommit_state(prev_block)
+
+        params = {"_walletOwner": str(self._owner4), "_count": "2"}
+        self.assertEqual(([1, 4], 5), self._get_transactions_awaiting_confirmation_by_cursor(params))
+        params["_cursor"] = "5"
+        self.assertEqual(([5, 6], None), self._get_transactions_awaiting_confirmation_by_cursor(params))
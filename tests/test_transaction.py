@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from unittest import TestCase
+
+from iconservice.iconscore.icon_score_context import ContextContainer, IconScoreContext
+
+from multisig_wallet.transaction import Transaction, HEADER_BYTE_LEN, TRANSACTION_FORMAT_VERSION
+from multisig_wallet.type_converter.type_converter import convert_params, encode_typed_params
+from tests import create_address
+
+
+def to_legacy_bytes(transaction: Transaction) -> bytes:
+    # the layout used before TRANSACTION_FORMAT_VERSION was introduced: header + JSON string
+    flexible_vars = {"method": transaction.method,
+                     "params": transaction.params,
+                     "description": transaction.description}
+    encoded_flexible_vars_json = json.dumps(flexible_vars, separators=(',', ':')).encode(encoding="utf-8")
+    return transaction.to_bytes()[:HEADER_BYTE_LEN] + encoded_flexible_vars_json
+
+
+def to_typed_params(params: str) -> list:
+    return convert_params(json.loads(params)) if params != "" else []
+
+
+def create_transaction_corpus() -> list:
+    owner = create_address()
+    token = create_address(1)
+    transfer_params = [{"name": "_to", "type": "Address", "value": str(owner)},
+                       {"name": "_value", "type": "int", "value": "0x8ac7230489e80000"}]
+    add_owner_params = [{"name": "_walletOwner", "type": "Address", "value": str(owner)}]
+    requirement_params = [{"name": "_required", "type": "int", "value": 3}]
+    data_params = [{"name": "_data", "type": "bytes", "value": "0x" + "ab" * 200},
+                   {"name": "_memo", "type": "str", "value": "payroll \"march\" \\ batch"}]
+
+    corpus = [
+        (owner, "", "", 10 * 10 ** 18, "send 10 icx to owner1"),
+        (token, "transfer", json.dumps(transfer_params), 0, "send 10 token to owner1"),
+        (token, "addWalletOwner", json.dumps(add_owner_params), 0, "add owner4 in wallet"),
+        (token, "changeRequirement", json.dumps(requirement_params), 0, ""),
+        (token, "setData", json.dumps(data_params), 0, "지갑 운영 비용 " * 20),
+    ]
+    # typed params are stored like the wallet does when the transaction is submitted
+    return [Transaction.create_transaction_with_validation(
+        destination=destination,
+        method=method,
+        params=params,
+        value=value,
+        description=description,
+        typed_params=encode_typed_params(to_typed_params(params)))
+        for destination, method, params, value, description in corpus]
+
+
+class TestTransaction(TestCase):
+    def setUp(self):
+        ContextContainer._push_context(IconScoreContext())
+
+    def tearDown(self):
+        ContextContainer._pop_context()
+
+    def assert_transaction_equal(self, expected: Transaction, actual: Transaction):
+        self.assertEqual(expected.executed, actual.executed)
+        self.assertEqual(expected.destination, actual.destination)
+        self.assertEqual(expected.value, actual.value)
+        self.assertEqual(expected.method, actual.method)
+        # params rebuilt from the typed params are equivalent, but may differ in format(e.g. int value as hex)
+        self.assertEqual(to_typed_params(expected.params), to_typed_params(actual.params))
+        self.assertEqual(expected.description, actual.description)
+
+    def test_to_bytes_and_from_bytes(self):
+        for transaction in create_transaction_corpus():
+            encoded = transaction.to_bytes()
+            self.assertEqual(TRANSACTION_FORMAT_VERSION, encoded[HEADER_BYTE_LEN])
+            decoded = Transaction.from_bytes(encoded)
+            self.assert_transaction_equal(transaction, decoded)
+            self.assertEqual(transaction.typed_params, decoded.typed_params)
+
+    def test_from_bytes_legacy_format(self):
+        # transactions stored before TRANSACTION_FORMAT_VERSION was introduced should be decoded
+        for transaction in create_transaction_corpus():
+            self.assert_transaction_equal(transaction, Transaction.from_bytes(to_legacy_bytes(transaction)))
+
+    def test_from_bytes_decodes_header_only(self):
+        for transaction in create_transaction_corpus():
+            for encoded in (transaction.to_bytes(), to_legacy_bytes(transaction)):
+                decoded = Transaction.from_bytes(encoded)
+                self.assertEqual(transaction.executed, decoded.executed)
+                self.assertEqual(transaction.destination, decoded.destination)
+                self.assertEqual(transaction.value, decoded.value)
+                self.assertIsNotNone(decoded._encoded_flexible_vars)
+
+                # flexible variables which are not decoded yet should be stored as they are
+                decoded.executed = True
+                self.assertEqual(True.to_bytes(1, "big") + encoded[1:], decoded.to_bytes())
+
+                self.assertEqual(transaction.description, decoded.description)
+                self.assertIsNone(decoded._encoded_flexible_vars)
+
+    def test_compare_with_legacy_format(self):
+        corpus = create_transaction_corpus()
+        encoded_corpus = [transaction.to_bytes() for transaction in corpus]
+        legacy_encoded_corpus = [to_legacy_bytes(transaction) for transaction in corpus]
+
+        # params are stored only as the typed params, so every transaction is smaller than the legacy one
+        for transaction, encoded, legacy_encoded in zip(corpus, encoded_corpus, legacy_encoded_corpus):
+            self.assertLess(len(encoded), len(legacy_encoded))
+            if transaction.params != "":
+                self.assertNotIn(transaction.params.encode(), encoded)
@@ -14,6 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest.mock import patch
+
 from iconservice import *
 from iconservice.base.exception import InvalidParamsException
 
@@ -170,3 +172,237 @@ class TestTypeConverter(TestIntegrateBase):
 
         # failure case: value is array(type and actual data is not match)
         self.assertRaises(IconScoreException, type_converter.params_type_converter, 'bytes', ['array', 'test'])
+
+    def test_convert_value_array(self):
+        # success case: convert each element to the element type
+        addr = create_address()
+        actual = type_converter.params_type_converter('[]Address', [str(addr), str(addr)])
+        self.assertEqual([addr, addr], actual)
+
+        actual = type_converter.params_type_converter('[][]int', [['0x10', 1], []])
+        self.assertEqual([[16, 1], []], actual)
+
+        # failure case: value is not an array
+        self.assertRaises(IconScoreException, type_converter.params_type_converter, '[]int', '0x10')
+
+        # failure case: not supported element type(checked even if the array is empty)
+        self.assertRaises(IconScoreException, type_converter.params_type_converter, '[]dict', [])
+
+        # failure case: type and element's actual type are not match
+        self.assertRaises(IconScoreException, type_converter.params_type_converter, '[]str', ['test', 10])
+
+        # failure case: exceed the allowed length
+        max_length = type_converter.MAX_PARAM_LENGTH
+        self.assertEqual(max_length, len(type_converter.params_type_converter('[]int', [0] * max_length)))
+        self.assertRaises(IconScoreException, type_converter.params_type_converter, '[]int', [0] * (max_length + 1))
+
+        # failure case: exceed the allowed depth
+        self.assertEqual([], type_converter.params_type_converter('[][][]int', []))
+        self.assertRaises(IconScoreException, type_converter.params_type_converter, '[][][][]int', [])
+
+    def test_convert_value_struct(self):
+        # success case: struct is converted like the params and passed to the method as a dict
+        addr = create_address()
+        fields = [{"name": "to", "type": "Address", "value": str(addr)},
+                  {"name": "values", "type": "[]int", "value": ["0x1", "0x2"]},
+                  {"name": "option", "type": "struct", "value": [{"name": "flag", "type": "bool", "value": "0x1"}]}]
+        expected = [("to", "Address", addr),
+                    ("values", "[]int", [1, 2]),
+                    ("option", "struct", [("flag", "bool", True)])]
+        actual = type_converter.params_type_converter('struct', fields)
+        self.assertEqual(expected, actual)
+
+        expected = {"_struct": {"to": addr, "values": [1, 2], "option": {"flag": True}}}
+        actual = type_converter.typed_params_to_kwargs(type_converter.convert_params([
+            {"name": "_struct", "type": "struct", "value": fields}]))
+        self.assertEqual(expected, actual)
+
+        # failure case: value is not a list of fields
+        self.assertRaises(IconScoreException, type_converter.params_type_converter, 'struct', {"to": str(addr)})
+        self.assertRaises(IconScoreException, type_converter.params_type_converter, 'struct', [str(addr)])
+
+        # failure case: exceed the allowed depth
+        nested_fields = [{"name": "nested", "type": "[][]int", "value": []}]
+        self.assertRaises(IconScoreException, type_converter.params_type_converter, '[]struct',
+                          [[{"name": "nested", "type": "struct", "value": nested_fields}]])
+
+    def test_encode_and_decode_typed_params(self):
+        # success case: converted params should be decoded to the same kwargs
+        addr = create_address()
+        score_addr = create_address(1)
+        typed_params = [("_int", "int", -0x8ac7230489e80000),
+                        ("_zero", "int", 0),
+                        ("_str", "str", "멀티시그 wallet"),
+                        ("_bool", "bool", True),
+                        ("_address", "Address", addr),
+                        ("_score", "Address", score_addr),
+                        ("_bytes", "bytes", bytes.fromhex("deadbeef00")),
+                        ("_empty", "bytes", b"")]
+        expected = {name: value for name, _, value in typed_params}
+        actual = type_converter.decode_typed_params(type_converter.encode_typed_params(typed_params))
+        self.assertEqual(expected, actual)
+
+        # success case: array and struct params should be decoded to the same kwargs
+        typed_params = type_converter.convert_params([
+            {"name": "_tos", "type": "[]Address", "value": [str(addr), str(score_addr)]},
+            {"name": "_empty", "type": "[]int", "value": []},
+            {"name": "_orders", "type": "[]struct", "value": [
+                [{"name": "id", "type": "int", "value": "0x1"},
+                 {"name": "memo", "type": "str", "value": ""}],
+                [{"name": "id", "type": "int", "value": "0x2"},
+                 {"name": "items", "type": "[]bytes", "value": ["0xdead", ""]}]]}])
+        expected = type_converter.typed_params_to_kwargs(typed_params)
+        actual = type_converter.decode_typed_params(type_converter.encode_typed_params(typed_params))
+        self.assertEqual(expected, actual)
+
+        # success case: empty params should be decoded to empty kwargs
+        self.assertEqual({}, type_converter.decode_typed_params(type_converter.encode_typed_params([])))
+
+        # failure case: not supported type
+        self.assertRaises(IconScoreException, type_converter.encode_typed_params, [("_dict", "dict", {})])
+
+    def test_decode_typed_params_to_params(self):
+        # success case: params rebuilt from the typed params should be converted to the same typed params
+        addr = create_address()
+        params = [
+            {"name": "_int", "type": "int", "value": -10},
+            {"name": "_str", "type": "str", "value": "멀티시그 wallet"},
+            {"name": "_bool", "type": "bool", "value": "0x0"},
+            {"name": "_address", "type": "Address", "value": str(addr)},
+            {"name": "_bytes", "type": "bytes", "value": "deadbeef"},
+            {"name": "_orders", "type": "[]struct", "value": [
+                [{"name": "id", "type": "int", "value": "0x1"},
+                 {"name": "items", "type": "[]bytes", "value": ["0xdead", ""]}]]}]
+        typed_params = type_converter.convert_params(params)
+        actual = type_converter.decode_typed_params_to_params(type_converter.encode_typed_params(typed_params))
+        self.assertEqual(typed_params, type_converter.convert_params(actual))
+
+        # success case: values are formatted like the JSON-RPC
+        expected = [
+            {"name": "_int", "type": "int", "value": "-0xa"},
+            {"name": "_str", "type": "str", "value": "멀티시그 wallet"},
+            {"name": "_bool", "type": "bool", "value": "0x0"},
+            {"name": "_address", "type": "Address", "value": str(addr)},
+            {"name": "_bytes", "type": "bytes", "value": "0xdeadbeef"},
+            {"name": "_orders", "type": "[]struct", "value": [
+                [{"name": "id", "type": "int", "value": "0x1"},
+                 {"name": "items", "type": "[]bytes", "value": ["0xdead", "0x"]}]]}]
+        self.assertEqual(expected, actual)
+
+    def test_convert_params(self):
+        # success case: convert each param to its type
+        addr = create_address()
+        params = [{"name": "_to", "type": "Address", "value": str(addr)},
+                  {"name": "_value", "type": "int", "value": "0x10"},
+                  {"name": "_data", "type": "bytes", "value": "0xdeadbeef"}]
+        expected = [("_to", "Address", addr), ("_value", "int", 16), ("_data", "bytes", bytes.fromhex("deadbeef"))]
+        self.assertEqual(expected, type_converter.convert_params(params))
+        self.assertEqual([], type_converter.convert_params([]))
+
+        # failure case: not supported type
+        params = [{"name": "_dict", "type": "dict", "value": {}}]
+        self.assertRaises(IconScoreException, type_converter.convert_params, params)
+
+        # failure case: type and value's actual type are not match
+        params = [{"name": "_value", "type": "int", "value": None}]
+        self.assertRaises(IconScoreException, type_converter.convert_params, params)
+
+    def test_validate_params(self):
+        # success case: valid params are converted without errors
+        addr = create_address()
+        params = [{"name": "_to", "type": "Address", "value": str(addr)},
+                  {"name": "_values", "type": "[]int", "value": ["0x1", 2]}]
+        expected = [("_to", "Address", addr), ("_values", "[]int", [1, 2])]
+        self.assertEqual((expected, []), type_converter.validate_params(params))
+
+        # failure case: errors of all the invalid params are collected with the path of each param
+        params = [{"name": "_to", "type": "Address", "value": 10},
+                  {"name": "_value", "type": "int", "value": "0x10"},
+                  {"name": "_values", "type": "[]int", "value": ["0x1", None]},
+                  {"name": "_order", "type": "struct", "value": [
+                      {"name": "items", "type": "[]struct", "value": [[{"name": "id", "type": "dict", "value": {}}]]}]},
+                  {"name": "_missing", "type": "int"},
+                  "_invalid"]
+        typed_params, errors = type_converter.validate_params(params)
+        self.assertEqual([("_value", "int", 16)], typed_params)
+        self.assertEqual(["_to: type and value's actual type are not match.",
+                          "_values[1]: type and value's actual type are not match.",
+                          "_order.items[0].id: dict is not supported type "
+                          "(only int, str, bool, Address, bytes, struct and arrays of them are supported)",
+                          "_missing: param should have name, type and value",
+                          "[5]: param should have name, type and value"], errors)
+
+        # failure case: convert_params raises the error of the first invalid param
+        with self.assertRaises(type_converter.ParamsConversionError) as context:
+            type_converter.convert_params(params)
+        self.assertEqual("_to", context.exception.path)
+
+        # failure case: invalid address is collected like the other invalid values
+        params = [{"name": "_to", "type": "Address", "value": "hx022f12"}]
+        self.assertEqual(([], ["_to: Invalid address"]), type_converter.validate_params(params))
+
+        # errors which are not caused by the params(e.g. interrupt) are not collected
+        def interrupt(value):
+            raise KeyboardInterrupt
+
+        # (the plans are cleared as well, as they refer to the converters)
+        params = [{"name": "_value", "type": "int", "value": "0x10"}]
+        with patch.dict(type_converter._VALUE_CONVERTERS, {"int": interrupt}), \
+                patch.dict(type_converter._conversion_plans, clear=True):
+            self.assertRaises(KeyboardInterrupt, type_converter.validate_params, params)
+
+    def test_convert_params_benchmark(self):
+        # convert the params of 10k token transfers. after the first conversion, the plan of their schema
+        # (names and types of the params) is reused, so no param is dispatched by its type
+        conversion_count = 10000
+        addresses = [create_address() for _ in range(conversion_count)]
+        params_list = [[{"name": "_to", "type": "Address", "value": str(addr)},
+                        {"name": "_value", "type": "int", "value": hex(value)}]
+                       for value, addr in enumerate(addresses)]
+
+        with patch.dict(type_converter._conversion_plans, clear=True), \
+                patch.object(type_converter, "_convert_value", wraps=type_converter._convert_value) as convert_value:
+            actual = [type_converter.convert_params(params) for params in params_list]
+            self.assertEqual([(("_to", "Address"), ("_value", "int"))], list(type_converter._conversion_plans))
+        self.assertEqual(0, convert_value.call_count)
+
+        expected = [[("_to", "Address", addr), ("_value", "int", value)] for value, addr in enumerate(addresses)]
+        self.assertEqual(expected, actual)
+        # the plan converts the params same as dispatching each param by its type
+        self.assertEqual(expected, [type_converter._convert_params(params, 0) for params in params_list])
+
+    def test_convert_params_by_plan(self):
+        addr = create_address()
+        params = [{"name": "_to", "type": "Address", "value": str(addr)},
+                  {"name": "_values", "type": "[]int", "value": ["0x1", 2]}]
+        with patch.dict(type_converter._conversion_plans, clear=True):
+            type_converter.convert_params(params)
+
+            # success case: params of the same schema are converted by the plan, and arrays and structs are
+            # dispatched as usual
+            params[0]["value"] = str(create_address())
+            expected = type_converter._convert_params(params, 0)
+            self.assertEqual(expected, type_converter.convert_params(params))
+            self.assertEqual((expected, []), type_converter.validate_params(params))
+            self.assertEqual(1, len(type_converter._conversion_plans))
+
+            # failure case: errors of the params converted by the plan are same as the others
+            params = [{"name": "_to", "type": "Address", "value": 10},
+                      {"name": "_values", "type": "[]int", "value": ["0x1", None]}]
+            self.assertEqual(([], ["_to: type and value's actual type are not match.",
+                                   "_values[1]: type and value's actual type are not match."]),
+                             type_converter.validate_params(params))
+
+            # failure case: malformed params don't have a plan, and are reported as usual
+            params = [{"name": "_to", "type": "Address"}, {"name": "_values", "type": "[]int", "value": []}]
+            self.assertEqual(([("_values", "[]int", [])], ["_to: param should have name, type and value"]),
+                             type_converter.validate_params(params))
+            params = [{"name": 1, "type": "int", "value": "0x1"}]
+            self.assertEqual(([], ["[0]: name should be a string"]), type_converter.validate_params(params))
+            self.assertEqual(1, len(type_converter._conversion_plans))
+
+            # success case: the number of the plans is bounded
+            for idx in range(type_converter.MAX_CONVERSION_PLAN_COUNT + 10):
+                params = [{"name": f"_value{idx}", "type": "int", "value": hex(idx)}]
+                self.assertEqual([(f"_value{idx}", "int", idx)], type_converter.convert_params(params))
+            self.assertEqual(type_converter.MAX_CONVERSION_PLAN_COUNT, len(type_converter._conversion_plans))